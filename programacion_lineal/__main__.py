@@ -0,0 +1,21 @@
+"""
+Punto de entrada del paquete
+
+    python -m programacion_lineal resolver problema.json
+    python -m programacion_lineal menu
+
+Ver interfaz/cli.py para los comandos disponibles.
+"""
+
+import os
+import sys
+import time
+
+INICIO = time.perf_counter()
+
+# Los módulos del proyecto se importan como paquetes de primer nivel (metodos, utils, ...)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from interfaz.cli import principal  # noqa: E402
+
+sys.exit(principal(inicio=INICIO))
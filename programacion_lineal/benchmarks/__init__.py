@@ -0,0 +1,2 @@
+from .familias import FAMILIAS
+from .suite import cargar, comparar, ejecutar, guardar, medir
@@ -0,0 +1,73 @@
+"""
+Correr la suite de medición desde el directorio del proyecto
+
+    python -m benchmarks --tamanos 10 30 100 300 --salida resultados.json
+    python -m benchmarks --familias densa transporte --base base.json
+
+Con --base se comparan los resultados con una corrida guardada y el
+código de salida es 1 si hay regresiones o cambios de estado.
+"""
+
+import argparse
+import sys
+
+from .familias import FAMILIAS
+from .suite import (MAX_CELDAS, METODOS, REPETICIONES, TAMANOS, TIEMPO_MAXIMO,
+                    cargar, comparar, ejecutar, guardar)
+
+
+def formato_registro(registro):
+    texto = f"{registro['familia']:<11} {registro['filas']:>6} x {registro['columnas']:<8} {registro['metodo']:<20}"
+    if registro['estado'] == 'omitido':
+        return f"{texto} omitido ({registro['motivo']})"
+    texto += f" {registro['estado']:<15} {registro['tiempo']:9.4f} s"
+    if registro['pivoteos']:
+        texto += f" {registro['pivoteos']:>6} piv {registro['tiempo_por_pivoteo'] * 1e3:9.3f} ms/piv"
+    if registro['memoria_pico'] is not None:
+        texto += f" {registro['memoria_pico'] / 2 ** 20:8.1f} MiB"
+    return texto
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Medir los métodos sobre familias de problemas")
+    parser.add_argument('--familias', nargs='+', choices=list(FAMILIAS), default=list(FAMILIAS))
+    parser.add_argument('--tamanos', nargs='+', type=int, default=list(TAMANOS), help="Filas")
+    parser.add_argument('--metodos', nargs='+', default=list(METODOS))
+    parser.add_argument('--tiempo-maximo', type=float, default=TIEMPO_MAXIMO,
+                        help="Segundos por corrida; al superarlo no se prueban tamaños mayores")
+    parser.add_argument('--max-celdas', type=float, default=MAX_CELDAS)
+    parser.add_argument('--repeticiones', type=int, default=REPETICIONES)
+    parser.add_argument('--sin-memoria', action='store_true', help="No medir el pico de memoria")
+    parser.add_argument('--semilla', type=int, default=0)
+    parser.add_argument('--salida', default=None, help="Guardar los resultados en este JSON")
+    parser.add_argument('--base', default=None, help="JSON de una corrida anterior para comparar")
+    parser.add_argument('--umbral', type=float, default=0.25,
+                        help="Cambio relativo de tiempo que cuenta como regresión")
+    args = parser.parse_args()
+
+    registros = ejecutar(args.familias, args.tamanos, args.metodos, args.tiempo_maximo,
+                         args.max_celdas, not args.sin_memoria, args.repeticiones, args.semilla,
+                         informar=lambda registro: print(formato_registro(registro), flush=True))
+    if args.salida:
+        guardar(registros, args.salida)
+        print(f"\n💾 Resultados guardados en {args.salida}")
+
+    if args.base:
+        diferencias = comparar(registros, cargar(args.base), args.umbral)
+        print(f"\n📊 Comparación con {args.base}:")
+        if not diferencias:
+            print("   Sin cambios fuera del umbral")
+        for diferencia in diferencias:
+            texto = f"   {diferencia['tipo']:<9} {diferencia['familia']} {diferencia['filas']} {diferencia['metodo']}"
+            if diferencia['tipo'] == 'estado':
+                texto += f": {diferencia['estado_base']} -> {diferencia['estado']}"
+            else:
+                texto += f": {diferencia['tiempo_base']:.4f} s -> {diferencia['tiempo']:.4f} s (x{diferencia['razon']:.2f})"
+            print(texto)
+        if any(diferencia['tipo'] != 'mejora' for diferencia in diferencias):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
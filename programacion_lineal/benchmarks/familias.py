@@ -0,0 +1,107 @@
+"""
+Familias de problemas para medir los métodos a distintos tamaños
+
+Cada familia recibe el número de filas `m` y una semilla y devuelve
+(c, A, b, tipos, tipo_objetivo) con listas de Python, el mismo formato de
+ProblemasTest. Todas tienen óptimo finito: los coeficientes se arman con
+numpy de una vez y solo al final se pasan a listas.
+"""
+
+import numpy as np
+
+
+def densa(m, semilla=0):
+    """m filas <=, m columnas, todos los coeficientes no nulos (maximizar)"""
+    generador = np.random.default_rng(semilla)
+    A = generador.uniform(1, 10, (m, m)).round(2)
+    b = generador.uniform(50, 100, m).round(2)
+    c = generador.uniform(1, 10, m).round(2)
+    return c.tolist(), A.tolist(), b.tolist(), ['<='] * m, 'max'
+
+
+def dispersa(m, semilla=0, por_fila=5):
+    """m filas <=, 2m columnas, unos `por_fila` no nulos por fila (maximizar)"""
+    generador = np.random.default_rng(semilla)
+    n = 2 * m
+    A = np.zeros((m, n))
+    columnas = generador.integers(0, n, (m, min(por_fila, n)))
+    np.put_along_axis(A, columnas, generador.uniform(1, 10, columnas.shape).round(2), axis=1)
+    # Cada columna necesita al menos un coeficiente positivo para que el óptimo sea finito
+    vacias = np.flatnonzero(~A.any(axis=0))
+    A[generador.integers(0, m, len(vacias)), vacias] = generador.uniform(1, 10, len(vacias)).round(2)
+    b = generador.uniform(50, 100, m).round(2)
+    c = generador.uniform(1, 10, n).round(2)
+    return c.tolist(), A.tolist(), b.tolist(), ['<='] * m, 'max'
+
+
+def transporte(m, semilla=0):
+    """
+    Transporte con m // 2 orígenes (oferta, <=) y el resto destinos
+    (demanda, >=), una variable por par origen-destino (minimizar)
+    """
+    generador = np.random.default_rng(semilla)
+    origenes = max(1, m // 2)
+    destinos = max(1, m - origenes)
+    n = origenes * destinos
+    demanda = generador.integers(10, 50, destinos).astype(float)
+    oferta = generador.integers(10, 50, origenes).astype(float)
+    # Oferta total mayor que la demanda total
+    oferta *= 1.2 * demanda.sum() / oferta.sum()
+    A = np.zeros((origenes + destinos, n))
+    columnas = np.arange(n)
+    A[columnas // destinos, columnas] = 1.0
+    A[origenes + columnas % destinos, columnas] = 1.0
+    c = generador.uniform(1, 20, n).round(2)
+    b = np.concatenate([oferta.round(2), demanda])
+    tipos = ['<='] * origenes + ['>='] * destinos
+    return c.tolist(), A.tolist(), b.tolist(), tipos, 'min'
+
+
+def degenerada(m, semilla=0):
+    """
+    m - 1 filas que pasan por el origen (lado derecho 0) más una fila que
+    acota la suma: el vértice inicial es degenerado en casi todas las filas
+    """
+    generador = np.random.default_rng(semilla)
+    n = m
+    A = generador.integers(-5, 6, (m - 1, n)).astype(float)
+    A = np.vstack([A, np.ones(n)])
+    b = np.zeros(m)
+    b[-1] = float(m)
+    c = generador.uniform(1, 10, n).round(2)
+    return c.tolist(), A.tolist(), b.tolist(), ['<='] * m, 'max'
+
+
+def igualdades(m, semilla=0, proporcion=0.8):
+    """
+    Casi todas las filas '=' (las demás <=), 2m columnas, factible por
+    construcción a partir de un punto positivo (minimizar con costos > 0)
+    """
+    generador = np.random.default_rng(semilla)
+    n = 2 * m
+    A = generador.uniform(0, 10, (m, n)).round(2)
+    punto = generador.uniform(1, 5, n)
+    b = A @ punto
+    iguales = max(1, int(round(proporcion * m)))
+    b[iguales:] += generador.uniform(1, 10, m - iguales)
+    c = generador.uniform(1, 10, n).round(2)
+    tipos = ['='] * iguales + ['<='] * (m - iguales)
+    return c.tolist(), A.tolist(), b.round(6).tolist(), tipos, 'min'
+
+
+FAMILIAS = {
+    'densa': densa,
+    'dispersa': dispersa,
+    'transporte': transporte,
+    'degenerada': degenerada,
+    'igualdades': igualdades,
+}
+
+# Columnas de cada familia según las filas, para descartar tamaños sin generarlos
+COLUMNAS = {
+    'densa': lambda m: m,
+    'dispersa': lambda m: 2 * m,
+    'transporte': lambda m: max(1, m // 2) * max(1, m - m // 2),
+    'degenerada': lambda m: m,
+    'igualdades': lambda m: 2 * m,
+}
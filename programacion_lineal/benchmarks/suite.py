@@ -0,0 +1,177 @@
+"""
+Medición de los métodos sobre familias de problemas de tamaño creciente
+
+Para cada familia, tamaño y método se registra el tiempo (el mejor de
+varias repeticiones si la corrida es corta), los pivoteos (eventos de
+iter_resolver), el tiempo por pivoteo, las estadísticas del método
+('stats': tiempo por etapa, pivoteos degenerados, magnitud de los
+pivotes) y el pico de memoria medido con tracemalloc en una corrida
+aparte, para que el rastreo no infle los tiempos. Los resultados se guardan en JSON y se comparan con una base
+guardada para detectar regresiones.
+
+Un método que agota el tiempo máximo en un tamaño no se corre en los
+tamaños mayores de esa familia, y los tamaños cuyo tableau superaría
+`max_celdas` se omiten sin generar el problema.
+"""
+
+import json
+import platform
+import time
+import tracemalloc
+
+from metodos.asincrono import resolver_cooperativo
+
+from .familias import COLUMNAS, FAMILIAS
+
+METODOS = ('SimplexTradicional', 'GranMSimplex', 'DosFasesSimplex')
+TAMANOS = (10, 30, 100, 300, 1000, 3000, 10000)
+TIEMPO_MAXIMO = 30.0       # Segundos por corrida antes de dejar de escalar
+MAX_CELDAS = 5_000_000     # Celdas del tableau (listas de Python) que se intentan
+REPETICIONES = 3           # Para corridas de menos de un segundo
+
+
+def medir(metodo, problema, tiempo_limite=None, memoria=True, repeticiones=REPETICIONES):
+    """
+    Resolver un problema con un método y medirlo
+
+    Returns:
+        dict: 'estado', 'tiempo', 'pivoteos', 'tiempo_por_pivoteo',
+              'memoria_pico' (bytes, None sin memoria), 'valor_optimo' y
+              'stats' de la corrida más rápida
+    """
+    m, n = len(problema[2]), len(problema[0])
+    opciones = {'max_iteraciones': 50 * (m + n)}
+
+    mejor = None
+    for _ in range(max(1, repeticiones)):
+        resultado = resolver_cooperativo(metodo, *problema, opciones, tiempo_limite)
+        if mejor is None or resultado['tiempo'] < mejor['tiempo']:
+            mejor = resultado
+        if resultado['tiempo'] > 1.0 or resultado['estado'] == 'tiempo_agotado':
+            break
+
+    pico = None
+    if memoria and mejor['estado'] != 'tiempo_agotado':
+        tracemalloc.start()
+        try:
+            resolver_cooperativo(metodo, *problema, opciones, tiempo_limite)
+            pico = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    pivoteos = mejor['iteraciones']
+    return {
+        'estado': mejor['estado'],
+        'tiempo': mejor['tiempo'],
+        'pivoteos': pivoteos,
+        'tiempo_por_pivoteo': mejor['tiempo'] / pivoteos if pivoteos else None,
+        'memoria_pico': pico,
+        'valor_optimo': mejor['valor_optimo'],
+        'stats': mejor['stats']
+    }
+
+
+def ejecutar(familias=None, tamanos=TAMANOS, metodos=METODOS, tiempo_maximo=TIEMPO_MAXIMO,
+             max_celdas=MAX_CELDAS, memoria=True, repeticiones=REPETICIONES, semilla=0, informar=None):
+    """
+    Recorrer familias x tamaños x métodos
+
+    Args:
+        informar: Función que recibe cada registro apenas se mide (progreso)
+
+    Returns:
+        list: Un registro por combinación, con 'familia', 'filas',
+              'columnas', 'no_nulos', 'metodo' y lo que devuelve `medir`
+              (estado 'omitido' y 'motivo' para las que no se corrieron)
+    """
+    registros = []
+    for familia in familias or list(FAMILIAS):
+        agotados = set()
+        for m in sorted(tamanos):
+            n = COLUMNAS[familia](m)
+            # Holguras y artificiales: a lo sumo dos columnas más por fila
+            celdas = (m + 1) * (n + 2 * m + 1)
+            problema = None
+            for metodo in metodos:
+                registro = {'familia': familia, 'filas': m, 'columnas': n, 'metodo': metodo}
+                if celdas > max_celdas:
+                    registro.update(estado='omitido', motivo=f"{celdas:.1e} celdas")
+                elif metodo in agotados:
+                    registro.update(estado='omitido', motivo="agotó el tiempo en un tamaño menor")
+                else:
+                    if problema is None:
+                        problema = FAMILIAS[familia](m, semilla)
+                    registro['no_nulos'] = sum(1 for fila in problema[1] for valor in fila if valor != 0)
+                    registro.update(medir(metodo, problema, tiempo_maximo, memoria, repeticiones))
+                    if registro['estado'] == 'tiempo_agotado' or registro['tiempo'] > tiempo_maximo:
+                        agotados.add(metodo)
+                registros.append(registro)
+                if informar is not None:
+                    informar(registro)
+    return registros
+
+
+def guardar(registros, ruta):
+    """Guardar los resultados en JSON con datos del equipo"""
+    import numpy
+
+    datos = {
+        'fecha': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'plataforma': {
+            'python': platform.python_version(),
+            'numpy': numpy.__version__,
+            'sistema': platform.platform(),
+            'procesador': platform.processor() or platform.machine()
+        },
+        'resultados': registros
+    }
+    with open(ruta, 'w', encoding='utf-8') as archivo:
+        json.dump(datos, archivo, ensure_ascii=False, indent=1)
+
+
+def cargar(ruta):
+    """Resultados guardados con `guardar`"""
+    with open(ruta, encoding='utf-8') as archivo:
+        return json.load(archivo)['resultados']
+
+
+def comparar(actuales, base, umbral=0.25, tiempo_minimo=0.01):
+    """
+    Comparar resultados con una base
+
+    Args:
+        umbral: Cambio relativo de tiempo que se informa (0.25 = 25%)
+        tiempo_minimo: Segundos por debajo de los cuales no se comparan
+                       tiempos (el ruido domina)
+
+    Returns:
+        list: Diferencias con 'familia', 'filas', 'metodo', 'tipo'
+              ('regresion', 'mejora' o 'estado'), 'tiempo', 'tiempo_base'
+              y 'razon' (tiempo / tiempo_base)
+    """
+    def clave(registro):
+        return registro['familia'], registro['filas'], registro['metodo']
+
+    anteriores = {clave(registro): registro for registro in base}
+    diferencias = []
+    for registro in actuales:
+        anterior = anteriores.get(clave(registro))
+        if anterior is None or 'omitido' in (registro['estado'], anterior['estado']):
+            continue
+        diferencia = {
+            'familia': registro['familia'],
+            'filas': registro['filas'],
+            'metodo': registro['metodo'],
+            'tiempo': registro['tiempo'],
+            'tiempo_base': anterior['tiempo'],
+            'razon': registro['tiempo'] / anterior['tiempo'] if anterior['tiempo'] else None
+        }
+        if registro['estado'] != anterior['estado']:
+            diferencias.append(dict(diferencia, tipo='estado',
+                                    estado=registro['estado'], estado_base=anterior['estado']))
+        elif max(registro['tiempo'], anterior['tiempo']) >= tiempo_minimo and diferencia['razon']:
+            if diferencia['razon'] > 1 + umbral:
+                diferencias.append(dict(diferencia, tipo='regresion'))
+            elif diferencia['razon'] < 1 / (1 + umbral):
+                diferencias.append(dict(diferencia, tipo='mejora'))
+    return diferencias
@@ -0,0 +1,199 @@
+"""
+Generador de problemas aleatorios con resultado conocido de antemano
+
+    instancia = generar(50, 80, 'optimo', densidad=0.2, semilla=1)
+    c, A, b, tipos, tipo_objetivo = instancia['problema']
+    instancia['valor_optimo'], instancia['solucion']
+
+    for instancia in lote(1000, 20, 30, 'infactible', semilla=7):
+        ...
+
+El problema se arma al revés, desde su certificado, con operaciones de
+numpy sobre la matriz completa:
+
+- 'optimo': se eligen x* >= 0 y multiplicadores y con los signos de cada
+  fila; las filas con y != 0 quedan activas en x*, las demás con holgura,
+  y c = A^T y - d con d > 0 fuera del soporte de x*. Se cumplen las
+  condiciones de optimalidad con complementariedad estricta, así que x*
+  es el único óptimo y su valor es y·b.
+- 'degenerado': igual, pero una fracción de las filas con y = 0 también
+  queda activa en x* (holgura cero).
+- 'multiple': igual, con d_j = 0 en una variable fuera del soporte: el
+  óptimo no es único (x* es uno de ellos).
+- 'infactible': y con los signos de cada fila tal que y^T A >= 0 e
+  y·b < 0 (certificado de Farkas en 'certificado').
+- 'ilimitado': un punto factible y una dirección d >= 0 que respeta las
+  filas (A d <= 0 en las <=, >= 0 en las >=, = 0 en las =) con c·d > 0
+  (en 'rayo').
+
+Cada instancia es un dict con 'problema' (la tupla de ProblemasTest),
+'resultado', 'solucion', 'valor_optimo' y, según el caso, 'certificado'
+o 'rayo'.
+"""
+
+import numpy as np
+
+RESULTADOS = ('optimo', 'degenerado', 'multiple', 'infactible', 'ilimitado')
+MEZCLA = {'<=': 1.0}
+
+
+def generar(m, n, resultado='optimo', densidad=1.0, rango=(1, 10), mezcla=None,
+            tipo_objetivo='max', degeneracion=0.5, semilla=None):
+    """
+    Generar un problema con el resultado pedido
+
+    Args:
+        m, n: Filas y columnas
+        resultado: Uno de RESULTADOS
+        densidad: Proporción de coeficientes no nulos en A
+        rango: (mínimo, máximo) del valor absoluto de los coeficientes de A
+               (la fila que cierra un certificado puede salirse del rango)
+        mezcla: Proporción de cada tipo de fila, p. ej.
+                {'<=': 0.6, '>=': 0.3, '=': 0.1}; por defecto todas <=
+        degeneracion: En 'degenerado', fracción de las filas inactivas que
+                      quedan con holgura cero
+        semilla: Semilla o np.random.Generator
+
+    Returns:
+        dict: 'problema', 'resultado', 'solucion', 'valor_optimo' y
+              'certificado' o 'rayo' según el caso
+
+    Raises:
+        ValueError: Si los parámetros no permiten el resultado pedido
+    """
+    if resultado not in RESULTADOS:
+        raise ValueError(f"Resultado desconocido: {resultado} (use uno de {', '.join(RESULTADOS)})")
+    if tipo_objetivo not in ('max', 'min'):
+        raise ValueError(f"Tipo de objetivo desconocido: {tipo_objetivo}")
+    generador = np.random.default_rng(semilla)
+
+    tipos = tipos_filas(generador, m, mezcla or MEZCLA)
+    A = matriz(generador, m, n, densidad, rango)
+
+    if resultado == 'infactible':
+        c, b, certificado = infactible(generador, A, tipos, rango)
+        instancia = {'solucion': None, 'valor_optimo': None, 'certificado': certificado.tolist()}
+    elif resultado == 'ilimitado':
+        c, b, rayo = ilimitado(generador, A, tipos, rango)
+        instancia = {'solucion': None, 'valor_optimo': None, 'rayo': rayo.tolist()}
+    else:
+        c, b, solucion, valor = optimo(generador, A, tipos, rango, resultado, degeneracion)
+        instancia = {'solucion': solucion.tolist(), 'valor_optimo': valor}
+
+    # Se construye como máximo; min c·x es max -c·x
+    if tipo_objetivo == 'min':
+        c = -c
+        if instancia['valor_optimo'] is not None:
+            instancia['valor_optimo'] = -instancia['valor_optimo']
+
+    instancia['problema'] = (c.tolist(), A.tolist(), b.tolist(), tipos.tolist(), tipo_objetivo)
+    instancia['resultado'] = resultado
+    return instancia
+
+
+def lote(cantidad, m, n, resultado='optimo', semilla=0, **opciones):
+    """`cantidad` instancias independientes y reproducibles (mismos argumentos que generar)"""
+    for secuencia in np.random.SeedSequence(semilla).spawn(cantidad):
+        yield generar(m, n, resultado, semilla=np.random.default_rng(secuencia), **opciones)
+
+
+def tipos_filas(generador, m, mezcla):
+    tipos = np.array(list(mezcla))
+    proporciones = np.array([mezcla[tipo] for tipo in tipos], dtype=float)
+    return generador.choice(tipos, size=m, p=proporciones / proporciones.sum())
+
+
+def matriz(generador, m, n, densidad, rango):
+    """Coeficientes redondeados a dos decimales, con `densidad` de no nulos"""
+    A = generador.uniform(rango[0], rango[1], (m, n)).round(2)
+    if densidad < 1:
+        A *= generador.random((m, n)) < densidad
+    return A
+
+
+def signos_filas(tipos):
+    """Signo de los multiplicadores de cada fila en un problema de máximo"""
+    return np.where(tipos == '<=', 1.0, np.where(tipos == '>=', -1.0, 0.0))
+
+
+def optimo(generador, A, tipos, rango, resultado, degeneracion):
+    m, n = A.shape
+    iguales = np.flatnonzero(tipos == '=')
+    desiguales = np.flatnonzero(tipos != '=')
+
+    # Filas activas con multiplicador no nulo, tantas como variables positivas
+    activas_max = min(m, n - 1 if resultado == 'multiple' else n)
+    if len(iguales) > activas_max:
+        raise ValueError(f"{len(iguales)} filas '=' no caben en un vértice con {n} variables"
+                         + (" y una variable libre para óptimos múltiples" if resultado == 'multiple' else ""))
+    extra = generador.choice(desiguales, size=activas_max - len(iguales), replace=False)
+    activas = np.concatenate([iguales, extra]).astype(int)
+    k = len(activas)
+    soporte = generador.choice(n, size=k, replace=False)
+
+    # Diagonal no nula para que la base A[activas, soporte] sea invertible
+    A[activas, soporte] = generador.uniform(rango[0], rango[1], k).round(2)
+
+    x = np.zeros(n)
+    x[soporte] = generador.uniform(1, 10, k).round(2)
+
+    y = np.zeros(m)
+    signos = signos_filas(tipos[activas])
+    signos[signos == 0] = generador.choice([-1.0, 1.0], size=int(np.sum(signos == 0)))
+    y[activas] = signos * generador.uniform(1, 5, k).round(2)
+
+    holgura = generador.uniform(1, 10, m).round(2)
+    holgura[activas] = 0.0
+    if resultado == 'degenerado':
+        inactivas = np.setdiff1d(np.arange(m), activas)
+        holgura[generador.choice(inactivas, size=int(round(degeneracion * len(inactivas))), replace=False)] = 0.0
+    b = A @ x + np.where(tipos == '>=', -holgura, holgura)
+
+    costos_reducidos = generador.uniform(1, 5, n).round(2)
+    costos_reducidos[soporte] = 0.0
+    if resultado == 'multiple':
+        costos_reducidos[generador.choice(np.setdiff1d(np.arange(n), soporte))] = 0.0
+    c = A.T @ y - costos_reducidos
+    return c, b, x, float(y @ b)
+
+
+def infactible(generador, A, tipos, rango):
+    """Farkas: y con signos válidos, y^T A = v >= 0 e y·b < 0"""
+    m, n = A.shape
+    y = signos_filas(tipos) * generador.uniform(1, 5, m).round(2)
+    iguales = np.flatnonzero(tipos == '=')
+    y[iguales] = generador.choice([-1.0, 1.0], size=len(iguales)) * generador.uniform(1, 5, len(iguales)).round(2)
+
+    # La fila r cierra el certificado
+    r = generador.integers(m)
+    v = generador.uniform(0, rango[1], n).round(2)
+    resto = np.arange(m) != r
+    A[r] = (v - y[resto] @ A[resto]) / y[r]
+
+    b = A @ generador.uniform(1, 10, n).round(2)
+    b[r] = (-generador.uniform(1, 10) - y[resto] @ b[resto]) / y[r]
+    c = generador.uniform(1, 10, n).round(2)
+    return c, b, y
+
+
+def ilimitado(generador, A, tipos, rango):
+    """Un punto factible más una dirección que respeta las filas y mejora el objetivo"""
+    m, n = A.shape
+    soporte = generador.choice(n, size=min(n, max(1, n // 4)), replace=False)
+    rayo = np.zeros(n)
+    rayo[soporte] = generador.uniform(1, 5, len(soporte)).round(2)
+
+    # Una columna del soporte fija A·rayo = w con el signo que pide cada fila
+    t = soporte[0]
+    w = -signos_filas(tipos) * generador.uniform(0, rango[1], m).round(2)
+    otras = np.arange(n) != t
+    A[:, t] = (w - A[:, otras] @ rayo[otras]) / rayo[t]
+
+    punto = generador.uniform(1, 10, n).round(2)
+    holgura = generador.uniform(1, 10, m).round(2)
+    holgura[tipos == '='] = 0.0
+    b = A @ punto + np.where(tipos == '>=', -holgura, holgura)
+
+    c = generador.uniform(-10, 10, n).round(2)
+    c[t] += max(0.0, 1.0 - c @ rayo) / rayo[t]
+    return c, b, rayo
@@ -113,7 +113,7 @@ class ProblemasTest:
             2x1 + x2 >= 6   # >= requiere variable artificial
             x1, x2 >= 0
         
-        Solución esperada: x1 = 2, x2 = 2, Z = 10
+        Solución esperada: x1 = 4, x2 = 0, Z = 8
         """
         print("📋 PROBLEMA 3: Método Dos Fases")
         print("Minimizar Z = 2x1 + 3x2")
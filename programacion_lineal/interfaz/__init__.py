@@ -1,2 +1,9 @@
 # interfaz/__init__.py
-from .streamlit_app import StreamlitApp
\ No newline at end of file
+# StreamlitApp se importa al pedirla: el servidor HTTP no necesita streamlit
+
+
+def __getattr__(nombre):
+    if nombre == 'StreamlitApp':
+        from .streamlit_app import StreamlitApp
+        return StreamlitApp
+    raise AttributeError(f"module {__name__!r} has no attribute {nombre!r}")
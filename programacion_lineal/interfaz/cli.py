@@ -0,0 +1,196 @@
+"""
+Línea de comandos no interactiva
+
+    python -m programacion_lineal resolver problema.json
+    python -m programacion_lineal resolver modelos/*.json --metodo auto --trabajos 8 \\
+        --tiempo-limite 30 --salida resultados.jsonl
+    python -m programacion_lineal solve models/ --method auto --jobs 8 --time-limit 30 --out results.jsonl
+    cat problema.json | python -m programacion_lineal resolver -
+    python -m programacion_lineal menu
+
+`resolver` (alias `solve`) lee problemas en JSON (formato de
+utils.problema_json), MPS o LP; un directorio equivale a todos sus
+archivos con esas extensiones. Con varios trabajadores los archivos se
+leen y resuelven en un pool de procesos. Se escribe un registro JSON por
+línea, en el orden de los argumentos, apenas está listo:
+
+    {"archivo": ..., "estado": "optimo", "valor_optimo": ..., "solucion": [...],
+     "metodo_usado": ..., "iteraciones": ..., "tiempos": {"lectura": ..., "resolucion": ...}}
+
+Los problemas infactibles o ilimitados traen además la prueba en
+"certificado", o en "rayo" y "punto" (ver metodos.certificados; null si
+el método no la da).
+
+Un archivo que no se puede leer produce {"archivo": ..., "estado": "error",
+"error": ...} y el código de salida es 1. El tiempo límite es
+cooperativo: los métodos con iter_resolver terminan con estado
+'tiempo_agotado'; los demás no pueden detenerse a mitad de camino.
+
+Cada comando importa solo lo que usa: ni sympy, ni pandas, ni bibliotecas
+de gráficos. Con --tiempos se informa en stderr cuánto tardaron la
+primera respuesta (importación, lectura y resolución desde que arrancó el
+punto de entrada) y el total.
+"""
+
+import argparse
+import glob
+import json
+import os
+import sys
+import time
+
+EXTENSIONES = ('.json', '.mps', '.lp', '.mps.gz', '.lp.gz')
+
+
+def crear_parser():
+    parser = argparse.ArgumentParser(prog='programacion_lineal',
+                                     description="Suite de programación lineal")
+    comandos = parser.add_subparsers(dest='comando')
+
+    resolver = comandos.add_parser('resolver', aliases=['solve'],
+                                   help="Resolver problemas y escribir un resultado JSON por línea")
+    resolver.add_argument('archivos', nargs='+',
+                          help="Problemas .json, .mps o .lp (también .gz), directorios o patrones; "
+                               "'-' lee JSON de stdin")
+    resolver.add_argument('--metodo', '--method', default=None,
+                          help="Nombre del método o 'auto' (por defecto, el del archivo o el selector)")
+    resolver.add_argument('--trabajos', '--jobs', '-j', type=int, default=1,
+                          help="Procesos en paralelo (0: uno por núcleo)")
+    resolver.add_argument('--tiempo-limite', '--time-limit', type=float, default=None,
+                          help="Segundos por problema; los métodos con iter_resolver se detienen al alcanzarlo")
+    resolver.add_argument('--salida', '--out', '-o', default=None,
+                          help="Archivo JSONL de resultados (por defecto, stdout)")
+    resolver.add_argument('--tiempos', action='store_true',
+                          help="Informar en stderr el tiempo hasta el primer resultado y el total")
+
+    comandos.add_parser('menu', help="Menú interactivo de consola")
+    return parser
+
+
+def principal(argumentos=None, inicio=None):
+    """Ejecutar un comando; devuelve el código de salida"""
+    inicio = time.perf_counter() if inicio is None else inicio
+    parser = crear_parser()
+    args = parser.parse_args(argumentos)
+
+    if args.comando in ('resolver', 'solve'):
+        return comando_resolver(args, inicio)
+    if args.comando == 'menu':
+        from main import main
+        main()
+        return 0
+    parser.print_help()
+    return 2
+
+
+def expandir_archivos(argumentos):
+    """Rutas a resolver: directorios y patrones se expanden en orden alfabético"""
+    rutas = []
+    for argumento in argumentos:
+        if os.path.isdir(argumento):
+            rutas.extend(sorted(os.path.join(argumento, nombre) for nombre in os.listdir(argumento)
+                                if nombre.lower().endswith(EXTENSIONES)))
+        elif argumento != '-' and not os.path.exists(argumento) and glob.has_magic(argumento):
+            # Patrón que la consola no expandió (p. ej. en Windows)
+            rutas.extend(sorted(glob.glob(argumento)))
+        else:
+            rutas.append(argumento)
+    return rutas
+
+
+def resolver_archivo(ruta, metodo=None, tiempo_limite=None, datos=None):
+    """
+    Leer y resolver un problema; nunca lanza excepciones
+
+    Args:
+        ruta: Archivo del problema (o '-' con los datos JSON en `datos`)
+        metodo: Método a usar, 'auto' o None (el del archivo, o el selector)
+        tiempo_limite: Segundos para la resolución; None usa el del archivo
+
+    Returns:
+        dict: Registro de salida (ver el docstring del módulo)
+    """
+    from metodos.asincrono import resolver_problema
+    from metodos.seleccion import SOLVERS
+    from utils.problema_json import leer_problema, problema_desde_json, resultado_a_json
+
+    inicio = time.perf_counter()
+    try:
+        problema = problema_desde_json(datos) if ruta == '-' else leer_problema(ruta)
+        if metodo is not None:
+            problema['metodo'] = None if metodo == 'auto' else metodo
+        if problema['metodo'] is not None and problema['metodo'] not in SOLVERS:
+            raise ValueError(f"Método desconocido: {problema['metodo']} (disponibles: {', '.join(SOLVERS)})")
+    except (OSError, ValueError) as e:
+        return {'archivo': ruta, 'estado': 'error', 'error': str(e)}
+    except Exception as e:
+        # Un archivo malformado no debe cortar el lote
+        return {'archivo': ruta, 'estado': 'error', 'error': f"{type(e).__name__}: {e}"}
+
+    leido = time.perf_counter()
+    try:
+        resultado = resolver_problema(problema, tiempo_limite if tiempo_limite is not None
+                                      else problema['tiempo_limite'])
+    except Exception as e:
+        return {'archivo': ruta, 'estado': 'error', 'error': f"{type(e).__name__}: {e}"}
+
+    registro = {'archivo': ruta}
+    registro.update(resultado_a_json(resultado))
+    del registro['tiempo']
+    if problema.get('variables'):
+        registro['variables'] = problema['variables']
+    registro['tiempos'] = {'lectura': leido - inicio, 'resolucion': resultado['tiempo']}
+    return registro
+
+
+def comando_resolver(args, inicio):
+    rutas = expandir_archivos(args.archivos)
+    if not rutas:
+        print("❌ No hay problemas para resolver", file=sys.stderr)
+        return 1
+    datos = None
+    if '-' in rutas:
+        try:
+            datos = json.load(sys.stdin)
+        except ValueError as e:
+            print(f"❌ -: JSON inválido: {e}", file=sys.stderr)
+            return 1
+
+    salida = open(args.salida, 'w', encoding='utf-8') if args.salida else sys.stdout
+    trabajos = args.trabajos or os.cpu_count() or 1
+    ejecutor = None
+    primero = None
+    errores = 0
+    try:
+        if trabajos == 1 or len(rutas) <= 1:
+            registros = (resolver_archivo(ruta, args.metodo, args.tiempo_limite, datos) for ruta in rutas)
+        else:
+            from concurrent.futures import ProcessPoolExecutor
+
+            ejecutor = ProcessPoolExecutor(max_workers=min(trabajos, len(rutas)))
+            futuros = [ejecutor.submit(resolver_archivo, ruta, args.metodo, args.tiempo_limite, datos)
+                       for ruta in rutas]
+            registros = (futuro.result() for futuro in futuros)
+
+        for registro in registros:
+            if primero is None:
+                primero = time.perf_counter()
+            errores += registro['estado'] == 'error'
+            salida.write(json.dumps(registro, ensure_ascii=False) + '\n')
+            salida.flush()
+    finally:
+        if ejecutor is not None:
+            ejecutor.shutdown(cancel_futures=True)
+        if salida is not sys.stdout:
+            salida.close()
+
+    if args.tiempos:
+        fin = time.perf_counter()
+        tiempos = {
+            'problemas': len(rutas),
+            'errores': errores,
+            'primer_resultado': (primero or fin) - inicio,
+            'total': fin - inicio
+        }
+        print(json.dumps(tiempos), file=sys.stderr)
+    return 1 if errores else 0
@@ -0,0 +1,285 @@
+"""
+Servicio HTTP/JSON para resolver problemas desde otros programas
+
+Un pool de procesos se crea y se calienta al arrancar, de modo que cada
+solicitud paga solo la resolución y no el arranque de Python ni la
+importación de numpy. Delante del pool hay una cola acotada: como máximo
+`trabajadores` resoluciones en curso y `max_en_cola` esperando turno; con
+la cola llena se responde 503 de inmediato.
+
+Rutas:
+    POST /solve         Un problema (formato en utils.problema_json)
+    POST /solve/batch   {"problemas": [...]} o una lista de problemas
+    GET  /health        Estado del servicio
+    GET  /metrics       Contadores y tiempos acumulados
+
+Cada problema puede traer 'tiempo_limite': cuenta desde que llega la
+solicitud, incluye la espera en cola y los métodos con iter_resolver se
+detienen al alcanzarlo (estado 'tiempo_agotado'). Si un método sin
+iteración cooperativa no termina a tiempo se responde 504.
+"""
+
+import json
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import TimeoutError as TiempoAgotado
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from metodos.asincrono import GRACIA, resolver_problema
+from metodos.seleccion import SOLVERS
+from utils.problema_json import problema_desde_json, resultado_a_json
+
+MAX_CUERPO = 64 * 1024 * 1024  # Bytes aceptados por solicitud
+
+
+class ColaLlena(RuntimeError):
+    """No hay lugar en la cola de resoluciones"""
+
+
+def calentar():
+    """Inicializador de los trabajadores: importar los métodos una sola vez"""
+    import metodos.seleccion  # noqa: F401
+
+
+class ServidorSolver:
+    def __init__(self, host='127.0.0.1', puerto=8000, trabajadores=None, max_en_cola=64):
+        self.host = host
+        self.puerto = puerto
+        self.trabajadores = trabajadores or os.cpu_count() or 1
+        self.max_en_cola = max_en_cola
+        self.cupos = threading.Semaphore(self.trabajadores)
+        self.candado = threading.Lock()
+        self.inicio = time.time()
+        self.metricas = {
+            'solicitudes': 0,
+            'problemas': 0,
+            'rechazados': 0,
+            'invalidos': 0,
+            'vencidos': 0,
+            'errores': 0,
+            'en_cola': 0,
+            'en_curso': 0,
+            'estados': {},
+            'segundos_resolviendo': 0.0
+        }
+        self.ejecutor = None
+        self.http = None
+
+    def iniciar(self):
+        """Crear y calentar el pool y abrir el puerto"""
+        self.ejecutor = ProcessPoolExecutor(max_workers=self.trabajadores, initializer=calentar)
+        for futuro in [self.ejecutor.submit(time.sleep, 0) for _ in range(self.trabajadores)]:
+            futuro.result()
+        self.http = ThreadingHTTPServer((self.host, self.puerto), ManejadorSolver)
+        self.http.daemon_threads = True
+        self.http.servidor = self
+        self.puerto = self.http.server_address[1]
+
+    def servir(self):
+        """Atender solicitudes hasta Ctrl+C o detener()"""
+        if self.http is None:
+            self.iniciar()
+        try:
+            self.http.serve_forever()
+        finally:
+            self.cerrar()
+
+    def detener(self):
+        """Detener serve_forever desde otro hilo"""
+        self.http.shutdown()
+
+    def cerrar(self):
+        """Liberar el puerto y el pool"""
+        if self.http is not None:
+            self.http.server_close()
+        if self.ejecutor is not None:
+            self.ejecutor.shutdown(cancel_futures=True)
+
+    def contar(self, clave, cantidad=1):
+        with self.candado:
+            self.metricas[clave] += cantidad
+
+    def enviar(self, problema, llegada):
+        """
+        Esperar un cupo del pool y enviar el problema
+
+        Returns:
+            Future: Con el resultado de resolver_problema
+
+        Raises:
+            ColaLlena: Si ya hay max_en_cola problemas esperando
+            TiempoAgotado: Si el plazo venció antes de conseguir cupo
+        """
+        with self.candado:
+            if self.metricas['en_cola'] >= self.max_en_cola:
+                self.metricas['rechazados'] += 1
+                raise ColaLlena(f"{self.metricas['en_cola']} problemas esperando turno")
+            self.metricas['en_cola'] += 1
+
+        tiempo_limite = problema['tiempo_limite']
+        try:
+            espera = None if tiempo_limite is None else max(0.0, tiempo_limite - (time.perf_counter() - llegada))
+            if not self.cupos.acquire(timeout=espera):
+                raise TiempoAgotado()
+        finally:
+            self.contar('en_cola', -1)
+
+        if tiempo_limite is not None:
+            tiempo_limite = max(0.0, tiempo_limite - (time.perf_counter() - llegada))
+        self.contar('en_curso')
+        try:
+            futuro = self.ejecutor.submit(resolver_problema, problema, tiempo_limite)
+        except BaseException:
+            self.liberar()
+            raise
+        # El cupo vuelve cuando el trabajador termina, aunque el cliente ya no espere
+        futuro.add_done_callback(lambda _: self.liberar())
+        return futuro
+
+    def liberar(self):
+        self.contar('en_curso', -1)
+        self.cupos.release()
+
+    def esperar(self, futuro, problema, llegada):
+        """Resultado JSON de un problema enviado, o el error correspondiente"""
+        espera = None
+        if problema['tiempo_limite'] is not None:
+            espera = max(0.0, problema['tiempo_limite'] - (time.perf_counter() - llegada)) + GRACIA
+        resultado = futuro.result(timeout=espera)
+        with self.candado:
+            estados = self.metricas['estados']
+            estados[resultado['estado']] = estados.get(resultado['estado'], 0) + 1
+            self.metricas['segundos_resolviendo'] += resultado['tiempo']
+        return resultado_a_json(resultado)
+
+    def validar(self, datos):
+        """Problema en el formato de los métodos; ValueError si no es válido"""
+        self.contar('problemas')
+        try:
+            problema = problema_desde_json(datos)
+            if problema['metodo'] is not None and problema['metodo'] not in SOLVERS:
+                raise ValueError(f"Método desconocido: {problema['metodo']}")
+        except ValueError:
+            self.contar('invalidos')
+            raise
+        return problema
+
+    def resolver(self, datos, llegada):
+        """(código HTTP, cuerpo) para un problema"""
+        try:
+            problema = self.validar(datos)
+        except ValueError as e:
+            return 400, {'error': str(e)}
+        try:
+            return 200, self.esperar(self.enviar(problema, llegada), problema, llegada)
+        except ColaLlena as e:
+            return 503, {'error': str(e)}
+        except TiempoAgotado:
+            self.contar('vencidos')
+            return 504, {'error': 'Tiempo límite agotado'}
+        except Exception as e:
+            self.contar('errores')
+            return 500, {'error': f"{type(e).__name__}: {e}"}
+
+    def resolver_lote(self, datos, llegada):
+        """(código HTTP, cuerpo) para varios problemas resueltos a la vez"""
+        lista = datos.get('problemas') if isinstance(datos, dict) else datos
+        if not isinstance(lista, list):
+            self.contar('invalidos')
+            return 400, {'error': "Se esperaba una lista de problemas o {'problemas': [...]}"}
+
+        # Enviar todos antes de esperar: el pool los resuelve en paralelo
+        pendientes = []
+        for datos_problema in lista:
+            try:
+                problema = self.validar(datos_problema)
+                pendientes.append((problema, self.enviar(problema, llegada)))
+            except ValueError as e:
+                pendientes.append((None, {'error': str(e)}))
+            except ColaLlena as e:
+                pendientes.append((None, {'error': str(e)}))
+            except TiempoAgotado:
+                self.contar('vencidos')
+                pendientes.append((None, {'error': 'Tiempo límite agotado'}))
+
+        resultados = []
+        for problema, pendiente in pendientes:
+            if problema is None:
+                resultados.append(pendiente)
+                continue
+            try:
+                resultados.append(self.esperar(pendiente, problema, llegada))
+            except TiempoAgotado:
+                self.contar('vencidos')
+                resultados.append({'error': 'Tiempo límite agotado'})
+            except Exception as e:
+                self.contar('errores')
+                resultados.append({'error': f"{type(e).__name__}: {e}"})
+        return 200, {'resultados': resultados}
+
+    def salud(self):
+        return {
+            'estado': 'ok',
+            'trabajadores': self.trabajadores,
+            'en_curso': self.metricas['en_curso'],
+            'en_cola': self.metricas['en_cola']
+        }
+
+    def reporte(self):
+        with self.candado:
+            metricas = dict(self.metricas, estados=dict(self.metricas['estados']))
+        metricas['trabajadores'] = self.trabajadores
+        metricas['max_en_cola'] = self.max_en_cola
+        metricas['segundos_activo'] = time.time() - self.inicio
+        return metricas
+
+
+class ManejadorSolver(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        servidor = self.server.servidor
+        if self.path == '/health':
+            self.responder(200, servidor.salud())
+        elif self.path == '/metrics':
+            self.responder(200, servidor.reporte())
+        else:
+            self.responder(404, {'error': f"Ruta desconocida: {self.path}"})
+
+    def do_POST(self):
+        llegada = time.perf_counter()
+        servidor = self.server.servidor
+        if self.path not in ('/solve', '/solve/batch'):
+            self.responder(404, {'error': f"Ruta desconocida: {self.path}"})
+            return
+
+        servidor.contar('solicitudes')
+        largo = int(self.headers.get('Content-Length') or 0)
+        if largo > MAX_CUERPO:
+            self.responder(413, {'error': 'Solicitud demasiado grande'})
+            return
+        try:
+            datos = json.loads(self.rfile.read(largo) or b'null')
+        except ValueError as e:
+            servidor.contar('invalidos')
+            self.responder(400, {'error': f"JSON inválido: {e}"})
+            return
+
+        if self.path == '/solve':
+            self.responder(*servidor.resolver(datos, llegada))
+        else:
+            self.responder(*servidor.resolver_lote(datos, llegada))
+
+    def responder(self, codigo, cuerpo):
+        contenido = json.dumps(cuerpo, ensure_ascii=False).encode('utf-8')
+        self.send_response(codigo)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(contenido)))
+        self.end_headers()
+        self.wfile.write(contenido)
+
+    def log_message(self, formato, *args):
+        # Sin una línea por solicitud en la consola
+        pass
@@ -1,17 +1,12 @@
 import streamlit as st
-import pandas as pd
-import numpy as np
-import matplotlib.pyplot as plt
-import plotly.graph_objects as go
-import plotly.express as px
-from sympy import symbols, sympify
+# pandas, matplotlib y plotly se importan dentro de las vistas que los usan
 import sys
 import os
 
 # Agregar el directorio padre al path para importar módulos
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from metodos import SimplexTradicional, GranMSimplex, DosFasesSimplex
+from metodos import SimplexTradicional, GranMSimplex, DosFasesSimplex, SelectorMetodo, crear_solver, CarreraMetodos
 from utils.casos_especiales import ManejadorCasosEspeciales
 from ejemplos.problemas_test import ProblemasTest
 
@@ -78,6 +73,7 @@ class StreamlitApp:
 
     def mostrar_inicio(self):
         """Página de inicio con información general"""
+        import plotly.express as px
         
         col1, col2 = st.columns([2, 1])
         
@@ -164,7 +160,8 @@ class StreamlitApp:
                     "Selección automática",
                     "Simplex Tradicional",
                     "Método Gran M",
-                    "Método Dos Fases"
+                    "Método Dos Fases",
+                    "Carrera de métodos"
                 ]
             )
             st.session_state.metodo = metodo
@@ -176,6 +173,8 @@ class StreamlitApp:
                 st.info("💡 Maneja todos los tipos de restricciones")
             elif metodo == "Método Dos Fases":
                 st.info("💡 Más estable numéricamente")
+            elif metodo == "Carrera de métodos":
+                st.info("💡 Ejecuta varios métodos en paralelo y usa el primero que termina")
             else:
                 st.info("💡 Se seleccionará automáticamente el mejor método")
         
@@ -334,26 +333,45 @@ class StreamlitApp:
             solver = GranMSimplex()
         elif metodo_nombre == "Método Dos Fases":
             solver = DosFasesSimplex()
+        elif metodo_nombre == "Carrera de métodos":
+            solver = CarreraMetodos()
         else:  # Selección automática
-            tiene_no_estandar = any(rel in ['>=', '='] for rel in tipos_restr)
-            if tiene_no_estandar:
-                solver = DosFasesSimplex()
-                st.info("🤖 Selección automática: Método Dos Fases")
-            else:
-                solver = SimplexTradicional()
-                st.info("🤖 Selección automática: Simplex Tradicional")
+            seleccion = SelectorMetodo().seleccionar(coeficientes, restricciones, rhs_values, tipos_restr, tipo_obj)
+            solver = crear_solver(seleccion['metodo'], seleccion['opciones'])
+            st.info(f"🤖 Selección automática: {seleccion['metodo']}")
+            with st.expander("🧮 Razones de la selección"):
+                for razon in seleccion['razones']:
+                    st.text(razon)
         
         # Resolver
         try:
-            resultado = solver.resolver(coeficientes, restricciones, rhs_values, tipos_restr, tipo_obj)
-            resultado['metodo_usado'] = solver.__class__.__name__
+            if hasattr(solver, 'iter_resolver'):
+                resultado = self.resolver_con_progreso(solver, coeficientes, restricciones, rhs_values, tipos_restr, tipo_obj)
+            else:
+                resultado = solver.resolver(coeficientes, restricciones, rhs_values, tipos_restr, tipo_obj)
+            resultado.setdefault('metodo_usado', solver.__class__.__name__)
             return resultado
         except Exception as e:
             st.error(f"❌ Error durante la resolución: {e}")
             return None
 
+    def resolver_con_progreso(self, solver, c, A, b, tipos, tipo_objetivo):
+        """Resolver mostrando cada pivoteo y la convergencia del objetivo en vivo"""
+        import pandas as pd
+        estado = st.empty()
+        grafico = st.line_chart(pd.DataFrame({'Objetivo': []}, dtype=float))
+        
+        for evento in solver.iter_resolver(c, A, b, tipos, tipo_objetivo):
+            if evento['tipo'] == 'resultado':
+                return evento['resultado']
+            
+            fase = f" (Fase {evento['fase']})" if evento['fase'] else ""
+            estado.text(f"🔄 Iteración {evento['iteracion']}{fase}: objetivo = {evento['objetivo']:.4f}")
+            grafico.add_rows(pd.DataFrame({'Objetivo': [evento['objetivo']]}))
+
     def mostrar_resultados(self):
         """Mostrar los resultados de la resolución"""
+        import pandas as pd
         
         st.subheader("📊 Resultados")
         
@@ -412,6 +430,8 @@ class StreamlitApp:
 
     def crear_grafico_solucion(self):
         """Crear gráfico de la solución para problemas de 2 variables"""
+        import matplotlib.pyplot as plt
+        import numpy as np
         
         if len(st.session_state.get('coeficientes', [])) != 2:
             return
@@ -508,6 +528,7 @@ class StreamlitApp:
 
     def ejecutar_comparacion(self):
         """Ejecutar comparación entre métodos"""
+        import pandas as pd
         
         # Datos del problema
         c = [3, 2]
@@ -644,6 +665,7 @@ class StreamlitApp:
 
     def analisis_avanzado(self):
         """Análisis avanzado y herramientas adicionales"""
+        import plotly.express as px
         
         st.header("🧪 Análisis Avanzado")
         
@@ -15,12 +15,14 @@ Este proyecto implementa tres métodos principales de programación lineal:
 Además incluye manejo completo de casos especiales y ejemplos de prueba.
 """
 
+import importlib.util
 import sys
 import os
 
 # Importar módulos personalizados
-from metodos import SimplexTradicional, GranMSimplex, DosFasesSimplex
+from metodos import SimplexTradicional, GranMSimplex, DosFasesSimplex, SelectorMetodo, crear_solver, CarreraMetodos
 from utils.validadores import leer_funcion_objetivo, leer_restricciones, mostrar_resumen
+from utils.modelo import leer_modelo, modelo_a_denso
 from utils.casos_especiales import ManejadorCasosEspeciales
 from ejemplos.problemas_test import ProblemasTest
 
@@ -40,7 +42,8 @@ class SuiteProgramacionLineal:
         print("4. 📚 Información sobre métodos")
         print("5. 🧪 Modo avanzado (casos especiales)")
         print("6. 🌐 Abrir interfaz web (Streamlit)")
-        print("7. 🚪 Salir")
+        print("7. 📂 Resolver problema desde archivo (MPS/LP)")
+        print("8. 🚪 Salir")
         print("="*60)
 
     def resolver_problema_personalizado(self):
@@ -61,7 +64,7 @@ class SuiteProgramacionLineal:
         mostrar_resumen(tipo, expr, variables, coeficientes, restricciones, resultados, relaciones)
         
         # Seleccionar método
-        metodo = self.seleccionar_metodo(relaciones)
+        metodo = self.seleccionar_metodo(relaciones, (coeficientes, restricciones, resultados, relaciones, tipo))
         if metodo is None:
             return
         
@@ -76,12 +79,57 @@ class SuiteProgramacionLineal:
         print("🔧 RESOLVIENDO PROBLEMA")
         print("="*60)
         
-        resultado = metodo.resolver(coeficientes, restricciones, resultados, relaciones, tipo)
+        resultado = self.resolver_con_progreso(metodo, coeficientes, restricciones, resultados, relaciones, tipo)
+        if resultado is None:
+            return
         
         # Mostrar resultado y análisis
-        self.mostrar_resultado_completo(resultado, variables, metodo.__class__.__name__)
+        self.mostrar_resultado_completo(resultado, variables, resultado.get('metodo_usado', metodo.__class__.__name__))
+
+    def resolver_desde_archivo(self):
+        """Leer un modelo de un archivo MPS o LP y resolverlo"""
+        print("\n📂 RESOLVER PROBLEMA DESDE ARCHIVO")
+        print("="*50)
+        
+        ruta = input("Ruta del archivo (.mps o .lp, opcionalmente .gz): ").strip()
+        try:
+            modelo = leer_modelo(ruta)
+            c, A, b, tipos, tipo_objetivo = modelo_a_denso(modelo)
+        except (OSError, ValueError) as e:
+            print(f"❌ No se pudo leer el archivo: {e}")
+            return
+        
+        print(f"✅ {modelo['nombre'] or ruta}: {len(modelo['variables'])} variables, "
+              f"{len(modelo['restricciones'])} restricciones, {len(modelo['valores'])} coeficientes no nulos")
+        
+        metodo = self.seleccionar_metodo(tipos, (c, A, b, tipos, tipo_objetivo))
+        if metodo is None:
+            return
+        
+        resultado = self.resolver_con_progreso(metodo, c, A, b, tipos, tipo_objetivo)
+        if resultado is None:
+            return
+        
+        if resultado['factible'] and resultado.get('valor_optimo') is not None:
+            resultado['valor_optimo'] += modelo['constante']
+        self.mostrar_resultado_completo(resultado, modelo['variables'], resultado.get('metodo_usado', metodo.__class__.__name__))
 
-    def seleccionar_metodo(self, relaciones):
+    def resolver_con_progreso(self, metodo, c, A, b, tipos, tipo_objetivo):
+        """Resolver mostrando el avance de cada pivoteo; Ctrl+C detiene la resolución"""
+        if not hasattr(metodo, 'iter_resolver'):
+            return metodo.resolver(c, A, b, tipos, tipo_objetivo)
+        
+        try:
+            for evento in metodo.iter_resolver(c, A, b, tipos, tipo_objetivo):
+                if evento['tipo'] == 'resultado':
+                    return evento['resultado']
+                fase = f" (Fase {evento['fase']})" if evento['fase'] else ""
+                print(f"⏳ Iteración {evento['iteracion']}{fase} - objetivo: {evento['objetivo']:.4f}")
+        except KeyboardInterrupt:
+            print("\n⛔ Resolución detenida por el usuario")
+            return None
+
+    def seleccionar_metodo(self, relaciones, problema=None):
         """Seleccionar método de resolución apropiado"""
         print("\n🔧 SELECCIÓN DE MÉTODO:")
         
@@ -99,8 +147,9 @@ class SuiteProgramacionLineal:
         print("2. Método de la Gran M (todos los problemas)")
         print("3. Método de Dos Fases (todos los problemas)")
         print("4. Selección automática")
+        print("5. Carrera de métodos (en paralelo, gana el primero)")
         
-        opcion = input("Seleccione método (1-4): ").strip()
+        opcion = input("Seleccione método (1-5): ").strip()
         
         if opcion == '1':
             return SimplexTradicional()
@@ -109,12 +158,20 @@ class SuiteProgramacionLineal:
         elif opcion == '3':
             return DosFasesSimplex()
         elif opcion == '4':
-            if tiene_no_estandar:
+            if problema is not None:
+                seleccion = SelectorMetodo().seleccionar(*problema)
+                print(f"🤖 Selección automática: {seleccion['metodo']}")
+                for razon in seleccion['razones']:
+                    print(f"   {razon}")
+                return crear_solver(seleccion['metodo'], seleccion['opciones'])
+            elif tiene_no_estandar:
                 print("🤖 Selección automática: Método de Dos Fases")
                 return DosFasesSimplex()
             else:
                 print("🤖 Selección automática: Simplex Tradicional")
                 return SimplexTradicional()
+        elif opcion == '5':
+            return CarreraMetodos()
         else:
             print("❌ Opción inválida")
             return None
@@ -274,7 +331,7 @@ class SuiteProgramacionLineal:
         while True:
             try:
                 self.mostrar_menu_principal()
-                opcion = input("Seleccione una opción (1-6): ").strip()
+                opcion = input("Seleccione una opción (1-8): ").strip()
                 
                 if opcion == '1':
                     self.resolver_problema_personalizado()
@@ -289,11 +346,13 @@ class SuiteProgramacionLineal:
                 elif opcion == '6':
                     self.abrir_interfaz_web()
                 elif opcion == '7':
+                    self.resolver_desde_archivo()
+                elif opcion == '8':
                     print("\n👋 ¡Gracias por usar la Suite de Programación Lineal!")
                     print("🎓 Proyecto desarrollado para el curso de Investigación de Operaciones")
                     break
                 else:
-                    print("❌ Opción inválida. Seleccione 1-7.")
+                    print("❌ Opción inválida. Seleccione 1-8.")
                 
                 input("\nPresione Enter para continuar...")
                 
@@ -305,16 +364,14 @@ class SuiteProgramacionLineal:
                 print("💡 Contacte al desarrollador si el problema persiste")
 
 def verificar_dependencias():
-    """Verificar que las dependencias estén instaladas"""
-    try:
-        import sympy
-        import numpy
-        print("✅ Dependencias verificadas")
-        return True
-    except ImportError as e:
-        print(f"❌ Dependencia faltante: {e}")
+    """Verificar que las dependencias estén instaladas (sin importarlas)"""
+    faltantes = [modulo for modulo in ('sympy', 'numpy') if importlib.util.find_spec(modulo) is None]
+    if faltantes:
+        print(f"❌ Dependencia faltante: {', '.join(faltantes)}")
         print("💡 Instale con: pip install sympy numpy")
         return False
+    print("✅ Dependencias verificadas")
+    return True
 
 def main():
     """Función principal"""
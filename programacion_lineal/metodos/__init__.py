@@ -1,3 +1,38 @@
-from .simplex import SimplexTradicional
-from .gran_m import GranMSimplex  
-from .dos_fases import DosFasesSimplex
\ No newline at end of file
+# Cada clase se importa al pedirla: `from metodos import DosFasesSimplex`
+# carga solo dos_fases.py y lo que este necesita, no todos los métodos
+from importlib import import_module
+
+MODULOS = {
+    'SimplexTradicional': 'simplex',
+    'GranMSimplex': 'gran_m',
+    'DosFasesSimplex': 'dos_fases',
+    'PlanosCorteGomory': 'planos_corte',
+    'GeneracionColumnas': 'generacion_columnas',
+    'GeneracionFilas': 'generacion_filas',
+    'SiftingSimplex': 'sifting',
+    'DantzigWolfe': 'dantzig_wolfe',
+    'SolverPorBloques': 'bloques',
+    'SimplexRedes': 'simplex_redes',
+    'SimplexDual': 'simplex_dual',
+    'SelectorMetodo': 'seleccion',
+    'crear_solver': 'seleccion',
+    'CarreraMetodos': 'carrera',
+    'ResolutorAsincrono': 'asincrono',
+    'ResolutorSaturado': 'asincrono',
+    'resolver_async': 'asincrono',
+}
+
+__all__ = list(MODULOS)
+
+
+def __getattr__(nombre):
+    modulo = MODULOS.get(nombre)
+    if modulo is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {nombre!r}")
+    valor = getattr(import_module(f".{modulo}", __name__), nombre)
+    globals()[nombre] = valor
+    return valor
+
+
+def __dir__():
+    return sorted(set(globals()) | set(MODULOS))
@@ -0,0 +1,233 @@
+"""
+Resolución desde código asyncio
+
+`resolver` es bloqueante: un servicio asyncio que lo llame directamente
+detiene su bucle de eventos hasta que termina el método. Aquí el trabajo
+se envía a un pool acotado de procesos (o hilos) y se espera con await:
+
+    async with ResolutorAsincrono(max_trabajos=4) as resolutor:
+        resultado = await resolutor.resolver(c, A, b, tipos, 'max',
+                                             metodo='DosFasesSimplex',
+                                             tiempo_limite=2.0)
+
+- Contrapresión: como máximo `max_trabajos` resoluciones en curso; las
+  demás esperan su turno sin ocupar el pool. Con `max_en_espera` se
+  rechaza de inmediato (ResolutorSaturado) cuando la espera es demasiado
+  larga, para que el servicio pueda responder "ocupado".
+- Cancelación y tiempo límite: los métodos con `iter_resolver` revisan
+  entre pivoteos una señal de cancelación y el plazo, y terminan con
+  estado 'cancelado' o 'tiempo_agotado'. Los demás no pueden detenerse a
+  mitad de camino; el await se corta igual (CancelledError o TimeoutError)
+  pero el cupo del pool se libera recién cuando el trabajo termina.
+"""
+
+import asyncio
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from .paralelo import estado_resultado
+from .seleccion import SelectorMetodo, crear_solver
+
+INTERVALO_REVISION = 0.05  # Segundos entre consultas a la señal de cancelación
+GRACIA = 0.5               # Margen sobre el tiempo límite antes de cortar el await
+
+
+class ResolutorSaturado(RuntimeError):
+    """Demasiadas resoluciones esperando turno"""
+
+
+def resolver_cooperativo(metodo, c, A, b, tipos, tipo_objetivo, opciones=None,
+                         tiempo_limite=None, cancelado=None):
+    """
+    Resolver en un trabajador, en silencio, atendiendo cancelación y plazo
+
+    Args:
+        metodo: Nombre del método (clave de SOLVERS)
+        c, A, b, tipos, tipo_objetivo: Problema a resolver
+        opciones: Atributos a fijar en el solver
+        tiempo_limite: Segundos desde el inicio; None sin límite
+        cancelado: Event (de threading o de un Manager) que pide detenerse
+
+    Returns:
+        dict: 'solucion', 'valor_optimo', 'factible', 'ilimitado',
+              'certificado', 'rayo' y 'punto' (ver metodos.certificados), 'mensaje',
+              'estado' (ver estado_resultado, más 'cancelado' y
+              'tiempo_agotado'), 'iteraciones', 'tiempo' y 'stats' (tiempos por
+              etapa y contadores, ver metodos.estadisticas; parciales si se
+              cortó la resolución, None si el método no los lleva)
+    """
+    inicio = time.perf_counter()
+    solver = crear_solver(metodo, dict(opciones or {}, verbose=False))
+
+    if not hasattr(solver, 'iter_resolver'):
+        resultado = solver.resolver(c, A, b, tipos, tipo_objetivo)
+        return resumir(resultado, estado_resultado(resultado), None, inicio)
+
+    plazo = None if tiempo_limite is None else inicio + tiempo_limite
+    proxima_revision = inicio + INTERVALO_REVISION
+    iteraciones = 0
+    for evento in solver.iter_resolver(c, A, b, tipos, tipo_objetivo):
+        if evento['tipo'] == 'resultado':
+            resultado = evento['resultado']
+            return resumir(resultado, estado_resultado(resultado), iteraciones, inicio)
+
+        iteraciones += 1
+        ahora = time.perf_counter()
+        if plazo is not None and ahora >= plazo:
+            return resumir({'mensaje': 'Tiempo límite agotado', 'stats': estadisticas_parciales(solver)},
+                           'tiempo_agotado', iteraciones, inicio)
+        if cancelado is not None and ahora >= proxima_revision:
+            # La consulta a un Event de Manager cruza procesos: no en cada pivoteo
+            proxima_revision = ahora + INTERVALO_REVISION
+            if cancelado.is_set():
+                return resumir({'mensaje': 'Resolución cancelada', 'stats': estadisticas_parciales(solver)},
+                               'cancelado', iteraciones, inicio)
+
+
+def resolver_problema(problema, tiempo_limite=None):
+    """
+    Resolver un problema ya validado (ver utils.problema_json)
+
+    Sin método se elige con SelectorMetodo; 'metodo_usado' indica cuál se
+    usó. Si el problema trae 'constante' (leído de MPS o LP) se suma al
+    valor óptimo.
+    """
+    metodo, opciones = problema['metodo'], problema['opciones']
+    args = (problema['c'], problema['A'], problema['b'], problema['tipos'], problema['tipo_objetivo'])
+    if metodo is None:
+        eleccion = SelectorMetodo().seleccionar(*args)
+        metodo, opciones = eleccion['metodo'], dict(eleccion['opciones'], **opciones)
+    resultado = resolver_cooperativo(metodo, *args, opciones, tiempo_limite)
+    resultado['metodo_usado'] = metodo
+    if problema.get('constante') and resultado['valor_optimo'] is not None:
+        resultado['valor_optimo'] += problema['constante']
+    return resultado
+
+
+def resumir(resultado, estado, iteraciones, inicio):
+    """Claves del resultado que vale la pena devolver desde un trabajador"""
+    return {
+        'solucion': resultado.get('solucion'),
+        'valor_optimo': resultado.get('valor_optimo'),
+        'factible': resultado.get('factible', False),
+        'ilimitado': resultado.get('ilimitado', False),
+        'certificado': resultado.get('certificado'),
+        'rayo': resultado.get('rayo'),
+        'punto': resultado.get('punto'),
+        'mensaje': resultado.get('mensaje'),
+        'estado': estado,
+        'iteraciones': iteraciones,
+        'tiempo': time.perf_counter() - inicio,
+        'stats': resultado.get('stats')
+    }
+
+
+def estadisticas_parciales(solver):
+    """Tiempos y contadores hasta el último pivoteo de una resolución cortada"""
+    estadisticas = getattr(solver, 'estadisticas', None)
+    return estadisticas.como_dict() if estadisticas is not None else None
+
+
+class ResolutorAsincrono:
+    def __init__(self, max_trabajos=None, usar_procesos=True, max_en_espera=None):
+        self.max_trabajos = max_trabajos or os.cpu_count() or 1
+        self.usar_procesos = usar_procesos  # False: hilos (sin costo de arranque, comparten el GIL)
+        self.max_en_espera = max_en_espera  # None: la espera no tiene tope
+        self.en_espera = 0
+        self.ejecutor = None
+        self.administrador = None
+        self.semaforo = None
+        self.bucle = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *excepcion):
+        await self.cerrar()
+
+    def iniciar(self):
+        """Crear el pool en el primer uso y un semáforo por bucle de eventos"""
+        if self.ejecutor is None:
+            if self.usar_procesos:
+                self.ejecutor = ProcessPoolExecutor(max_workers=self.max_trabajos)
+                self.administrador = multiprocessing.Manager()
+            else:
+                self.ejecutor = ThreadPoolExecutor(max_workers=self.max_trabajos)
+        bucle = asyncio.get_running_loop()
+        if self.bucle is not bucle:
+            # Un asyncio.Semaphore queda atado al bucle donde se usó
+            self.bucle = bucle
+            self.semaforo = asyncio.Semaphore(self.max_trabajos)
+
+    def nueva_senal(self):
+        """Señal de cancelación visible desde el trabajador"""
+        if self.administrador is not None:
+            return self.administrador.Event()
+        return threading.Event()
+
+    async def resolver(self, c, A, b, tipos, tipo_objetivo, metodo='DosFasesSimplex',
+                       opciones=None, tiempo_limite=None):
+        """
+        Resolver sin bloquear el bucle de eventos
+
+        Returns:
+            dict: Resultado de resolver_cooperativo
+
+        Raises:
+            ResolutorSaturado: Si ya hay max_en_espera resoluciones esperando
+            asyncio.TimeoutError: Si el método no se detuvo dentro del plazo
+        """
+        self.iniciar()
+        if self.max_en_espera is not None and self.semaforo.locked() and self.en_espera >= self.max_en_espera:
+            raise ResolutorSaturado(f"{self.en_espera} resoluciones esperando turno")
+
+        semaforo = self.semaforo
+        self.en_espera += 1
+        try:
+            await semaforo.acquire()
+        finally:
+            self.en_espera -= 1
+
+        try:
+            cancelado = self.nueva_senal()
+            futuro = asyncio.get_running_loop().run_in_executor(
+                self.ejecutor, resolver_cooperativo, metodo,
+                list(c), [list(fila) for fila in A], list(b), list(tipos),
+                tipo_objetivo, opciones, tiempo_limite, cancelado)
+        except BaseException:
+            semaforo.release()
+            raise
+        # El cupo se devuelve cuando el trabajador termina, no cuando se deja de esperar
+        futuro.add_done_callback(lambda _: semaforo.release())
+
+        espera = None if tiempo_limite is None else tiempo_limite + GRACIA
+        try:
+            return await asyncio.wait_for(asyncio.shield(futuro), espera)
+        except (asyncio.CancelledError, asyncio.TimeoutError):
+            cancelado.set()
+            raise
+
+    async def cerrar(self):
+        """Esperar a los trabajos en curso y liberar el pool"""
+        if self.ejecutor is None:
+            return
+        await asyncio.get_running_loop().run_in_executor(None, self.ejecutor.shutdown)
+        if self.administrador is not None:
+            self.administrador.shutdown()
+        self.ejecutor = self.administrador = self.semaforo = self.bucle = None
+
+
+resolutor_por_defecto = None
+
+
+async def resolver_async(c, A, b, tipos, tipo_objetivo, metodo='DosFasesSimplex',
+                         opciones=None, tiempo_limite=None):
+    """Resolver con un ResolutorAsincrono compartido (un trabajo por núcleo)"""
+    global resolutor_por_defecto
+    if resolutor_por_defecto is None:
+        resolutor_por_defecto = ResolutorAsincrono()
+    return await resolutor_por_defecto.resolver(c, A, b, tipos, tipo_objetivo, metodo,
+                                                opciones, tiempo_limite)
@@ -0,0 +1,218 @@
+"""
+Resolución por bloques independientes
+
+Antes de construir el tableau se buscan las componentes conexas del grafo
+filas/columnas de A. Si el modelo se divide en subproblemas que no comparten
+variables ni restricciones, cada uno se resuelve por separado (en paralelo
+si se piden varios procesos) y se combinan solución y valor óptimo. Un
+tableau denso sobre la unión cuesta el cuadrado del tamaño total; por
+bloques, la suma de los cuadrados.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+
+from utils.estructura import detectar_bloques
+
+from .paralelo import METODOS, resolver_en_proceso
+
+
+class SolverPorBloques:
+    def __init__(self, metodo=None, procesos=1):
+        self.metodo = metodo      # Nombre en METODOS; None elige por bloque
+        self.procesos = procesos  # 1: secuencial con pasos; None: tantos como núcleos
+        self.tolerancia = 1e-10
+        self.max_iteraciones = 100
+        self.verbose = True  # Imprimir cada paso además de guardarlo
+        self.pasos = []
+
+    def agregar_paso(self, texto):
+        """Agregar un paso al proceso de solución"""
+        self.pasos.append(texto)
+        if self.verbose:
+            print(texto)
+
+    def resolver(self, c, A, b, tipos, tipo_objetivo):
+        """
+        Resolver separando el problema en bloques independientes
+
+        Returns:
+            dict: Resultado con las claves habituales más 'bloques' (filas,
+                  columnas, método y valor de cada bloque)
+        """
+        self.pasos = []
+        bloques = detectar_bloques(A, len(c))
+
+        if len(bloques) == 1 and bloques[0]['filas']:
+            # Sin estructura que aprovechar: resolver el problema completo
+            solver = METODOS[self.metodo_bloque(b, tipos)]()
+            solver.tolerancia = self.tolerancia
+            solver.max_iteraciones = self.max_iteraciones
+            solver.verbose = self.verbose
+            resultado = solver.resolver(c, A, b, tipos, tipo_objetivo)
+            resultado['bloques'] = [dict(bloques[0], metodo=solver.__class__.__name__,
+                                         valor_optimo=resultado['valor_optimo'])]
+            return resultado
+
+        self.agregar_paso("🧩 RESOLUCIÓN POR BLOQUES INDEPENDIENTES")
+        self.agregar_paso(f"Bloques detectados: {len(bloques)}")
+
+        subproblemas = []
+        for bloque in bloques:
+            if bloque['filas'] and bloque['columnas']:
+                filas, cols = bloque['filas'], bloque['columnas']
+                subproblemas.append((self.metodo_bloque([b[i] for i in filas], [tipos[i] for i in filas]),
+                                     [c[j] for j in cols],
+                                     [[A[i][j] for j in cols] for i in filas],
+                                     [b[i] for i in filas],
+                                     [tipos[i] for i in filas]))
+        resultados = iter(self.resolver_subproblemas(subproblemas, tipo_objetivo))
+
+        solucion = [0.0] * len(c)
+        valor_optimo = 0.0
+        infactible = ilimitado = limite = None
+        certificado = rayo = None  # Del primer bloque infactible o ilimitado, en índices del problema completo
+        punto = [0.0] * len(c)     # Punto factible: solución u otro punto factible de cada bloque
+        con_punto = True
+        detalle = []
+
+        for k, bloque in enumerate(bloques, 1):
+            filas, cols = bloque['filas'], bloque['columnas']
+            if filas and cols:
+                metodo, resultado = next(resultados)
+            elif cols:
+                metodo, resultado = None, self.resolver_variable_libre(c[cols[0]], tipo_objetivo)
+            else:
+                metodo, resultado = None, self.resolver_fila_vacia(b[filas[0]], tipos[filas[0]])
+
+            detalle.append(dict(bloque, metodo=metodo, valor_optimo=resultado['valor_optimo']))
+
+            if not resultado['factible']:
+                if resultado.get('ilimitado'):
+                    if not ilimitado and resultado.get('rayo') is not None:
+                        rayo = [0.0] * len(c)
+                        for j, valor in zip(cols, resultado['rayo']):
+                            rayo[j] = valor
+                    if resultado.get('punto') is not None:
+                        for j, valor in zip(cols, resultado['punto']):
+                            punto[j] = valor
+                    else:
+                        con_punto = False
+                    ilimitado = ilimitado or k
+                elif resultado.get('limite_iteraciones'):
+                    limite = limite or k
+                else:
+                    if not infactible and resultado.get('certificado') is not None:
+                        certificado = [0.0] * len(b)
+                        for i, valor in zip(filas, resultado['certificado']):
+                            certificado[i] = valor
+                    infactible = infactible or k
+                continue
+
+            for j, valor in zip(cols, resultado['solucion']):
+                solucion[j] = punto[j] = valor
+            valor_optimo += resultado['valor_optimo']
+            self.agregar_paso(f"✅ Bloque {k} ({len(filas)}x{len(cols)}): valor {resultado['valor_optimo']:.4f}")
+
+        if limite and not infactible:
+            # Sin saber si ese bloque es factible no hay veredicto para el problema completo
+            mensaje = f"Bloque {limite}: máximo número de iteraciones alcanzado"
+            self.agregar_paso(f"❌ {mensaje}")
+            return {
+                'solucion': None,
+                'valor_optimo': None,
+                'factible': False,
+                'limite_iteraciones': True,
+                'mensaje': mensaje,
+                'bloques': detalle,
+                'pasos': self.pasos
+            }
+
+        if infactible or ilimitado:
+            if infactible:
+                mensaje = f"Bloque {infactible} infactible"
+            else:
+                mensaje = f"Bloque {ilimitado} ilimitado"
+            self.agregar_paso(f"❌ {mensaje}")
+            if infactible:
+                certificados = {'certificado': certificado}
+            elif rayo is not None and con_punto:
+                certificados = {'rayo': rayo, 'punto': punto}
+            else:
+                # Sin un punto factible de todos los bloques el rayo no prueba nada
+                certificados = {'rayo': None, 'punto': None}
+            return {
+                'solucion': None,
+                'valor_optimo': None,
+                'factible': False,
+                'ilimitado': not infactible,
+                **certificados,
+                'mensaje': mensaje,
+                'bloques': detalle,
+                'pasos': self.pasos
+            }
+
+        self.agregar_paso("\n🎊 SOLUCIÓN ÓPTIMA ENCONTRADA")
+        self.agregar_paso(f"Valor óptimo: {valor_optimo:.4f}")
+
+        return {
+            'solucion': solucion,
+            'valor_optimo': valor_optimo,
+            'factible': True,
+            'bloques': detalle,
+            'pasos': self.pasos
+        }
+
+    def metodo_bloque(self, b, tipos):
+        """
+        Método para un bloque: el configurado o, si no hay, según sus restricciones
+
+        El simplex tradicional solo sirve cuando el origen es factible: todas
+        las filas <= con lado derecho no negativo.
+        """
+        if self.metodo is not None:
+            return self.metodo
+        if any(tipo in ['>=', '='] for tipo in tipos) or any(valor < 0 for valor in b):
+            return 'DosFasesSimplex'
+        return 'SimplexTradicional'
+
+    def resolver_subproblemas(self, subproblemas, tipo_objetivo):
+        """Resolver los bloques con filas; devuelve (método, resultado) en orden"""
+        if self.procesos == 1 or len(subproblemas) < 2:
+            resultados = []
+            for metodo, c, A, b, tipos in subproblemas:
+                solver = METODOS[metodo]()
+                solver.tolerancia = self.tolerancia
+                solver.max_iteraciones = self.max_iteraciones
+                solver.verbose = self.verbose
+                resultado = solver.resolver(c, A, b, tipos, tipo_objetivo)
+                self.pasos.extend(resultado['pasos'])
+                resultados.append((metodo, resultado))
+            return resultados
+
+        opciones = {'tolerancia': self.tolerancia, 'max_iteraciones': self.max_iteraciones}
+        with ProcessPoolExecutor(max_workers=self.procesos) as ejecutor:
+            futuros = [ejecutor.submit(resolver_en_proceso, metodo, c, A, b, tipos, tipo_objetivo, opciones)
+                       for metodo, c, A, b, tipos in subproblemas]
+            return [(sub[0], futuro.result()) for sub, futuro in zip(subproblemas, futuros)]
+
+    def resolver_variable_libre(self, costo, tipo_objetivo):
+        """Variable que no aparece en ninguna restricción"""
+        mejora = costo > self.tolerancia if tipo_objetivo == 'max' else costo < -self.tolerancia
+        if mejora:
+            return {'solucion': None, 'valor_optimo': None, 'factible': False, 'ilimitado': True,
+                    'rayo': [1.0], 'punto': [0.0]}
+        return {'solucion': [0.0], 'valor_optimo': 0.0, 'factible': True}
+
+    def resolver_fila_vacia(self, rhs, tipo):
+        """Restricción sin variables: 0 <= b, 0 >= b o 0 = b"""
+        if tipo == '<=':
+            factible = rhs >= -self.tolerancia
+        elif tipo == '>=':
+            factible = rhs <= self.tolerancia
+        else:
+            factible = abs(rhs) <= self.tolerancia
+        if not factible:
+            # 0 = y·A con y·b < 0
+            return {'solucion': [], 'valor_optimo': None, 'factible': False,
+                    'certificado': [1.0 if rhs < 0 else -1.0]}
+        return {'solucion': [], 'valor_optimo': 0.0, 'factible': True}
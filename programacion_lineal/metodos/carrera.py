@@ -0,0 +1,204 @@
+"""
+Modo carrera: varios métodos en paralelo, gana el primero verificado
+
+Cada participante (método más opciones) se lanza en su propio proceso
+sobre el mismo problema. Se devuelve el primer resultado que termina con
+un estado verificado y se cancelan los demás procesos:
+
+    - óptimo: la solución cumple todas las restricciones y c·x coincide
+      con el valor óptimo informado
+    - infactible: el 'certificado' de Farkas pasa verificar_certificado
+    - ilimitado: el 'rayo' y el 'punto' factible pasan verificar_rayo
+
+Un diagnóstico sin prueba que lo respalde y los finales sin diagnóstico
+(método no aplicable, límite de iteraciones, error) no ganan: se anotan y
+se sigue esperando a los demás. Si ningún participante verifica, se
+informa el fallo.
+"""
+
+import multiprocessing
+import queue
+import time
+
+from utils.estructura import detectar_red
+
+from .certificados import verificar_certificado, verificar_rayo
+from .paralelo import estado_resultado
+from .seleccion import SOLVERS, crear_solver
+from .simplex_dual import SimplexDual
+
+
+def correr_participante(cola, indice, metodo, opciones, c, A, b, tipos, tipo_objetivo):
+    """Resolver en un proceso de trabajo y publicar el resultado en la cola"""
+    inicio = time.perf_counter()
+    try:
+        solver = crear_solver(metodo, dict(opciones, verbose=False))
+        resultado = solver.resolver(c, A, b, tipos, tipo_objetivo)
+        resultado = {
+            'solucion': resultado['solucion'],
+            'valor_optimo': resultado['valor_optimo'],
+            'factible': resultado['factible'],
+            'ilimitado': resultado.get('ilimitado', False),
+            'certificado': resultado.get('certificado'),
+            'rayo': resultado.get('rayo'),
+            'punto': resultado.get('punto'),
+            'mensaje': resultado.get('mensaje'),
+            'estado': estado_resultado(resultado),
+            'pasos': resultado['pasos']
+        }
+    except Exception as e:
+        resultado = {'solucion': None, 'valor_optimo': None, 'factible': False,
+                     'estado': 'error', 'mensaje': str(e), 'pasos': []}
+    resultado['tiempo'] = time.perf_counter() - inicio
+    cola.put((indice, resultado))
+
+
+class CarreraMetodos:
+    def __init__(self, variantes=None):
+        # Participantes extra: lista de (nombre del método, opciones)
+        self.variantes = list(variantes or [])
+        self.tolerancia = 1e-10
+        self.max_iteraciones = 1000
+        self.tiempo_limite = None  # Segundos; None espera a todos
+        self.verbose = True  # Imprimir cada paso además de guardarlo
+        self.pasos = []
+
+    def agregar_paso(self, texto):
+        """Agregar un paso al proceso de solución"""
+        self.pasos.append(texto)
+        if self.verbose:
+            print(texto)
+
+    def participantes(self, c, A, b, tipos, tipo_objetivo):
+        """Métodos aplicables al problema más las variantes configuradas"""
+        opciones = {'tolerancia': self.tolerancia, 'max_iteraciones': self.max_iteraciones}
+        lista = []
+        if all(tipo == '<=' for tipo in tipos) and all(valor >= 0 for valor in b):
+            lista.append(('SimplexTradicional', opciones))
+        lista.append(('GranMSimplex', opciones))
+        lista.append(('DosFasesSimplex', opciones))
+        if SimplexDual().es_dual_factible(c, tipo_objetivo):
+            lista.append(('SimplexDual', opciones))
+        if tipos and detectar_red(A, tipos, len(c)) is not None:
+            lista.append(('SimplexRedes', opciones))
+        for metodo, extra in self.variantes:
+            if metodo not in SOLVERS:
+                raise ValueError(f"Método desconocido en la carrera: {metodo}")
+            lista.append((metodo, dict(opciones, **(extra or {}))))
+        return lista
+
+    def resolver(self, c, A, b, tipos, tipo_objetivo):
+        """
+        Resolver con todos los participantes a la vez
+
+        Returns:
+            dict: Resultado del ganador con 'metodo_usado' y 'participantes'
+                  (método, estado y tiempo de los que terminaron)
+        """
+        self.pasos = []
+        lista = self.participantes(c, A, b, tipos, tipo_objetivo)
+        self.agregar_paso("🏁 CARRERA DE MÉTODOS")
+        self.agregar_paso(f"Participantes: {', '.join(metodo for metodo, _ in lista)}")
+
+        cola = multiprocessing.Queue()
+        procesos = []
+        for indice, (metodo, opciones) in enumerate(lista):
+            proceso = multiprocessing.Process(target=correr_participante,
+                                              args=(cola, indice, metodo, opciones, list(c),
+                                                    [list(fila) for fila in A], list(b), list(tipos),
+                                                    tipo_objetivo),
+                                              daemon=True)
+            proceso.start()
+            procesos.append(proceso)
+
+        inicio = time.perf_counter()
+        ganador = None
+        terminados = {}
+        try:
+            while len(terminados) < len(procesos):
+                restante = None
+                if self.tiempo_limite is not None:
+                    restante = self.tiempo_limite - (time.perf_counter() - inicio)
+                    if restante <= 0:
+                        self.agregar_paso("⏱️  Tiempo límite alcanzado")
+                        break
+                try:
+                    indice, resultado = cola.get(timeout=min(restante or 0.5, 0.5))
+                except queue.Empty:
+                    # Procesos que murieron sin publicar resultado
+                    for k, proceso in enumerate(procesos):
+                        if k not in terminados and not proceso.is_alive() and proceso.exitcode != 0:
+                            terminados[k] = {'estado': 'error', 'tiempo': None}
+                    continue
+
+                terminados[indice] = resultado
+                metodo = lista[indice][0]
+                self.agregar_paso(f"  {metodo}: {resultado['estado']} en {resultado['tiempo']:.4f} s")
+                if self.verificar(c, A, b, tipos, tipo_objetivo, resultado):
+                    ganador = indice
+                    break
+                if resultado['estado'] in ['ilimitado', 'infactible']:
+                    self.agregar_paso(f"  ⚠️ {metodo}: diagnóstico sin prueba verificable, se sigue esperando")
+        finally:
+            for proceso in procesos:
+                if proceso.is_alive():
+                    proceso.terminate()
+            for proceso in procesos:
+                proceso.join()
+
+        participantes = [{'metodo': lista[indice][0], 'estado': resultado['estado'], 'tiempo': resultado['tiempo']}
+                         for indice, resultado in terminados.items()]
+
+        if ganador is None:
+            self.agregar_paso("❌ Ningún método terminó con un resultado verificado")
+            return {
+                'solucion': None,
+                'valor_optimo': None,
+                'factible': False,
+                'mensaje': 'Ningún método terminó con un resultado verificado',
+                'participantes': participantes,
+                'pasos': self.pasos
+            }
+
+        resultado = terminados[ganador]
+        metodo = lista[ganador][0]
+        self.agregar_paso(f"🏆 Gana {metodo} ({resultado['estado']}); se cancelan los demás")
+
+        return {
+            'solucion': resultado['solucion'],
+            'valor_optimo': resultado['valor_optimo'],
+            'factible': resultado['factible'],
+            'ilimitado': resultado['ilimitado'],
+            'certificado': resultado.get('certificado'),
+            'rayo': resultado.get('rayo'),
+            'punto': resultado.get('punto'),
+            'metodo_usado': metodo,
+            'participantes': participantes,
+            'pasos': self.pasos + resultado['pasos']
+        }
+
+    def verificar(self, c, A, b, tipos, tipo_objetivo, resultado):
+        """Aceptar solo óptimos que cumplen las restricciones y diagnósticos con su prueba"""
+        if resultado['estado'] == 'infactible':
+            return verificar_certificado(A, b, tipos, resultado.get('certificado'))
+        if resultado['estado'] == 'ilimitado':
+            return verificar_rayo(c, A, b, tipos, tipo_objetivo, resultado.get('rayo'), resultado.get('punto'))
+        if resultado['estado'] != 'optimo':
+            return False
+
+        x = resultado['solucion']
+        escala = max([1.0] + [abs(valor) for valor in b])
+        holgura = 1e-6 * escala
+        if any(valor < -holgura for valor in x):
+            return False
+        for fila, rhs, tipo in zip(A, b, tipos):
+            lado = sum(a * valor for a, valor in zip(fila, x))
+            if tipo == '<=' and lado > rhs + holgura:
+                return False
+            if tipo == '>=' and lado < rhs - holgura:
+                return False
+            if tipo == '=' and abs(lado - rhs) > holgura:
+                return False
+
+        objetivo = sum(costo * valor for costo, valor in zip(c, x))
+        return abs(objetivo - resultado['valor_optimo']) <= 1e-6 * max(1.0, abs(objetivo))
@@ -0,0 +1,195 @@
+"""
+Certificados de infactibilidad y de problema ilimitado
+
+Cuando un método declara el problema infactible o ilimitado, el resultado
+trae una prueba que se verifica con un solo recorrido de A, sin volver a
+resolver:
+
+- 'certificado' (infactible, Gran M y Dos Fases): multiplicadores y, uno
+  por fila, con y_i >= 0 en las filas <=, y_i <= 0 en las >= y libre en
+  las =, tales que y^T A >= 0 e y·b < 0 (lema de Farkas). Para cualquier
+  x >= 0 que cumpliera las filas sería 0 <= y^T A x <= y·b < 0.
+- 'rayo' y 'punto' (ilimitado, cualquier método): dirección d >= 0 sobre
+  las variables originales con A_i d <= 0 en las filas <=, >= 0 en las >=
+  y = 0 en las =, que mejora el objetivo (c·d > 0 al maximizar, < 0 al
+  minimizar), y un punto factible x (la solución básica del momento, sin
+  artificiales con valor). x + t·d es factible para todo t >= 0 y el
+  objetivo crece sin cota; sin x la dirección sola no descarta que el
+  problema sea infactible, así que sin punto factible no hay rayo.
+
+Ambos usan las convenciones de ejemplos.generador y se refieren a las
+filas tal como se pasaron a `resolver`, aunque el método arme invertidas
+en el tableau las filas con b < 0. Se extraen del tableau final con cualquier
+backend de metodos.kernels y el método los verifica antes de devolverlos:
+si la verificación falla (p. ej. Gran M con una M que no alcanza para que
+la base sea óptima en la suma de artificiales) la clave queda en None.
+
+    resultado = GranMSimplex().resolver(c, A, b, tipos, 'max')
+    if resultado.get('certificado'):
+        verificar_certificado(A, b, tipos, resultado['certificado'])   # True
+    if resultado.get('rayo'):
+        verificar_rayo(c, A, b, tipos, 'max', resultado['rayo'], resultado['punto'])   # True
+"""
+
+TOLERANCIA = 1e-9  # Tolerancia relativa de las verificaciones
+
+
+def rayo_mejora(columna, base_vars, entra, num_vars_originales, artificiales=(), tolerancia=1e-10):
+    """
+    Rayo sobre las variables originales desde la columna entrante sin fila pivote
+
+    Al subir la variable entrante en t, cada básica cambia en -t veces su
+    coeficiente en la columna (ninguno es positivo: no hay fila pivote).
+
+    Args:
+        columna: Coeficientes de la columna entrante en las filas de restricción
+        base_vars: Variable básica de cada fila (índices lógicos)
+        entra: Índice lógico de la variable entrante
+        artificiales: Variables artificiales; si el rayo las mueve no es un
+            rayo del problema original y se devuelve None
+
+    Returns:
+        list: d, o None
+    """
+    rayo = [0.0] * num_vars_originales
+    if entra < num_vars_originales:
+        rayo[entra] = 1.0
+    artificiales = set(artificiales)
+    for valor, var_base in zip(columna, base_vars):
+        if var_base in artificiales and abs(valor) > tolerancia:
+            return None
+        if 0 <= var_base < num_vars_originales:
+            rayo[var_base] = max(-float(valor), 0.0)
+    return rayo
+
+
+def certificado_farkas(kernel, tableau, base_vars, artificiales, unitarias, columnas=None):
+    """
+    Multiplicadores de Farkas desde un tableau con artificiales en la base
+
+    La fila objetivo de la Fase I (minimizar la suma de artificiales) vale
+    e_art - s, con s la suma de las filas cuya básica es artificial; en la
+    columna unitaria +e_i de cada fila, s da el multiplicador u_i de la
+    Fase I. Si la base es óptima para la Fase I, y = -u es un certificado
+    (se calcula así también en Gran M, cuya fila objetivo mezcla la M).
+
+    Args:
+        unitarias: Índice lógico de la columna +e_i de cada fila (holgura o
+            artificial: la básica inicial)
+        columnas: Índice lógico -> columna del tableau de trabajo; las que
+            faltan siguen implícitas, sin cambios desde el tableau inicial
+            (ver metodos.implicitas). None: los índices coinciden
+
+    Returns:
+        list: y, con las filas en el signo del tableau (ver con_signos_originales)
+    """
+    artificiales = set(artificiales)
+    filas = [i for i, var_base in enumerate(base_vars) if var_base in artificiales]
+    suma = kernel.sumar_filas(tableau, filas)
+    en_base = set(filas)
+
+    certificado = []
+    for i, logica in enumerate(unitarias):
+        if columnas is None:
+            u = suma[logica]
+        elif logica in columnas:
+            u = suma[columnas[logica]]
+        else:
+            u = 1.0 if i in en_base else 0.0  # La columna sigue siendo e_i
+        certificado.append(0.0 - u)
+    return certificado
+
+
+def con_signos_originales(certificado, invertidas):
+    """Certificado para las filas como se pasaron (invertidas: filas multiplicadas por -1)"""
+    invertidas = set(invertidas)
+    return [-y if i in invertidas else y for i, y in enumerate(certificado)]
+
+
+def verificar_certificado(A, b, tipos, certificado, tolerancia=TOLERANCIA):
+    """
+    Indicar si `certificado` prueba que no hay x >= 0 con A x (tipos) b
+
+    Recorre una vez los no nulos de las filas con multiplicador no nulo.
+    A puede ser lista de listas, arreglo de numpy o memmap.
+    """
+    if certificado is None or len(certificado) != len(A):
+        return False
+    escala = max((abs(y) for y in certificado), default=0.0)
+    if not escala:
+        return False
+    signo = {'<=': 1.0, '>=': -1.0}
+    for y, tipo in zip(certificado, tipos):
+        if tipo in signo and signo[tipo] * y / escala < -tolerancia:
+            return False
+
+    n = len(A[0]) if len(A) else 0
+    if hasattr(A, 'shape'):
+        import numpy as np
+        producto, magnitud = np.zeros(n), np.zeros(n)
+        for fila, y in zip(A, certificado):
+            if y:
+                termino = (y / escala) * np.asarray(fila, dtype=float)
+                producto += termino
+                magnitud += np.abs(termino)
+    else:
+        producto, magnitud = [0.0] * n, [0.0] * n
+        for fila, y in zip(A, certificado):
+            if y:
+                for j, a in enumerate(fila):
+                    if a:
+                        termino = y / escala * a
+                        producto[j] += termino
+                        magnitud[j] += abs(termino)
+    if any(p < -tolerancia * (1.0 + s) for p, s in zip(producto, magnitud)):
+        return False
+
+    terminos = [y / escala * float(valor) for y, valor in zip(certificado, b)]
+    return sum(terminos) < -tolerancia * (1.0 + sum(abs(t) for t in terminos))
+
+
+def verificar_rayo(c, A, b, tipos, tipo_objetivo, rayo, punto, tolerancia=TOLERANCIA):
+    """
+    Indicar si `rayo` desde `punto` prueba que el problema es ilimitado
+
+    `punto` debe ser factible y `rayo` una dirección que respeta las filas
+    y mejora el objetivo. Solo lee las columnas de A donde el punto o el
+    rayo no son nulos.
+    """
+    if rayo is None or punto is None or len(rayo) != len(c) or len(punto) != len(c):
+        return False
+    if not cumple_filas(A, b, tipos, punto, tolerancia):
+        return False
+    escala = max((abs(d) for d in rayo), default=0.0)
+    if not escala:
+        return False
+    direccion = [d / escala for d in rayo]
+    if not cumple_filas(A, [0.0] * len(tipos), tipos, direccion, tolerancia):
+        return False
+
+    terminos = [float(c[j]) * d for j, d in enumerate(direccion) if d]
+    mejora = sum(terminos) if tipo_objetivo == 'max' else -sum(terminos)
+    return mejora > tolerancia * (1.0 + sum(abs(t) for t in terminos))
+
+
+def cumple_filas(A, b, tipos, x, tolerancia=TOLERANCIA):
+    """Indicar si x >= 0 y A x (tipos) b, con tolerancia relativa a cada fila"""
+    if min(x, default=0.0) < -tolerancia * (1.0 + max(abs(v) for v in x)):
+        return False
+    soporte = [(j, float(v)) for j, v in enumerate(x) if v]
+    for fila, tipo, valor in zip(A, tipos, b):
+        terminos = [float(fila[j]) * v for j, v in soporte]
+        exceso = sum(terminos) - float(valor)
+        holgura = tolerancia * (1.0 + abs(float(valor)) + sum(abs(t) for t in terminos))
+        if (tipo == '<=' and exceso > holgura) or (tipo == '>=' and exceso < -holgura) \
+                or (tipo == '=' and abs(exceso) > holgura):
+            return False
+    return True
+
+
+def resumen(vector, nombre, maximo=8):
+    """Componentes no nulas de un certificado o rayo, para las trazas"""
+    no_nulas = [f"{nombre}{i + 1} = {valor:.4f}" for i, valor in enumerate(vector) if valor]
+    if len(no_nulas) > maximo:
+        no_nulas = no_nulas[:maximo] + [f"... ({len(no_nulas) - maximo} más)"]
+    return ', '.join(no_nulas)
@@ -0,0 +1,216 @@
+"""
+Descomposición de Dantzig-Wolfe para problemas con estructura bloque-angular
+
+El usuario declara qué columnas forman cada bloque y qué filas son de
+enlace (acoplan varios bloques). Cada bloque con sus propias filas es un
+subproblema independiente; el problema maestro combina soluciones extremas
+de los bloques con las filas de enlace más una fila de convexidad por
+bloque y se resuelve con generación de columnas.
+
+En cada ronda los subproblemas de pricing de todos los bloques se resuelven
+en paralelo en procesos de trabajo.
+
+Los subproblemas deben ser acotados: el maestro solo genera puntos extremos,
+no rayos extremos.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+
+from .generacion_columnas import GeneracionColumnas
+from .paralelo import resolver_en_proceso
+
+
+class DantzigWolfe:
+    def __init__(self, metodo_bloques='DosFasesSimplex', procesos=None):
+        self.metodo_bloques = metodo_bloques
+        self.procesos = procesos  # None: tantos como núcleos; 1: secuencial
+        self.generador = GeneracionColumnas()
+        self.tolerancia = 1e-9
+        self.max_rondas = 200
+        self.max_iteraciones_bloque = 1000
+        self.verbose = True  # Imprimir cada paso además de guardarlo
+        self.pasos = []
+
+    def agregar_paso(self, texto):
+        """Agregar un paso al proceso de solución"""
+        self.pasos.append(texto)
+        if self.verbose:
+            print(texto)
+
+    def resolver(self, c, A, b, tipos, tipo_objetivo, bloques, filas_enlace):
+        """
+        Resolver por descomposición de Dantzig-Wolfe
+
+        Args:
+            c, A, b, tipos, tipo_objetivo: Problema completo
+            bloques: Lista con los índices de columna de cada bloque
+            filas_enlace: Índices de las filas que acoplan bloques
+
+        Returns:
+            dict: Resultado con las claves habituales más 'rondas' y
+                  'columnas_generadas'
+        """
+        self.pasos = []
+        enlace = list(filas_enlace)
+        subproblemas = self.separar_bloques(A, b, tipos, bloques, enlace)
+
+        self.agregar_paso("🧱 DESCOMPOSICIÓN DE DANTZIG-WOLFE")
+        self.agregar_paso(f"Bloques: {len(bloques)}, filas de enlace: {len(enlace)}")
+
+        if self.procesos == 1:
+            ejecutor = None
+        else:
+            ejecutor = ProcessPoolExecutor(max_workers=self.procesos)
+
+        try:
+            # Punto extremo inicial de cada bloque con su costo original
+            iniciales = self.resolver_bloques(ejecutor, subproblemas,
+                                              [[c[j] for j in cols] for cols in bloques],
+                                              tipo_objetivo)
+            for k, resultado in enumerate(iniciales):
+                if not resultado['factible']:
+                    return self.resultado_fallido(k, resultado)
+
+            # Puntos extremos en el orden de las columnas del maestro
+            puntos = [(k, resultado['solucion']) for k, resultado in enumerate(iniciales)]
+            maestro_c = [self.costo_punto(c, bloques[k], x) for k, x in puntos]
+            maestro_A = [[self.enlace_punto(A, i, bloques[k], x) for k, x in puntos] for i in enlace]
+            maestro_A += [[1.0 if k == bloque else 0.0 for k, _ in puntos] for bloque in range(len(bloques))]
+            maestro_b = [b[i] for i in enlace] + [1.0] * len(bloques)
+            maestro_tipos = [tipos[i] for i in enlace] + ['='] * len(bloques)
+
+            num_enlace = len(enlace)
+
+            def pricing(duales):
+                pi = duales[:num_enlace]
+                mu = duales[num_enlace:]
+
+                # Costo del subproblema: c_k - pi·D_k
+                costos = []
+                for cols in bloques:
+                    costos.append([c[j] - sum(p * A[i][j] for p, i in zip(pi, enlace)) for j in cols])
+
+                resultados = self.resolver_bloques(ejecutor, subproblemas, costos, tipo_objetivo)
+
+                columnas = []
+                for k, resultado in enumerate(resultados):
+                    if resultado.get('ilimitado'):
+                        raise ValueError(f"Bloque {k + 1} ilimitado en pricing: Dantzig-Wolfe requiere subproblemas acotados")
+                    if not resultado['factible']:
+                        continue
+                    reducido = resultado['valor_optimo'] - mu[k]
+                    mejora = reducido < -self.tolerancia if tipo_objetivo == 'min' else reducido > self.tolerancia
+                    if mejora:
+                        x = resultado['solucion']
+                        puntos.append((k, x))
+                        columna = [self.enlace_punto(A, i, bloques[k], x) for i in enlace]
+                        columna += [1.0 if bloque == k else 0.0 for bloque in range(len(bloques))]
+                        columnas.append((self.costo_punto(c, bloques[k], x), columna))
+                return columnas
+
+            self.generador.tolerancia = self.tolerancia
+            self.generador.verbose = self.verbose
+            self.generador.max_rondas = self.max_rondas
+            maestro = self.generador.resolver(maestro_c, maestro_A, maestro_b, maestro_tipos,
+                                              tipo_objetivo, pricing)
+        finally:
+            if ejecutor is not None:
+                ejecutor.shutdown()
+
+        self.pasos.extend(maestro['pasos'])
+
+        if not maestro['factible']:
+            maestro['pasos'] = self.pasos
+            return maestro
+
+        # Recuperar x como combinación convexa de los puntos extremos
+        solucion = [0.0] * len(c)
+        for (k, x), peso in zip(puntos, maestro['solucion']):
+            if abs(peso) > self.tolerancia:
+                for j, valor in zip(bloques[k], x):
+                    solucion[j] += peso * valor
+
+        self.agregar_paso(f"🎊 Solución recombinada a partir de {len(puntos)} puntos extremos")
+
+        return {
+            'solucion': solucion,
+            'valor_optimo': maestro['valor_optimo'],
+            'factible': True,
+            'rondas': maestro['rondas'],
+            'columnas_generadas': len(maestro['columnas']),
+            'pasos': self.pasos
+        }
+
+    def separar_bloques(self, A, b, tipos, bloques, enlace):
+        """
+        Asignar cada fila que no es de enlace al bloque cuyas columnas usa
+
+        Raises:
+            ValueError: Si una fila que no es de enlace usa columnas de
+                        más de un bloque
+        """
+        bloque_de = {}
+        for k, cols in enumerate(bloques):
+            for j in cols:
+                bloque_de[j] = k
+
+        filas_bloque = [[] for _ in bloques]
+        enlace = set(enlace)
+        for i, fila in enumerate(A):
+            if i in enlace:
+                continue
+            usados = {bloque_de[j] for j, a in enumerate(fila) if a != 0}
+            if len(usados) > 1:
+                raise ValueError(f"La fila {i + 1} acopla los bloques {sorted(usados)}: declárela como fila de enlace")
+            if usados:
+                filas_bloque[usados.pop()].append(i)
+
+        subproblemas = []
+        for k, cols in enumerate(bloques):
+            filas = filas_bloque[k]
+            if not filas:
+                raise ValueError(f"El bloque {k + 1} no tiene restricciones propias: su subproblema no es acotado")
+            subproblemas.append({
+                'A': [[A[i][j] for j in cols] for i in filas],
+                'b': [b[i] for i in filas],
+                'tipos': [tipos[i] for i in filas]
+            })
+        return subproblemas
+
+    def resolver_bloques(self, ejecutor, subproblemas, costos, tipo_objetivo):
+        """Resolver el subproblema de cada bloque (en paralelo si hay ejecutor)"""
+        opciones = {'max_iteraciones': self.max_iteraciones_bloque}
+        argumentos = [(self.metodo_bloques, costo, sub['A'], sub['b'], sub['tipos'], tipo_objetivo, opciones)
+                      for costo, sub in zip(costos, subproblemas)]
+
+        if ejecutor is None:
+            return [resolver_en_proceso(*args) for args in argumentos]
+
+        futuros = [ejecutor.submit(resolver_en_proceso, *args) for args in argumentos]
+        return [futuro.result() for futuro in futuros]
+
+    def resultado_fallido(self, k, resultado):
+        """Resultado cuando un bloque es infactible o ilimitado"""
+        if resultado.get('ilimitado'):
+            mensaje = f"Bloque {k + 1} ilimitado: Dantzig-Wolfe requiere subproblemas acotados"
+        elif resultado.get('limite_iteraciones'):
+            mensaje = f"Bloque {k + 1}: máximo número de iteraciones alcanzado"
+        else:
+            mensaje = f"Bloque {k + 1} infactible"
+        self.agregar_paso(f"❌ {mensaje}")
+        return {
+            'solucion': None,
+            'valor_optimo': None,
+            'factible': False,
+            'limite_iteraciones': resultado.get('limite_iteraciones', False),
+            'mensaje': mensaje,
+            'pasos': self.pasos
+        }
+
+    def costo_punto(self, c, cols, x):
+        """Costo original de un punto extremo del bloque"""
+        return sum(c[j] * valor for j, valor in zip(cols, x))
+
+    def enlace_punto(self, A, i, cols, x):
+        """Aporte de un punto extremo del bloque a la fila de enlace i"""
+        return sum(A[i][j] * valor for j, valor in zip(cols, x))
@@ -1,18 +1,43 @@
-import numpy as np
+from time import perf_counter
+
+from .certificados import (certificado_farkas, con_signos_originales, rayo_mejora, resumen,
+                           verificar_certificado, verificar_rayo)
+from .estadisticas import Estadisticas
+from .eventos import consumir, evento_pivoteo, evento_resultado, valor_tableau
+from .kernels import kernel_para
 
 class DosFasesSimplex:
     def __init__(self):
         self.tolerancia = 1e-10
         self.max_iteraciones = 100
+        self.verbose = True  # Imprimir cada paso además de guardarlo
         self.pasos = []
+        self.estadisticas = Estadisticas()  # Tiempos y contadores de la última resolución
+        self.tableau_en_disco = None  # True o un directorio: tableau en numpy.memmap (ver metodos.tableau_numpy)
+        self.hilos = 1  # Hilos para pivotear tableaux grandes (None: todos los núcleos)
+        self.kernel = None  # Backend de metodos.kernels ('python', 'numpy', 'dispersa', 'hilos'; None: automático)
 
     def agregar_paso(self, texto):
         """Agregar un paso al proceso de solución"""
+        self.estadisticas.iniciar('trazas')
         self.pasos.append(texto)
-        print(texto)
+        if self.verbose:
+            print(texto)
+        self.estadisticas.detener()
 
     def resolver(self, c, A, b, tipos, tipo_objetivo):
         """Método principal para resolver con Dos Fases"""
+        return consumir(self.iter_resolver(c, A, b, tipos, tipo_objetivo))
+
+    def iter_resolver(self, c, A, b, tipos, tipo_objetivo):
+        """Resolver paso a paso: un evento por pivoteo y uno final con el resultado"""
+        self.estadisticas = Estadisticas(self.tolerancia)
+        resultado = yield from self.iterar(c, A, b, tipos, tipo_objetivo)
+        resultado['stats'] = self.estadisticas.como_dict()
+        yield evento_resultado(resultado)
+
+    def iterar(self, c, A, b, tipos, tipo_objetivo):
+        """Generador del método: emite los pivoteos de ambas fases y devuelve el resultado"""
         self.pasos = []
         self.agregar_paso("🎯 INICIANDO MÉTODO DE DOS FASES")
         self.agregar_paso(f"Tipo de problema: {tipo_objetivo.upper()}")
@@ -22,13 +47,15 @@ class DosFasesSimplex:
         self.agregar_paso("📋 FASE I: BÚSQUEDA DE SOLUCIÓN FACTIBLE")
         self.agregar_paso("="*60)
         
-        resultado_fase1 = self.fase_1(c, A, b, tipos)
+        resultado_fase1 = yield from self.fase_1(c, A, b, tipos)
         
         if not resultado_fase1['factible']:
             return {
                 'solucion': None,
                 'valor_optimo': None,
                 'factible': False,
+                'certificado': resultado_fase1.get('certificado'),
+                'limite_iteraciones': resultado_fase1.get('limite_iteraciones', False),
                 'pasos': self.pasos
             }
         
@@ -37,26 +64,37 @@ class DosFasesSimplex:
         self.agregar_paso("🚀 FASE II: OPTIMIZACIÓN DEL PROBLEMA ORIGINAL")
         self.agregar_paso("="*60)
         
-        resultado_fase2 = self.fase_2(c, resultado_fase1['tableau'], 
+        resultado_fase2 = yield from self.fase_2(c, resultado_fase1['tableau'], 
                                      resultado_fase1['base_vars'], 
                                      resultado_fase1['var_artificiales'], 
-                                     tipo_objetivo)
+                                     tipo_objetivo, resultado_fase1['kernel'])
+        
+        if resultado_fase2.get('ilimitado'):
+            rayo = resultado_fase2['rayo']
+            if not verificar_rayo(c, A, b, tipos, tipo_objetivo, rayo, resultado_fase2['punto']):
+                rayo = resultado_fase2['rayo'] = resultado_fase2['punto'] = None
+            self.agregar_paso(f"📐 Rayo de mejora: {resumen(rayo, 'x')}" if rayo
+                              else "⚠️ No se pudo verificar un rayo de mejora desde un punto factible")
         
         return resultado_fase2
 
     def fase_1(self, c, A, b, tipos):
-        """Fase I: Minimizar suma de variables artificiales"""
+        """Fase I: Minimizar suma de variables artificiales (generador de pivoteos)"""
         m = len(A)
         n = len(c)
+        self.estadisticas.iniciar('forma_estandar')
         
-        # Verificar factibilidad básica (b >= 0)
+        # Verificar factibilidad básica (b >= 0); el signo se aplica al armar
+        # el tableau, sin escribir en A, b ni tipos (pueden ser de solo lectura)
+        invertidas = []
         for i in range(m):
             if b[i] < 0:
                 self.agregar_paso(f"❌ b[{i}] = {b[i]} < 0. Multiplicando restricción por -1")
-                b[i] = -b[i]
-                for j in range(n):
-                    A[i][j] = -A[i][j]
-                tipos[i] = '>=' if tipos[i] == '<=' else '<=' if tipos[i] == '>=' else '='
+                invertidas.append(i)
+        signos = [-1.0 if b[i] < 0 else 1.0 for i in range(m)]
+        tipos_originales = tipos
+        tipos = [{'<=': '>=', '>=': '<='}.get(tipo, tipo) if signo < 0 else tipo
+                 for signo, tipo in zip(signos, tipos)]
         
         # Contar variables necesarias
         num_var_holgura = sum(1 for tipo in tipos if tipo == '<=')
@@ -69,24 +107,17 @@ class DosFasesSimplex:
         
         if num_var_artificiales == 0:
             self.agregar_paso("✅ No se necesitan variables artificiales - Problema ya factible")
-            return self.construir_tableau_fase2_directo(c, A, b, tipos)
+            resultado = self.construir_tableau_fase2_directo(c, A, b, tipos, signos)
+            self.estadisticas.detener()
+            return resultado
         
-        # Construir tableau para Fase I
+        # Construir tableau para Fase I: matriz A extendida, RHS y fila objetivo en 0
         total_cols = n + num_var_holgura + num_var_exceso + num_var_artificiales + 1
-        tableau = []
+        kernel = kernel_para(self, A, (m + 1) * total_cols)
+        tableau = kernel.crear(A, b, [0.0] * (n + 1), total_cols, signos=signos)
         base_vars = []
         var_artificiales = []
         
-        # Construir matriz A extendida
-        for i in range(m):
-            fila = [0.0] * total_cols
-            # Variables originales
-            for j in range(n):
-                fila[j] = float(A[i][j])
-            # RHS
-            fila[-1] = float(b[i])
-            tableau.append(fila)
-        
         # Agregar variables de holgura, exceso y artificiales
         col_index = n
         
@@ -108,36 +139,45 @@ class DosFasesSimplex:
                 var_artificiales.append(col_index)
                 col_index += 1
         
+        unitarias = list(base_vars)  # Columna +e_i de cada fila, para el certificado de Farkas
+        
         # Función objetivo Fase I: minimizar suma de variables artificiales
-        fila_objetivo_fase1 = [0.0] * total_cols
         for var_art in var_artificiales:
-            fila_objetivo_fase1[var_art] = 1.0  # Minimizar suma de artificiales
-        
-        tableau.append(fila_objetivo_fase1)
+            tableau[-1][var_art] = 1.0  # Minimizar suma de artificiales
         
         # Eliminar variables artificiales básicas de la función objetivo
         for i in range(len(base_vars)):
             if base_vars[i] in var_artificiales:
-                factor = fila_objetivo_fase1[base_vars[i]]
-                for j in range(total_cols):
-                    fila_objetivo_fase1[j] -= factor * tableau[i][j]
+                kernel.restar_fila(tableau, -1, i, tableau[-1][base_vars[i]])
+        
+        self.estadisticas.detener()
         
+        if kernel.nombre != 'python':
+            self.agregar_paso(f"Tableau de {m + 1} x {total_cols} con el backend '{kernel.nombre}'"
+                              f"{' en disco' if kernel.directorio else ''}")
         self.agregar_paso(f"Variables artificiales en posiciones: {var_artificiales}")
         self.agregar_paso("\n🔍 Resolviendo Fase I (minimizar suma de variables artificiales)")
         
         # Resolver Fase I con método simplex
-        resultado_simplex = self.aplicar_simplex(tableau, base_vars, 'min', 1)
+        resultado_simplex = yield from self.aplicar_simplex(tableau, base_vars, 'min', 1, kernel)
         
         if not resultado_simplex['convergido']:
-            return {'factible': False}
+            return {'factible': False, 'limite_iteraciones': True}
         
-        # Verificar factibilidad
-        valor_objetivo_fase1 = tableau[-1][-1]
+        # Verificar factibilidad (la fila guarda -w, w = suma de artificiales)
+        valor_objetivo_fase1 = -tableau[-1][-1]
         self.agregar_paso(f"\n📊 Valor objetivo Fase I: {valor_objetivo_fase1:.6f}")
         
         if valor_objetivo_fase1 > self.tolerancia:
             self.agregar_paso("❌ PROBLEMA INFACTIBLE - Suma de variables artificiales > 0")
-            return {'factible': False}
+            certificado = certificado_farkas(kernel, tableau, base_vars, var_artificiales, unitarias)
+            certificado = con_signos_originales(certificado, invertidas)
+            if verificar_certificado(A, b, tipos_originales, certificado):
+                self.agregar_paso(f"📐 Certificado de Farkas: {resumen(certificado, 'y')}")
+            else:
+                certificado = None
+                self.agregar_paso("⚠️ No se pudo verificar un certificado de Farkas")
+            return {'factible': False, 'certificado': certificado}
         
         self.agregar_paso("✅ PROBLEMA FACTIBLE - Solución básica factible encontrada")
         
@@ -145,11 +185,14 @@ class DosFasesSimplex:
             'factible': True,
             'tableau': tableau,
             'base_vars': base_vars,
-            'var_artificiales': var_artificiales
+            'var_artificiales': var_artificiales,
+            'kernel': kernel
         }
 
-    def fase_2(self, c_original, tableau_fase1, base_vars, var_artificiales, tipo_objetivo):
-        """Fase II: Resolver problema original"""
+    def fase_2(self, c_original, tableau_fase1, base_vars, var_artificiales, tipo_objetivo, kernel):
+        """Fase II: Resolver problema original (generador de pivoteos)"""
+        estadisticas = self.estadisticas
+        estadisticas.iniciar('forma_estandar')
         
         # Eliminar variables artificiales del tableau
         self.agregar_paso("🔧 Eliminando variables artificiales del tableau")
@@ -168,16 +211,12 @@ class DosFasesSimplex:
                     vars_art_basicas.append((i, var_base))
                 else:
                     self.agregar_paso("❌ Variable artificial básica con valor no cero")
+                    estadisticas.detener()
                     return {'factible': False}
         
-        # Eliminar columnas de variables artificiales
-        tableau_fase2 = []
-        for i in range(len(tableau_fase1) - 1):  # Excluir fila objetivo de Fase I
-            nueva_fila = []
-            for j in range(len(tableau_fase1[i])):
-                if j not in var_artificiales:
-                    nueva_fila.append(tableau_fase1[i][j])
-            tableau_fase2.append(nueva_fila)
+        # Eliminar columnas de variables artificiales (la fila objetivo de
+        # Fase I queda al final hasta que se reemplaza por la de Fase II)
+        tableau_fase2 = kernel.quitar(tableau_fase1, columnas=var_artificiales)
         
         # Ajustar índices de variables base
         nuevo_base_vars = []
@@ -194,62 +233,80 @@ class DosFasesSimplex:
                 nuevo_base_vars.append(-1)  # Marcador temporal
         
         # Manejar variables artificiales básicas degeneradas
+        filas_redundantes = []
         for i, var_base in enumerate(base_vars):
             if var_base in var_artificiales:
                 # Buscar variable no básica para hacer pivoteo
                 fila_actual = tableau_fase2[i]
                 col_pivote = -1
-                for j in range(len(fila_actual) - 1):
+                for j in range(kernel.columnas(tableau_fase2) - 1):
                     if abs(fila_actual[j]) > self.tolerancia and j not in nuevo_base_vars:
                         col_pivote = j
                         break
-                
+
                 if col_pivote != -1:
+                    # Pivoteo degenerado (RHS = 0): la base sigue siendo factible
+                    estadisticas.registrar_pivoteo(fila_actual[col_pivote], fila_actual[-1])
+                    estadisticas.iniciar('pivoteo')
+                    kernel.pivotear(tableau_fase2, i, col_pivote)
+                    estadisticas.detener()
                     nuevo_base_vars[i] = col_pivote
                     self.agregar_paso(f"Reemplazando variable artificial básica con x{col_pivote + 1}")
                 else:
-                    # Eliminar fila redundante
-                    del tableau_fase2[i]
-                    del nuevo_base_vars[i]
-                    self.agregar_paso(f"Eliminando restricción redundante {i + 1}")
-        
-        # Construir nueva función objetivo para Fase II
+                    filas_redundantes.append(i)
+
+        # Eliminar filas redundantes (de abajo hacia arriba para no desplazar índices)
+        if filas_redundantes:
+            tableau_fase2 = kernel.quitar(tableau_fase2, filas=filas_redundantes)
+        for i in reversed(filas_redundantes):
+            del nuevo_base_vars[i]
+            self.agregar_paso(f"Eliminando restricción redundante {i + 1}")
+        
+        # Nueva función objetivo para Fase II: coeficientes de las variables originales
         num_vars_originales = len(c_original)
-        nueva_fila_objetivo = [0.0] * len(tableau_fase2[0])
-        
-        # Coeficientes de variables originales
-        for j in range(min(num_vars_originales, len(nueva_fila_objetivo) - 1)):
-            nueva_fila_objetivo[j] = -float(c_original[j]) if tipo_objetivo == 'max' else float(c_original[j])
-        
-        tableau_fase2.append(nueva_fila_objetivo)
+        coeficientes = [-float(c_original[j]) if tipo_objetivo == 'max' else float(c_original[j])
+                        for j in range(min(num_vars_originales, kernel.columnas(tableau_fase2) - 1))]
+        kernel.fijar_fila(tableau_fase2, -1, coeficientes)
         
         # Eliminar variables básicas de la función objetivo
         for i in range(len(nuevo_base_vars)):
             if nuevo_base_vars[i] != -1:
-                factor = nueva_fila_objetivo[nuevo_base_vars[i]]
+                factor = tableau_fase2[-1][nuevo_base_vars[i]]
                 if abs(factor) > self.tolerancia:
-                    for j in range(len(nueva_fila_objetivo)):
-                        nueva_fila_objetivo[j] -= factor * tableau_fase2[i][j]
+                    kernel.restar_fila(tableau_fase2, -1, i, factor)
+        
+        estadisticas.detener()
         
         self.agregar_paso("🔍 Resolviendo Fase II (problema original)")
         
         # Resolver Fase II
-        resultado_simplex = self.aplicar_simplex(tableau_fase2, nuevo_base_vars, tipo_objetivo, 2)
+        resultado_simplex = yield from self.aplicar_simplex(tableau_fase2, nuevo_base_vars, tipo_objetivo, 2, kernel)
         
         if not resultado_simplex['convergido']:
             if resultado_simplex.get('ilimitado'):
+                # Sin artificiales la base es factible: rayo y punto se verifican en iterar, que tiene A
+                columna = kernel.columna(tableau_fase2, resultado_simplex['col_pivote'])
                 return {
                     'solucion': None,
                     'valor_optimo': None,
                     'factible': False,
                     'ilimitado': True,
+                    'rayo': rayo_mejora(columna, nuevo_base_vars, resultado_simplex['col_pivote'],
+                                        num_vars_originales),
+                    'punto': kernel.extraer_solucion(tableau_fase2, nuevo_base_vars, num_vars_originales),
                     'pasos': self.pasos
                 }
             else:
-                return {'factible': False, 'pasos': self.pasos}
+                return {
+                    'solucion': None,
+                    'valor_optimo': None,
+                    'factible': False,
+                    'limite_iteraciones': True,
+                    'pasos': self.pasos
+                }
         
         # Extraer solución final
-        solucion = self.extraer_solucion(tableau_fase2, nuevo_base_vars, num_vars_originales)
+        solucion = kernel.extraer_solucion(tableau_fase2, nuevo_base_vars, num_vars_originales)
         valor_optimo = tableau_fase2[-1][-1] if tipo_objetivo == 'max' else -tableau_fase2[-1][-1]
         
         self.agregar_paso("\n🎊 SOLUCIÓN ÓPTIMA ENCONTRADA")
@@ -259,137 +316,98 @@ class DosFasesSimplex:
             'solucion': solucion,
             'valor_optimo': valor_optimo,
             'factible': True,
+            'tableau': kernel.como_listas(tableau_fase2),
+            'base_vars': nuevo_base_vars,
             'pasos': self.pasos
         }
 
-    def aplicar_simplex(self, tableau, base_vars, tipo_objetivo, fase):
-        """Aplicar algoritmo simplex estándar"""
+    def aplicar_simplex(self, tableau, base_vars, tipo_objetivo, fase, kernel):
+        """Aplicar algoritmo simplex estándar (generador: emite un evento por pivoteo)"""
         iteracion = 1
+        estadisticas = self.estadisticas
         
         self.mostrar_tableau(tableau, base_vars, 0, fase)
         
+        inicio_fase = perf_counter()
         while iteracion <= self.max_iteraciones:
             # Verificar optimalidad
-            col_pivote = self.encontrar_columna_pivote(tableau, tipo_objetivo)
+            estadisticas.iniciar('pricing')
+            col_pivote = kernel.columna_pivote(tableau)
+            estadisticas.detener()
             
             if col_pivote == -1:
+                estadisticas.sumar_fase(fase, inicio_fase)
                 self.agregar_paso("✅ CONDICIÓN DE OPTIMALIDAD ALCANZADA")
                 return {'convergido': True}
             
             # Encontrar fila pivote
-            fila_pivote = self.encontrar_fila_pivote(tableau, col_pivote)
+            estadisticas.iniciar('razon_minima')
+            fila_pivote = kernel.fila_pivote(tableau, col_pivote)
+            estadisticas.detener()
             
             if fila_pivote == -1:
+                estadisticas.sumar_fase(fase, inicio_fase)
                 self.agregar_paso("❌ PROBLEMA ILIMITADO - No hay solución acotada")
-                return {'convergido': False, 'ilimitado': True}
+                return {'convergido': False, 'ilimitado': True, 'col_pivote': col_pivote}
             
             self.agregar_paso(f"\n🔄 ITERACIÓN {iteracion} - FASE {fase}")
             self.agregar_paso(f"Elemento pivote: Fila {fila_pivote + 1}, Columna {col_pivote + 1} = {tableau[fila_pivote][col_pivote]:.4f}")
             
             # Actualizar variable base
+            sale = base_vars[fila_pivote]
             base_vars[fila_pivote] = col_pivote
             
             # Operaciones de pivoteo
-            self.pivotear(tableau, fila_pivote, col_pivote)
+            estadisticas.registrar_pivoteo(tableau[fila_pivote][col_pivote], tableau[fila_pivote][-1])
+            estadisticas.iniciar('pivoteo')
+            kernel.pivotear(tableau, fila_pivote, col_pivote)
+            estadisticas.detener()
             self.mostrar_tableau(tableau, base_vars, iteracion, fase)
+            estadisticas.sumar_fase(fase, inicio_fase)
+            yield evento_pivoteo(iteracion, fase, col_pivote, sale, valor_tableau(tableau, tipo_objetivo))
+            inicio_fase = perf_counter()
             
             iteracion += 1
         
+        estadisticas.sumar_fase(fase, inicio_fase)
         self.agregar_paso("❌ MÁXIMO NÚMERO DE ITERACIONES ALCANZADO")
-        return {'convergido': False}
+        return {'convergido': False, 'limite_iteraciones': True}
 
-    def construir_tableau_fase2_directo(self, c, A, b, tipos):
+    def construir_tableau_fase2_directo(self, c, A, b, tipos, signos=None):
         """Construir tableau directamente para Fase II cuando no hay variables artificiales"""
         m = len(A)
         n = len(c)
         
-        # Solo variables de holgura
-        tableau = []
+        # Solo variables de holgura: n vars originales + m vars holgura + RHS
+        kernel = kernel_para(self, A, (m + 1) * (n + m + 1))
+        fila_objetivo = [-float(c[j]) for j in range(n)] + [0.0]  # Asumiendo maximización
+        tableau = kernel.crear(A, b, fila_objetivo, n + m + 1, signos=signos)
         base_vars = []
         
-        # Construir matriz extendida
         for i in range(m):
-            fila = [0.0] * (n + m + 1)  # n vars originales + m vars holgura + RHS
-            for j in range(n):
-                fila[j] = float(A[i][j])
-            fila[n + i] = 1.0  # Variable de holgura
-            fila[-1] = float(b[i])
-            tableau.append(fila)
+            tableau[i][n + i] = 1.0  # Variable de holgura
             base_vars.append(n + i)
         
-        # Función objetivo
-        fila_objetivo = [0.0] * (n + m + 1)
-        for j in range(n):
-            fila_objetivo[j] = -float(c[j])  # Asumiendo maximización
-        tableau.append(fila_objetivo)
+        if kernel.nombre != 'python':
+            self.agregar_paso(f"Tableau de {m + 1} x {n + m + 1} con el backend '{kernel.nombre}'"
+                              f"{' en disco' if kernel.directorio else ''}")
         
         return {
             'factible': True,
             'tableau': tableau,
             'base_vars': base_vars,
-            'var_artificiales': []
+            'var_artificiales': [],
+            'kernel': kernel
         }
 
-    def encontrar_columna_pivote(self, tableau, tipo_objetivo):
-        """Encontrar columna pivote según la regla de entrada"""
-        fila_objetivo = tableau[-1]
-        col_pivote = -1
-        mejor_valor = 0
-        
-        for j in range(len(fila_objetivo) - 1):
-            if tipo_objetivo == 'max':
-                if fila_objetivo[j] < mejor_valor:
-                    mejor_valor = fila_objetivo[j]
-                    col_pivote = j
-            else:  # minimización
-                if fila_objetivo[j] > mejor_valor:
-                    mejor_valor = fila_objetivo[j]
-                    col_pivote = j
-        
-        return col_pivote
-
-    def encontrar_fila_pivote(self, tableau, col_pivote):
-        """Encontrar fila pivote usando la razón mínima"""
-        fila_pivote = -1
-        menor_ratio = float('inf')
-        
-        for i in range(len(tableau) - 1):
-            if tableau[i][col_pivote] > self.tolerancia:
-                ratio = tableau[i][-1] / tableau[i][col_pivote]
-                if ratio >= 0 and ratio < menor_ratio:
-                    menor_ratio = ratio
-                    fila_pivote = i
-        
-        return fila_pivote
-
-    def pivotear(self, tableau, fila_pivote, col_pivote):
-        """Realizar operaciones de pivoteo"""
-        pivot = tableau[fila_pivote][col_pivote]
-        
-        # Normalizar fila pivote
-        for j in range(len(tableau[0])):
-            tableau[fila_pivote][j] /= pivot
-        
-        # Eliminar en otras filas
-        for i in range(len(tableau)):
-            if i != fila_pivote:
-                factor = tableau[i][col_pivote]
-                for j in range(len(tableau[0])):
-                    tableau[i][j] -= factor * tableau[fila_pivote][j]
-
-    def extraer_solucion(self, tableau, base_vars, num_vars_originales):
-        """Extraer la solución final"""
-        solucion = [0.0] * num_vars_originales
-        
-        for i in range(len(base_vars)):
-            if base_vars[i] < num_vars_originales and base_vars[i] != -1:
-                solucion[base_vars[i]] = tableau[i][-1]
-        
-        return solucion
-
     def mostrar_tableau(self, tableau, base_vars, iteracion, fase):
         """Mostrar el tableau en formato tabular"""
+        self.estadisticas.iniciar('trazas')
         self.agregar_paso(f"\n📊 TABLEAU FASE {fase} - ITERACIÓN {iteracion}")
+        if not isinstance(tableau, list):
+            self.agregar_paso(f"({len(tableau) - 1} filas: el tableau solo se muestra con el backend 'python')")
+            self.estadisticas.detener()
+            return
         self.agregar_paso("=" * 50)
         
         # Encabezados
@@ -414,4 +432,5 @@ class DosFasesSimplex:
         fila_obj = "Z\t"
         for j in range(len(tableau[0])):
             fila_obj += f"{tableau[-1][j]:.3f}\t"
-        self.agregar_paso(fila_obj)
\ No newline at end of file
+        self.agregar_paso(fila_obj)
+        self.estadisticas.detener()
\ No newline at end of file
@@ -0,0 +1,90 @@
+"""
+Tiempos por etapa y contadores de una resolución
+
+Los métodos de tableau llevan siempre un objeto Estadisticas y lo agregan
+al resultado de `resolver` en la clave 'stats':
+
+    {'tiempos': {'total', 'forma_estandar', 'pricing', 'razon_minima',
+                 'pivoteo', 'trazas', 'fase_1', 'fase_2'},
+     'pivoteos', 'pivoteos_degenerados', 'cambios_de_cota',
+     'refactorizaciones', 'pivote_max', 'pivote_min'}
+
+Los tiempos de etapa son exclusivos: el texto que `agregar_paso` guarda
+mientras se calcula la razón mínima cuenta en 'trazas', no en
+'razon_minima'. 'fase_1' y 'fase_2' miden en cambio el lazo simplex
+completo de cada fase (Simplex Tradicional y Gran M tienen una sola, que
+cuenta como 'fase_2'), sin el tiempo que el consumidor de iter_resolver
+retiene cada evento. 'total' va desde el inicio de la resolución hasta
+que se arma el resultado, con ese tiempo incluido.
+
+Un pivoteo es degenerado cuando el lado derecho de la fila pivote es cero:
+la base cambia pero el vértice no. Los métodos de tableau no acotan
+variables ni refactorizan una base, así que 'cambios_de_cota' y
+'refactorizaciones' quedan en 0; están para que todos los métodos
+informen las mismas claves.
+"""
+
+from time import perf_counter
+
+ETAPAS = ('forma_estandar', 'pricing', 'razon_minima', 'pivoteo', 'trazas')
+
+
+class Estadisticas:
+    def __init__(self, tolerancia=1e-10):
+        self.tolerancia = tolerancia
+        self.inicio = perf_counter()
+        self.tiempos = dict.fromkeys(ETAPAS, 0.0)
+        self.fases = {1: 0.0, 2: 0.0}
+        self.pila = []      # Etapas en curso; solo corre el reloj de la última
+        self.marca = self.inicio
+        self.pivoteos = 0
+        self.pivoteos_degenerados = 0
+        self.cambios_de_cota = 0
+        self.refactorizaciones = 0
+        self.pivote_max = None
+        self.pivote_min = None
+
+    def iniciar(self, etapa):
+        """Empezar a contar `etapa`, pausando la que estaba en curso"""
+        ahora = perf_counter()
+        if self.pila:
+            self.tiempos[self.pila[-1]] += ahora - self.marca
+        self.pila.append(etapa)
+        self.marca = ahora
+
+    def detener(self):
+        """Terminar la última etapa iniciada y reanudar la anterior"""
+        ahora = perf_counter()
+        self.tiempos[self.pila.pop()] += ahora - self.marca
+        self.marca = ahora
+
+    def sumar_fase(self, fase, inicio):
+        """Sumar a la fase el tiempo transcurrido desde `inicio` (perf_counter)"""
+        self.fases[fase] += perf_counter() - inicio
+
+    def registrar_pivoteo(self, pivote, rhs):
+        """Contar un pivoteo a partir del elemento pivote y el RHS de su fila"""
+        magnitud = abs(pivote)
+        self.pivoteos += 1
+        if abs(rhs) <= self.tolerancia:
+            self.pivoteos_degenerados += 1
+        if self.pivote_max is None or magnitud > self.pivote_max:
+            self.pivote_max = magnitud
+        if self.pivote_min is None or magnitud < self.pivote_min:
+            self.pivote_min = magnitud
+
+    def como_dict(self):
+        """Estado actual como dict (sirve también a mitad de una resolución)"""
+        tiempos = {'total': perf_counter() - self.inicio}
+        tiempos.update(self.tiempos)
+        tiempos['fase_1'] = self.fases[1]
+        tiempos['fase_2'] = self.fases[2]
+        return {
+            'tiempos': tiempos,
+            'pivoteos': self.pivoteos,
+            'pivoteos_degenerados': self.pivoteos_degenerados,
+            'cambios_de_cota': self.cambios_de_cota,
+            'refactorizaciones': self.refactorizaciones,
+            'pivote_max': self.pivote_max,
+            'pivote_min': self.pivote_min
+        }
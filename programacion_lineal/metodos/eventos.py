@@ -0,0 +1,45 @@
+"""
+Eventos de la API de iteración (`iter_resolver`)
+
+Los métodos emiten un evento liviano por pivoteo y uno final con el
+resultado completo:
+
+    {'tipo': 'pivoteo', 'iteracion', 'fase', 'entra', 'sale', 'objetivo'}
+    {'tipo': 'resultado', 'resultado': dict}
+
+'entra' y 'sale' son índices de columna del tableau, 'objetivo' es el valor
+de la fase en curso (suma de artificiales en la Fase I; el objetivo del
+problema, en su sentido original, en otro caso) y 'fase' es 1 o 2 en Dos
+Fases y None en los métodos de una sola fase. Dejar de consumir el
+generador aborta la resolución.
+"""
+
+
+def evento_pivoteo(iteracion, fase, entra, sale, objetivo):
+    """Evento emitido después de cada pivoteo"""
+    return {
+        'tipo': 'pivoteo',
+        'iteracion': iteracion,
+        'fase': fase,
+        'entra': entra,
+        'sale': sale,
+        'objetivo': objetivo
+    }
+
+
+def evento_resultado(resultado):
+    """Evento final con el resultado de `resolver`"""
+    return {'tipo': 'resultado', 'resultado': resultado}
+
+
+def valor_tableau(tableau, tipo_objetivo):
+    """Valor actual del objetivo guardado en la fila objetivo (forma max)"""
+    return tableau[-1][-1] if tipo_objetivo == 'max' else -tableau[-1][-1]
+
+
+def consumir(eventos):
+    """Recorrer un iter_resolver hasta el final y devolver el resultado"""
+    evento = None
+    for evento in eventos:
+        pass
+    return evento['resultado']
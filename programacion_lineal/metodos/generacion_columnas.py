@@ -0,0 +1,215 @@
+"""
+Generación de columnas con oráculo de pricing provisto por el usuario
+
+El usuario entrega un problema maestro restringido (solo algunas columnas)
+y una función de pricing que recibe los valores duales actuales y devuelve
+columnas con costo reducido favorable. El método agrega esas columnas al
+tableau óptimo y reoptimiza desde la base anterior hasta que el oráculo
+ya no encuentra columnas que mejoren.
+
+Formato del oráculo:
+    pricing(duales) -> lista de (costo, columna)
+    donde columna tiene un coeficiente por restricción del maestro.
+"""
+
+from .certificados import rayo_mejora, resumen, verificar_rayo
+from .gran_m import GranMSimplex
+from .reoptimizacion import Reoptimizador
+
+
+class GeneracionColumnas:
+    def __init__(self):
+        self.solver = GranMSimplex()  # Construye el tableau del maestro
+        self.reoptimizador = Reoptimizador()
+        self.tolerancia = 1e-9
+        self.max_rondas = 100
+        self.max_iteraciones = 1000  # Pivoteos por reoptimización
+        self.verbose = True  # Imprimir cada paso además de guardarlo
+        self.pasos = []
+
+    def agregar_paso(self, texto):
+        """Agregar un paso al proceso de solución"""
+        self.pasos.append(texto)
+        if self.verbose:
+            print(texto)
+
+    def resolver(self, c, A, b, tipos, tipo_objetivo, pricing):
+        """
+        Resolver el maestro restringido y generar columnas hasta la optimalidad
+
+        Args:
+            c, A, b, tipos, tipo_objetivo: Maestro restringido
+            pricing: Oráculo que recibe los duales y devuelve (costo, columna)
+
+        Returns:
+            dict: Resultado con las claves habituales más 'columnas'
+                  (columnas generadas, en orden), 'duales' y 'rondas'.
+                  'solucion' (y 'rayo' y 'punto' si el maestro es
+                  ilimitado) incluye primero las variables del maestro y
+                  luego las columnas generadas.
+        """
+        m = len(A)
+        n = len(c)
+
+        # Gran M arma invertidas en el tableau las filas con b < 0: se recuerda
+        # el signo de cada fila
+        signos = [-1.0 if b[i] < 0 else 1.0 for i in range(m)]
+
+        self.solver.pasos = []
+        self.solver.verbose = self.reoptimizador.verbose = self.verbose
+        forma = self.solver.convertir_forma_estandar(c, A, b, tipos, tipo_objetivo)
+        self.pasos = list(self.solver.pasos)
+
+        tableau = forma['kernel'].como_listas(forma['tableau'], forma['implicitas'])
+        base_vars = forma['base_vars']
+        var_artificiales = forma['var_artificiales']
+
+        # Columnas de la base inicial: en el tableau actual guardan B^-1
+        columnas_identidad = list(base_vars)
+        entradas_iniciales = [self.solver.M if col in var_artificiales else 0.0
+                              for col in columnas_identidad]
+
+        self.reoptimizador.tolerancia = self.solver.tolerancia
+        self.reoptimizador.max_iteraciones = self.max_iteraciones
+
+        self.agregar_paso("\n" + "=" * 60)
+        self.agregar_paso("🧩 GENERACIÓN DE COLUMNAS")
+        self.agregar_paso("=" * 60)
+
+        columnas = []       # (costo, columna) generadas
+        indices = []        # Índice en el tableau de cada columna generada
+        ronda = 0
+
+        while True:
+            reoptimizado = self.reoptimizador.simplex_primal(tableau, base_vars)
+            self.pasos.extend(self.reoptimizador.pasos)
+            self.reoptimizador.pasos = []
+
+            if not reoptimizado['convergido']:
+                rayo = punto = None
+                if reoptimizado.get('ilimitado'):
+                    self.agregar_paso("❌ PROBLEMA MAESTRO ILIMITADO")
+                    rayo, punto = self.rayo_maestro(c, A, b, tipos, tipo_objetivo, tableau, base_vars,
+                                                    var_artificiales, reoptimizado['col_pivote'],
+                                                    columnas, indices)
+                return {
+                    'solucion': None,
+                    'valor_optimo': None,
+                    'factible': False,
+                    'ilimitado': reoptimizado.get('ilimitado', False),
+                    'rayo': rayo,
+                    'punto': punto,
+                    'limite_iteraciones': reoptimizado.get('limite_iteraciones', False),
+                    'columnas': columnas,
+                    'rondas': ronda,
+                    'pasos': self.pasos
+                }
+
+            duales_max = [tableau[-1][col] - inicial
+                          for col, inicial in zip(columnas_identidad, entradas_iniciales)]
+            duales = self.duales_originales(duales_max, signos, tipo_objetivo)
+
+            if ronda >= self.max_rondas:
+                self.agregar_paso("⚠️  Máximo número de rondas alcanzado")
+                break
+
+            propuestas = pricing(duales) or []
+            nuevas = 0
+            for costo, columna in propuestas:
+                reducido = costo - sum(y * a for y, a in zip(duales, columna))
+                mejora = reducido < -self.tolerancia if tipo_objetivo == 'min' else reducido > self.tolerancia
+                if not mejora:
+                    continue
+
+                # Expresar la columna en la base actual: B^-1·a
+                columna_fila = [signos[k] * float(columna[k]) for k in range(m)]
+                columna_base = [sum(tableau[i][col] * a for col, a in zip(columnas_identidad, columna_fila))
+                                for i in range(m)]
+                costo_max = costo if tipo_objetivo == 'max' else -costo
+                entrada_objetivo = sum(y * a for y, a in zip(duales_max, columna_fila)) - costo_max
+
+                indices.append(self.reoptimizador.agregar_columna(tableau, columna_base, entrada_objetivo))
+                columnas.append((costo, list(columna)))
+                nuevas += 1
+
+            if nuevas == 0:
+                self.agregar_paso(f"✅ Sin columnas con costo reducido favorable tras {ronda} ronda(s)")
+                break
+
+            ronda += 1
+            self.agregar_paso(f"➕ Ronda {ronda}: {nuevas} columna(s) agregada(s)")
+
+        # Verificar variables artificiales en la base
+        for i, var_base in enumerate(base_vars):
+            if var_base in var_artificiales and abs(tableau[i][-1]) > self.solver.tolerancia:
+                self.agregar_paso("❌ PROBLEMA INFACTIBLE - Variables artificiales en la base con valor > 0")
+                return {
+                    'solucion': None,
+                    'valor_optimo': None,
+                    'factible': False,
+                    'columnas': columnas,
+                    'duales': duales,
+                    'rondas': ronda,
+                    'pasos': self.pasos
+                }
+
+        valores = {var_base: tableau[i][-1] for i, var_base in enumerate(base_vars)}
+        solucion = [valores.get(j, 0.0) for j in range(n)] + [valores.get(j, 0.0) for j in indices]
+        valor_optimo = tableau[-1][-1] if tipo_objetivo == 'max' else -tableau[-1][-1]
+
+        self.agregar_paso("\n🎊 SOLUCIÓN ÓPTIMA ENCONTRADA")
+        self.agregar_paso(f"Columnas generadas: {len(columnas)}")
+        self.agregar_paso(f"Valor óptimo: {valor_optimo:.4f}")
+
+        return {
+            'solucion': solucion,
+            'valor_optimo': valor_optimo,
+            'factible': True,
+            'columnas': columnas,
+            'duales': duales,
+            'rondas': ronda,
+            'tableau': tableau,
+            'base_vars': base_vars,
+            'pasos': self.pasos
+        }
+
+    def rayo_maestro(self, c, A, b, tipos, tipo_objetivo, tableau, base_vars, var_artificiales,
+                     col_pivote, columnas, indices):
+        """
+        Rayo y punto factible del maestro ilimitado, verificados
+
+        Las columnas generadas se renumeran después de las del maestro (como
+        en 'solucion'); holguras y artificiales quedan fuera del rayo.
+
+        Returns:
+            tuple: (rayo, punto), o (None, None) si no se pudo verificar
+        """
+        n = len(c)
+        variable = {j: j for j in range(n)}
+        variable.update({col: n + k for k, col in enumerate(indices)})
+        total = n + len(indices)
+        # Las demás columnas (holguras y artificiales) se numeran después de las variables
+        fuera = {col: total + col for col in range(len(tableau[0]) - 1) if col not in variable}
+        variable.update(fuera)
+
+        punto = None
+        if not any(var_base in var_artificiales and abs(tableau[i][-1]) > self.solver.tolerancia
+                   for i, var_base in enumerate(base_vars)):
+            valores = {variable[var_base]: tableau[i][-1] for i, var_base in enumerate(base_vars)}
+            punto = [float(valores.get(j, 0.0)) for j in range(total)]
+        rayo = rayo_mejora([fila[col_pivote] for fila in tableau[:-1]], [variable[v] for v in base_vars],
+                           variable[col_pivote], total, [variable[v] for v in var_artificiales],
+                           self.solver.tolerancia)
+
+        costos = list(c) + [costo for costo, _ in columnas]
+        filas = [list(A[i]) + [columna[i] for _, columna in columnas] for i in range(len(A))]
+        if not verificar_rayo(costos, filas, b, tipos, tipo_objetivo, rayo, punto):
+            self.agregar_paso("⚠️ No se pudo verificar un rayo de mejora desde un punto factible")
+            return None, None
+        self.agregar_paso(f"📐 Rayo de mejora: {resumen(rayo, 'x')}")
+        return rayo, punto
+
+    def duales_originales(self, duales_max, signos, tipo_objetivo):
+        """Convertir duales de la fila objetivo (forma max, filas invertidas) al problema original"""
+        sentido = 1.0 if tipo_objetivo == 'max' else -1.0
+        return [sentido * s * y for y, s in zip(duales_max, signos)]
@@ -0,0 +1,221 @@
+"""
+Generación perezosa de restricciones (filas) para modelos con muchas filas <=
+
+Solo una parte de las restricciones <= entra al tableau inicial: las
+marcadas como iniciales o, si no se indica nada, una por variable que
+acota su crecimiento. Tras cada óptimo se revisan todas las restricciones
+en una sola pasada vectorizada, se agregan en lote las más violadas y se
+reoptimiza con simplex dual a partir de la base anterior.
+
+Las restricciones >= y = siempre forman parte del problema inicial.
+"""
+
+import numpy as np
+
+from .dos_fases import DosFasesSimplex
+from .reoptimizacion import Reoptimizador
+
+
+class GeneracionFilas:
+    def __init__(self, solver=None):
+        self.solver = solver if solver is not None else DosFasesSimplex()
+        self.reoptimizador = Reoptimizador()
+        self.tolerancia = 1e-9
+        self.lote = 50          # Filas violadas agregadas por ronda
+        self.max_rondas = 100
+        self.max_iteraciones = 1000  # Pivoteos por reoptimización
+        self.verbose = True  # Imprimir cada paso además de guardarlo
+        self.pasos = []
+
+    def agregar_paso(self, texto):
+        """Agregar un paso al proceso de solución"""
+        self.pasos.append(texto)
+        if self.verbose:
+            print(texto)
+
+    def resolver(self, c, A, b, tipos, tipo_objetivo, iniciales=None):
+        """
+        Resolver agregando las restricciones <= solo cuando se violan
+
+        Args:
+            c, A, b, tipos, tipo_objetivo: Problema completo. A puede ser una
+                lista de listas, un arreglo de numpy o una matriz dispersa
+                de scipy.
+            iniciales: Índices de las filas <= que entran desde el inicio, o
+                una lista de booleanos por fila
+
+        Returns:
+            dict: Resultado con las claves habituales más 'filas_activas'
+                  (filas incluidas en el tableau final) y 'rondas'
+        """
+        matriz = A.tocsr() if hasattr(A, 'tocsr') else np.asarray(A, dtype=float)
+        b_vec = np.asarray(b, dtype=float)
+        m, n = matriz.shape
+
+        perezosas = np.array([tipo == '<=' for tipo in tipos])
+        incluidas = ~perezosas
+        incluidas[self.filas_iniciales(matriz, c, tipo_objetivo, perezosas, iniciales)] = True
+
+        self.pasos = []
+        self.reoptimizador.tolerancia = self.solver.tolerancia
+        self.solver.verbose = self.reoptimizador.verbose = self.verbose
+        self.solver.max_iteraciones = self.reoptimizador.max_iteraciones = self.max_iteraciones
+
+        # Resolver el problema restringido inicial
+        while True:
+            filas = np.flatnonzero(incluidas)
+            self.agregar_paso(f"\n📥 Resolviendo con {len(filas)} de {m} restricciones")
+            resultado = self.solver.resolver(list(c), [self.fila(matriz, i) for i in filas],
+                                             [float(b_vec[i]) for i in filas],
+                                             [tipos[i] for i in filas], tipo_objetivo)
+            self.pasos.extend(resultado['pasos'])
+
+            if resultado['factible'] or not resultado.get('ilimitado'):
+                break
+
+            # Ilimitado con un subconjunto: agregar las filas que cortan el rayo
+            pendientes = np.flatnonzero(~incluidas)
+            if len(pendientes) == 0:
+                break
+            nuevas = self.filas_bloqueantes(matriz, b_vec, pendientes, resultado)
+            if nuevas is None:
+                break
+            self.agregar_paso(f"⚠️  Subproblema ilimitado: agregando {len(nuevas)} filas más")
+            incluidas[nuevas] = True
+
+        if not resultado['factible']:
+            resultado['pasos'] = self.pasos
+            resultado['filas_activas'] = list(np.flatnonzero(incluidas))
+            return resultado
+
+        tableau = resultado['tableau']
+        base_vars = resultado['base_vars']
+        self.reoptimizador.eliminar_columnas(tableau, base_vars,
+                                             resultado.get('var_artificiales', []))
+
+        self.agregar_paso("\n" + "=" * 60)
+        self.agregar_paso("📑 GENERACIÓN DE FILAS")
+        self.agregar_paso("=" * 60)
+
+        ronda = 0
+        while ronda < self.max_rondas:
+            x = np.zeros(n)
+            for i, var_base in enumerate(base_vars):
+                if var_base < n:
+                    x[var_base] = tableau[i][-1]
+
+            # Revisar todas las restricciones pendientes en una sola pasada
+            violacion = matriz @ x - b_vec
+            violacion[incluidas] = -np.inf
+            violadas = np.flatnonzero(violacion > self.tolerancia)
+            if len(violadas) == 0:
+                break
+
+            ronda += 1
+            if len(violadas) > self.lote:
+                orden = np.argpartition(-violacion[violadas], self.lote - 1)[:self.lote]
+                violadas = violadas[orden]
+
+            self.agregar_paso(f"➕ Ronda {ronda}: {len(violadas)} restricción(es) violada(s) agregada(s)")
+            for i in violadas:
+                self.reoptimizador.agregar_fila(tableau, base_vars, self.fila(matriz, i), b_vec[i])
+            incluidas[violadas] = True
+
+            reoptimizado = self.reoptimizador.simplex_dual(tableau, base_vars)
+            self.pasos.extend(self.reoptimizador.pasos)
+            self.reoptimizador.pasos = []
+
+            if not reoptimizado['convergido']:
+                if reoptimizado.get('infactible'):
+                    self.agregar_paso("❌ PROBLEMA INFACTIBLE - Las restricciones agregadas son incompatibles")
+                return {
+                    'solucion': None,
+                    'valor_optimo': None,
+                    'factible': False,
+                    'limite_iteraciones': reoptimizado.get('limite_iteraciones', False),
+                    'filas_activas': list(np.flatnonzero(incluidas)),
+                    'rondas': ronda,
+                    'pasos': self.pasos
+                }
+
+        if ronda >= self.max_rondas:
+            self.agregar_paso("⚠️  Máximo número de rondas alcanzado")
+
+        solucion = [0.0] * n
+        for i, var_base in enumerate(base_vars):
+            if var_base < n:
+                solucion[var_base] = tableau[i][-1]
+        valor_optimo = tableau[-1][-1] if tipo_objetivo == 'max' else -tableau[-1][-1]
+
+        self.agregar_paso("\n🎊 SOLUCIÓN ÓPTIMA ENCONTRADA")
+        self.agregar_paso(f"Restricciones en el tableau: {int(incluidas.sum())} de {m}")
+        self.agregar_paso(f"Valor óptimo: {valor_optimo:.4f}")
+
+        return {
+            'solucion': solucion,
+            'valor_optimo': valor_optimo,
+            'factible': True,
+            'filas_activas': list(np.flatnonzero(incluidas)),
+            'rondas': ronda,
+            'tableau': tableau,
+            'base_vars': base_vars,
+            'pasos': self.pasos
+        }
+
+    def filas_iniciales(self, matriz, c, tipo_objetivo, perezosas, iniciales):
+        """
+        Elegir las filas <= del problema restringido inicial
+
+        Sin indicación del usuario se toma, para cada variable que mejora el
+        objetivo, la fila <= con el mayor coeficiente positivo en ella, de
+        modo que el problema inicial no sea trivialmente ilimitado.
+        """
+        if iniciales is not None:
+            iniciales = np.asarray(iniciales)
+            if iniciales.dtype == bool:
+                return np.flatnonzero(iniciales & perezosas)
+            iniciales = iniciales.astype(int)
+            return iniciales[perezosas[iniciales]]
+
+        costos = np.asarray(c, dtype=float)
+        mejoran = costos > 0 if tipo_objetivo == 'max' else costos < 0
+        if not mejoran.any() or not perezosas.any():
+            return np.array([], dtype=int)
+
+        columnas = matriz[:, np.flatnonzero(mejoran)]
+        columnas = columnas.toarray() if hasattr(columnas, 'toarray') else columnas
+        columnas = np.where(perezosas[:, None], columnas, -np.inf)
+        mejores = np.argmax(columnas, axis=0)
+        acotan = columnas[mejores, np.arange(columnas.shape[1])] > 0
+        return np.unique(mejores[acotan])
+
+    def filas_bloqueantes(self, matriz, b_vec, pendientes, resultado):
+        """
+        Elegir las filas pendientes que acotan un subproblema ilimitado
+
+        Se toman las filas con mayor a·r > 0 a lo largo del rayo r devuelto
+        por el solver. Si ninguna corta el rayo pero el punto viola alguna,
+        se agregan las violadas; si tampoco hay violadas, el rayo también
+        prueba que el problema completo es ilimitado y se devuelve None.
+        Sin rayo verificado se agrega el siguiente lote de pendientes.
+        """
+        if resultado.get('rayo') is None:
+            return pendientes[:self.lote]
+
+        avance = matriz[pendientes] @ np.asarray(resultado['rayo'], dtype=float)
+        if not (avance > self.tolerancia).any():
+            avance = matriz[pendientes] @ np.asarray(resultado['punto'], dtype=float) - b_vec[pendientes]
+            if not (avance > self.tolerancia).any():
+                return None
+
+        candidatas = np.flatnonzero(avance > self.tolerancia)
+        if len(candidatas) > self.lote:
+            orden = np.argpartition(-avance[candidatas], self.lote - 1)[:self.lote]
+            candidatas = candidatas[orden]
+        return pendientes[candidatas]
+
+    def fila(self, matriz, i):
+        """Fila i de la matriz como lista de floats"""
+        if hasattr(matriz, 'toarray'):
+            return matriz[[i], :].toarray().ravel().tolist()
+        return matriz[i].tolist()
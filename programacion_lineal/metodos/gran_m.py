@@ -1,27 +1,54 @@
-import numpy as np
-from sympy import symbols, sympify
-from sympy.parsing.sympy_parser import parse_expr
+from time import perf_counter
+
+from .certificados import (certificado_farkas, con_signos_originales, rayo_mejora, resumen,
+                           verificar_certificado, verificar_rayo)
+from .estadisticas import Estadisticas
+from .eventos import consumir, evento_pivoteo, evento_resultado, valor_tableau
+from .implicitas import ColumnasImplicitas
+from .kernels import kernel_para
 
 class GranMSimplex:
     def __init__(self):
         self.M = 1000000  # Valor grande para M
         self.tolerancia = 1e-10
         self.max_iteraciones = 100
+        self.verbose = True  # Imprimir cada paso además de guardarlo
         self.pasos = []
+        self.estadisticas = Estadisticas()  # Tiempos y contadores de la última resolución
+        self.tableau_en_disco = None  # True o un directorio: tableau en numpy.memmap (ver metodos.tableau_numpy)
+        self.hilos = 1  # Hilos para pivotear tableaux grandes (None: todos los núcleos)
+        self.kernel = None  # Backend de metodos.kernels ('python', 'numpy', 'dispersa', 'hilos'; None: automático)
 
     def agregar_paso(self, texto):
         """Agregar un paso al proceso de solución"""
+        self.estadisticas.iniciar('trazas')
         self.pasos.append(texto)
-        print(texto)
+        if self.verbose:
+            print(texto)
+        self.estadisticas.detener()
 
     def resolver(self, c, A, b, tipos, tipo_objetivo):
         """Método principal para resolver con Gran M"""
+        return consumir(self.iter_resolver(c, A, b, tipos, tipo_objetivo))
+
+    def iter_resolver(self, c, A, b, tipos, tipo_objetivo):
+        """Resolver paso a paso: un evento por pivoteo y uno final con el resultado"""
+        self.estadisticas = Estadisticas(self.tolerancia)
+        resultado = yield from self.iterar(c, A, b, tipos, tipo_objetivo)
+        resultado['stats'] = self.estadisticas.como_dict()
+        yield evento_resultado(resultado)
+
+    def iterar(self, c, A, b, tipos, tipo_objetivo):
+        """Generador del método: emite los pivoteos y devuelve el resultado"""
         self.pasos = []
         self.agregar_paso("🎯 INICIANDO MÉTODO DE LA GRAN M")
         self.agregar_paso(f"Tipo de problema: {tipo_objetivo.upper()}")
         
         # Convertir a forma estándar con variables artificiales
+        estadisticas = self.estadisticas
+        estadisticas.iniciar('forma_estandar')
         resultado = self.convertir_forma_estandar(c, A, b, tipos, tipo_objetivo)
+        estadisticas.detener()
         
         if not resultado['factible']:
             return {
@@ -34,50 +61,86 @@ class GranMSimplex:
         tableau = resultado['tableau']
         base_vars = resultado['base_vars']
         var_artificiales = resultado['var_artificiales']
+        implicitas = resultado['implicitas']
+        kernel = resultado['kernel']
         
-        self.mostrar_tableau(tableau, base_vars, 0)
+        self.mostrar_tableau(tableau, base_vars, 0, implicitas)
         
         # Aplicar método simplex
+        inicio_fase = perf_counter()
         iteracion = 1
         while iteracion <= self.max_iteraciones:
             # Verificar optimalidad
-            col_pivote = self.encontrar_columna_pivote(tableau, tipo_objetivo)
+            estadisticas.iniciar('pricing')
+            col_pivote = kernel.columna_pivote(tableau)
+            estadisticas.detener()
             
             if col_pivote == -1:
                 self.agregar_paso("✅ CONDICIÓN DE OPTIMALIDAD ALCANZADA")
                 break
             
             # Encontrar fila pivote
-            fila_pivote = self.encontrar_fila_pivote(tableau, col_pivote)
+            estadisticas.iniciar('razon_minima')
+            fila_pivote = kernel.fila_pivote(tableau, col_pivote)
+            estadisticas.detener()
             
+            entra = implicitas.logicas[col_pivote]
             if fila_pivote == -1:
+                estadisticas.sumar_fase(2, inicio_fase)
                 self.agregar_paso("❌ PROBLEMA ILIMITADO - No hay solución acotada")
+                # Con artificiales en valor la base no da un punto factible: el
+                # problema puede ser infactible y el rayo no prueba nada
+                if any(var_base in var_artificiales and abs(tableau[i][-1]) > self.tolerancia
+                       for i, var_base in enumerate(base_vars)):
+                    rayo = punto = None
+                    self.agregar_paso("⚠️ Artificiales con valor > 0: sin un punto factible no se prueba "
+                                      "que el problema sea ilimitado")
+                else:
+                    rayo = rayo_mejora(kernel.columna(tableau, col_pivote), base_vars, entra, len(c),
+                                       var_artificiales, self.tolerancia)
+                    punto = kernel.extraer_solucion(tableau, base_vars, len(c))
+                    if not verificar_rayo(c, A, b, tipos, tipo_objetivo, rayo, punto):
+                        rayo = punto = None
+                    self.agregar_paso(f"📐 Rayo de mejora: {resumen(rayo, 'x')}" if rayo
+                                      else "⚠️ No se pudo verificar un rayo de mejora desde un punto factible")
                 return {
                     'solucion': None,
                     'valor_optimo': None,
                     'factible': False,
                     'ilimitado': True,
+                    'rayo': rayo,
+                    'punto': punto,
                     'pasos': self.pasos
                 }
             
             self.agregar_paso(f"\n🔄 ITERACIÓN {iteracion}")
-            self.agregar_paso(f"Elemento pivote: Fila {fila_pivote + 1}, Columna {col_pivote + 1} = {tableau[fila_pivote][col_pivote]:.4f}")
+            self.agregar_paso(f"Elemento pivote: Fila {fila_pivote + 1}, Columna {entra + 1} = {tableau[fila_pivote][col_pivote]:.4f}")
             
             # Actualizar variable base
-            base_vars[fila_pivote] = col_pivote
+            sale = base_vars[fila_pivote]
+            base_vars[fila_pivote] = entra
             
-            # Operaciones de pivoteo
-            self.pivotear(tableau, fila_pivote, col_pivote)
-            self.mostrar_tableau(tableau, base_vars, iteracion)
+            # Operaciones de pivoteo (las columnas unitarias de la fila dejan de serlo)
+            estadisticas.registrar_pivoteo(tableau[fila_pivote][col_pivote], tableau[fila_pivote][-1])
+            estadisticas.iniciar('pivoteo')
+            implicitas.materializar(tableau, fila_pivote)
+            kernel.pivotear(tableau, fila_pivote, col_pivote)
+            estadisticas.detener()
+            self.mostrar_tableau(tableau, base_vars, iteracion, implicitas)
+            estadisticas.sumar_fase(2, inicio_fase)
+            yield evento_pivoteo(iteracion, None, entra, sale, valor_tableau(tableau, tipo_objetivo))
+            inicio_fase = perf_counter()
             
             iteracion += 1
         
+        estadisticas.sumar_fase(2, inicio_fase)
         if iteracion > self.max_iteraciones:
             self.agregar_paso("❌ MÁXIMO NÚMERO DE ITERACIONES ALCANZADO")
             return {
                 'solucion': None,
                 'valor_optimo': None,
                 'factible': False,
+                'limite_iteraciones': True,
                 'pasos': self.pasos
             }
         
@@ -90,15 +153,25 @@ class GranMSimplex:
         
         if tiene_var_artificiales:
             self.agregar_paso("❌ PROBLEMA INFACTIBLE - Variables artificiales en la base con valor > 0")
+            columnas = {logica: j for j, logica in enumerate(implicitas.logicas)}
+            certificado = certificado_farkas(kernel, tableau, base_vars, var_artificiales,
+                                             resultado['unitarias'], columnas)
+            certificado = con_signos_originales(certificado, resultado['invertidas'])
+            if verificar_certificado(A, b, tipos, certificado):
+                self.agregar_paso(f"📐 Certificado de Farkas: {resumen(certificado, 'y')}")
+            else:
+                certificado = None
+                self.agregar_paso("⚠️ No se pudo verificar un certificado de Farkas")
             return {
                 'solucion': None,
                 'valor_optimo': None,
                 'factible': False,
+                'certificado': certificado,
                 'pasos': self.pasos
             }
         
         # Extraer solución
-        solucion = self.extraer_solucion(tableau, base_vars, len(c))
+        solucion = kernel.extraer_solucion(tableau, base_vars, len(c))
         valor_optimo = tableau[-1][-1] if tipo_objetivo == 'max' else -tableau[-1][-1]
         
         self.agregar_paso("\n🎊 SOLUCIÓN ÓPTIMA ENCONTRADA")
@@ -108,24 +181,37 @@ class GranMSimplex:
             'solucion': solucion,
             'valor_optimo': valor_optimo,
             'factible': True,
+            'tableau': kernel.como_listas(tableau, implicitas),
+            'base_vars': base_vars,
+            'var_artificiales': var_artificiales,
             'pasos': self.pasos
         }
 
     def convertir_forma_estandar(self, c, A, b, tipos, tipo_objetivo):
-        """Convertir a forma estándar con variables artificiales"""
+        """
+        Convertir a forma estándar con variables artificiales
+
+        Holguras, excesos y artificiales no ocupan columnas en el tableau
+        devuelto: quedan en 'implicitas' hasta que su fila es fila pivote
+        (ver metodos.implicitas). `implicitas.expandir(tableau)` da el
+        tableau completo; 'base_vars' y 'var_artificiales' usan los
+        índices de ese tableau completo.
+        """
         m = len(A)
         n = len(c)
         
         self.agregar_paso("\n📋 CONVERSIÓN A FORMA ESTÁNDAR CON VARIABLES ARTIFICIALES")
         
-        # Verificar factibilidad básica (b >= 0)
+        # Verificar factibilidad básica (b >= 0); el signo se aplica al armar
+        # el tableau, sin escribir en A, b ni tipos (pueden ser de solo lectura)
+        invertidas = []
         for i in range(m):
             if b[i] < 0:
                 self.agregar_paso(f"❌ b[{i}] = {b[i]} < 0. Multiplicando restricción por -1")
-                b[i] = -b[i]
-                for j in range(n):
-                    A[i][j] = -A[i][j]
-                tipos[i] = '>=' if tipos[i] == '<=' else '<=' if tipos[i] == '>=' else '='
+                invertidas.append(i)
+        signos = [-1.0 if b[i] < 0 else 1.0 for i in range(m)]
+        tipos = [{'<=': '>=', '>=': '<='}.get(tipo, tipo) if signo < 0 else tipo
+                 for signo, tipo in zip(signos, tipos)]
         
         # Contar variables necesarias
         num_var_holgura = sum(1 for tipo in tipos if tipo == '<=')
@@ -136,137 +222,73 @@ class GranMSimplex:
         self.agregar_paso(f"Variables de exceso necesarias: {num_var_exceso}")
         self.agregar_paso(f"Variables artificiales necesarias: {num_var_artificiales}")
         
-        # Construir tableau extendido
-        total_cols = n + num_var_holgura + num_var_exceso + num_var_artificiales + 1  # +1 para RHS
-        tableau = []
+        # Construir tableau: variables originales + RHS; holguras, excesos y
+        # artificiales son columnas unitarias implícitas
+        implicitas = ColumnasImplicitas(n)
         base_vars = []
         var_artificiales = []
-        
-        # Construir matriz A extendida
-        for i in range(m):
-            fila = [0.0] * total_cols
-            # Variables originales
-            for j in range(n):
-                fila[j] = float(A[i][j])
-            # RHS
-            fila[-1] = float(b[i])
-            tableau.append(fila)
-        
-        # Agregar variables de holgura, exceso y artificiales
-        col_index = n
+        filas_artificiales = []
         
         for i in range(m):
             if tipos[i] == '<=':
-                tableau[i][col_index] = 1.0  # Variable de holgura
-                base_vars.append(col_index)
-                col_index += 1
-            elif tipos[i] == '>=':
-                tableau[i][col_index] = -1.0  # Variable de exceso
-                col_index += 1
-                tableau[i][col_index] = 1.0  # Variable artificial
-                base_vars.append(col_index)
-                var_artificiales.append(col_index)
-                col_index += 1
-            elif tipos[i] == '=':
-                tableau[i][col_index] = 1.0  # Variable artificial
-                base_vars.append(col_index)
-                var_artificiales.append(col_index)
-                col_index += 1
+                base_vars.append(implicitas.agregar(i, 1.0))  # Variable de holgura
+                continue
+            # Al eliminar la M de la artificial básica (abajo) el exceso queda con +M
+            if tipos[i] == '>=':
+                implicitas.agregar(i, -1.0, self.M)  # Variable de exceso
+            var_art = implicitas.agregar(i, 1.0)  # Variable artificial
+            base_vars.append(var_art)
+            var_artificiales.append(var_art)
+            filas_artificiales.append(i)
         
         # Construir función objetivo con penalización Gran M
-        fila_objetivo = [0.0] * total_cols
-        
-        # Coeficientes originales
-        for j in range(n):
-            fila_objetivo[j] = -float(c[j]) if tipo_objetivo == 'max' else float(c[j])
-        
-        # Penalizar variables artificiales
-        for var_art in var_artificiales:
-            fila_objetivo[var_art] = self.M if tipo_objetivo == 'max' else -self.M
-        
-        tableau.append(fila_objetivo)
-        
-        # Eliminar coeficientes M de las variables artificiales básicas
-        for i in range(len(base_vars)):
-            if base_vars[i] in var_artificiales:
-                factor = fila_objetivo[base_vars[i]]
-                for j in range(total_cols):
-                    fila_objetivo[j] -= factor * tableau[i][j]
+        fila_objetivo = [-float(c[j]) if tipo_objetivo == 'max' else float(c[j]) for j in range(n)]
+        fila_objetivo.append(0.0)
+        
+        # Holguras, excesos y artificiales no ocupan columnas (los backends
+        # de ancho fijo les reservan lugar al final)
+        kernel = kernel_para(self, A, (m + 1) * (implicitas.total + 1))
+        tableau = kernel.crear(A, b, fila_objetivo, n + 1, reservadas=implicitas.total - n, signos=signos)
+        if kernel.nombre != 'python':
+            self.agregar_paso(f"Tableau de {m + 1} x {implicitas.total + 1} con el backend '{kernel.nombre}'"
+                              f"{' en disco' if kernel.directorio else ''}")
+        
+        # Penalizar variables artificiales (la fila objetivo está en forma
+        # de maximización, así que la penalización es +M en ambos casos) y
+        # eliminar esa M porque son básicas: la fila objetivo pierde M veces
+        # cada fila con artificial
+        for i in filas_artificiales:
+            kernel.restar_fila(tableau, -1, i, self.M)
         
         self.agregar_paso(f"Variables artificiales en posiciones: {var_artificiales}")
         
+        # Columna +e_i de cada fila (la básica inicial), para el certificado de Farkas
+        unitarias = list(base_vars)
+        
         return {
             'tableau': tableau,
             'base_vars': base_vars,
             'var_artificiales': var_artificiales,
+            'implicitas': implicitas,
+            'kernel': kernel,
+            'unitarias': unitarias,
+            'invertidas': invertidas,
             'factible': True
         }
 
-    def encontrar_columna_pivote(self, tableau, tipo_objetivo):
-        """Encontrar columna pivote según la regla de entrada"""
-        fila_objetivo = tableau[-1]
-        col_pivote = -1
-        mejor_valor = 0
-        
-        for j in range(len(fila_objetivo) - 1):
-            if tipo_objetivo == 'max':
-                if fila_objetivo[j] < mejor_valor:
-                    mejor_valor = fila_objetivo[j]
-                    col_pivote = j
-            else:
-                if fila_objetivo[j] > mejor_valor:
-                    mejor_valor = fila_objetivo[j]
-                    col_pivote = j
-        
-        return col_pivote
-
-    def encontrar_fila_pivote(self, tableau, col_pivote):
-        """Encontrar fila pivote usando la razón mínima"""
-        fila_pivote = -1
-        menor_ratio = float('inf')
-        
-        for i in range(len(tableau) - 1):
-            if tableau[i][col_pivote] > self.tolerancia:
-                ratio = tableau[i][-1] / tableau[i][col_pivote]
-                if ratio >= 0 and ratio < menor_ratio:
-                    menor_ratio = ratio
-                    fila_pivote = i
-        
-        return fila_pivote
-
-    def pivotear(self, tableau, fila_pivote, col_pivote):
-        """Realizar operaciones de pivoteo"""
-        pivot = tableau[fila_pivote][col_pivote]
-        
-        # Normalizar fila pivote
-        for j in range(len(tableau[0])):
-            tableau[fila_pivote][j] /= pivot
-        
-        # Eliminar en otras filas
-        for i in range(len(tableau)):
-            if i != fila_pivote:
-                factor = tableau[i][col_pivote]
-                for j in range(len(tableau[0])):
-                    tableau[i][j] -= factor * tableau[fila_pivote][j]
-
-    def extraer_solucion(self, tableau, base_vars, num_vars_originales):
-        """Extraer la solución final"""
-        solucion = [0.0] * num_vars_originales
-        
-        for i in range(len(base_vars)):
-            if base_vars[i] < num_vars_originales:
-                solucion[base_vars[i]] = tableau[i][-1]
-        
-        return solucion
-
-    def mostrar_tableau(self, tableau, base_vars, iteracion):
-        """Mostrar el tableau en formato tabular"""
+    def mostrar_tableau(self, tableau, base_vars, iteracion, implicitas=None):
+        """Mostrar el tableau en formato tabular (sin las columnas implícitas)"""
+        self.estadisticas.iniciar('trazas')
         self.agregar_paso(f"\n📊 TABLEAU - ITERACIÓN {iteracion}")
+        if not isinstance(tableau, list):
+            self.agregar_paso(f"({len(tableau) - 1} filas: el tableau solo se muestra con el backend 'python')")
+            self.estadisticas.detener()
+            return
         self.agregar_paso("=" * 50)
         
         # Encabezados
         encabezado = "Base\t"
-        for j in range(len(tableau[0]) - 1):
+        for j in (implicitas.logicas if implicitas is not None else range(len(tableau[0]) - 1)):
             encabezado += f"x{j + 1}\t"
         encabezado += "RHS"
         self.agregar_paso(encabezado)
@@ -284,94 +306,16 @@ class GranMSimplex:
         for j in range(len(tableau[0])):
             fila_obj += f"{tableau[-1][j]:.3f}\t"
         self.agregar_paso(fila_obj)
-
-
-def leer_funcion_objetivo():
-    """Leer y procesar la función objetivo"""
-    entrada = input("Introduce la función objetivo: ").strip()
-
-    if entrada.lower().startswith("max"):
-        tipo = "max"
-        expr_str = entrada[3:].strip()
-    elif entrada.lower().startswith("min"):
-        tipo = "min"
-        expr_str = entrada[3:].strip()
-    else:
-        expr_str = entrada
-        tipo = input("¿El problema es de Maximización o Minimización? (Escribe 'max' o 'min'): ").strip().lower()
-
-    try:
-        expr = sympify(expr_str)
-    except Exception as e:
-        print("Error al analizar la función objetivo:", e)
-        return None, None, None, None
-
-    variables = sorted(expr.free_symbols, key=lambda x: x.name)
-    coeficientes = [float(expr.coeff(var)) for var in variables]
-
-    return tipo, expr, variables, coeficientes
-
-
-def leer_restricciones(variables):
-    """Leer y procesar las restricciones"""
-    num_restricciones = int(input("¿Cuántas restricciones deseas ingresar?: "))
-    restricciones = []
-    resultados = []
-    relaciones = []
-
-    for i in range(num_restricciones):
-        restr = input(f"Restricción {i + 1}: ").strip()
-
-        # Determinar el tipo de relación
-        if "<=" in restr:
-            izquierda_str, derecha_str = restr.split("<=")
-            relacion = "<="
-        elif ">=" in restr:
-            izquierda_str, derecha_str = restr.split(">=")
-            relacion = ">="
-        elif "=" in restr and "<=" not in restr and ">=" not in restr:
-            izquierda_str, derecha_str = restr.split("=")
-            relacion = "="
-        else:
-            print("Error: Formato de restricción no válido. Use '<=', '>=' o '='")
-            return None, None, None
-
-        try:
-            izquierda = sympify(izquierda_str.strip())
-            derecha = sympify(derecha_str.strip())
-        except Exception as e:
-            print(f"Error al procesar la restricción {i+1}:", e)
-            return None, None, None
-
-        # Extraer coeficientes
-        coef_restriccion = []
-        for var in variables:
-            coef = float(izquierda.coeff(var))
-            coef_restriccion.append(coef)
-
-        restricciones.append(coef_restriccion)
-        resultados.append(float(derecha))
-        relaciones.append(relacion)
-
-    return restricciones, resultados, relaciones
-
-
-def mostrar_resumen(tipo, funcion_objetivo, variables, coef_objetivo,
-                    matriz_restricciones, vector_resultados, relaciones):
-    """Mostrar resumen del problema"""
-    print("\n--- Resumen del Problema de Programación Lineal ---")
-    print(f"\nFunción objetivo: {funcion_objetivo}")
-    print(f"Tipo de problema: {tipo.upper()}")
-    print(f"Variables detectadas: {variables}")
-    print(f"Vector de coeficientes de la función objetivo: {coef_objetivo}")
-    print("\nRestricciones:")
-    for i, (coefs, rel, result) in enumerate(zip(matriz_restricciones, relaciones, vector_resultados)):
-        restriccion_str = " + ".join([f"{coef}*{var}" for coef, var in zip(coefs, variables) if coef != 0])
-        print(f"  {restriccion_str} {rel} {result}")
+        if implicitas is not None and implicitas.pendientes:
+            omitidas = ', '.join(f"x{j + 1}" for j in implicitas.sin_materializar())
+            self.agregar_paso(f"Columnas unitarias sin mostrar: {omitidas}")
+        self.estadisticas.detener()
 
 
 def ejecutar_gran_m():
     """Función principal para ejecutar el método de la Gran M"""
+    from utils.validadores import leer_funcion_objetivo, leer_restricciones, mostrar_resumen
+
     print("🚀 MÉTODO DE LA GRAN M - PROGRAMACIÓN LINEAL")
     print("=" * 50)
     
@@ -413,7 +357,7 @@ def ejecutar_gran_m():
         print(f"🎯 Valor óptimo: {resultado['valor_optimo']:.4f}")
         print("📍 Solución óptima:")
         for i, valor in enumerate(resultado['solucion']):
-            print(f"  x{i+1} = {valor:.4f}")
+            print(f"  {variables[i]} = {valor:.4f}")
     elif resultado.get('ilimitado'):
         print("❌ PROBLEMA ILIMITADO")
         print("El problema no tiene solución acotada.")
@@ -0,0 +1,73 @@
+"""
+Columnas de holgura, exceso y artificiales sin materializar
+
+En el tableau inicial cada una de estas columnas es ±e_i: un único
+coeficiente, en la fila de su restricción. Un pivoteo sobre la fila r solo
+modifica las columnas con coeficiente no nulo en la fila r, así que la
+columna unitaria de la fila i sigue igual (también su entrada en la fila
+objetivo) mientras la fila i no sea fila pivote. Mientras tanto tampoco
+puede entrar a la base: la holgura o la artificial de la fila i sigue
+siendo la básica de esa fila (costo reducido 0) y el exceso de una fila
+>= conserva en Gran M su costo reducido +M.
+
+El tableau de trabajo guarda entonces solo las columnas originales, el RHS
+y las columnas que ya dejaron de ser unitarias: justo antes de pivotear
+por primera vez en una fila, sus columnas implícitas se agregan al final
+(antes del RHS) y desde ahí se pivotean como las demás. Con m ≈ n el
+tableau pasa de m × (n + m) columnas (n + 2m en Gran M) a m × (n + filas
+ya pivoteadas).
+
+Fuera del tableau de trabajo los índices de columna son siempre los
+lógicos, los del tableau completo: variables originales primero y luego
+holguras, excesos y artificiales en el orden de las filas. Así quedan
+base_vars, var_artificiales y los eventos de iter_resolver.
+
+Los tableaux de numpy y dispersos (ver metodos.kernels) tienen ancho fijo:
+se crean con lugar para todas las columnas lógicas, el RHS en la última, y
+cada columna materializada ocupa la primera posición libre después de las
+ya usadas.
+"""
+
+
+class ColumnasImplicitas:
+    def __init__(self, num_originales):
+        self.logicas = list(range(num_originales))  # Índice lógico de cada columna del tableau de trabajo
+        self.pendientes = {}  # fila -> [(índice lógico, signo, entrada en la fila objetivo)]
+        self.total = num_originales
+
+    def agregar(self, fila, signo, entrada_objetivo=0.0):
+        """Registrar la columna signo·e_fila y devolver su índice lógico"""
+        logica = self.total
+        self.total += 1
+        self.pendientes.setdefault(fila, []).append((logica, signo, entrada_objetivo))
+        return logica
+
+    def materializar(self, tableau, fila):
+        """Agregar al tableau las columnas unitarias de `fila` (antes de pivotear en ella)"""
+        for logica, signo, entrada_objetivo in self.pendientes.pop(fila, ()):
+            if isinstance(tableau, list):
+                for fila_tableau in tableau:
+                    fila_tableau.insert(-1, 0.0)
+                columna = -2
+            else:
+                columna = len(self.logicas)  # Primera columna libre del tableau de ancho fijo
+            tableau[fila][columna] = signo
+            tableau[-1][columna] = entrada_objetivo
+            self.logicas.append(logica)
+
+    def sin_materializar(self):
+        """Índices lógicos de las columnas que siguen implícitas"""
+        return sorted(logica for columnas in self.pendientes.values() for logica, _, _ in columnas)
+
+    def expandir(self, tableau):
+        """Tableau completo, con todas las columnas en el orden lógico"""
+        completo = [[0.0] * (self.total + 1) for _ in tableau]
+        for fila, destino in zip(tableau, completo):
+            for j, logica in enumerate(self.logicas):
+                destino[logica] = fila[j]
+            destino[-1] = fila[-1]
+        for fila, columnas in self.pendientes.items():
+            for logica, signo, entrada_objetivo in columnas:
+                completo[fila][logica] = signo
+                completo[-1][logica] = entrada_objetivo
+        return completo
@@ -0,0 +1,414 @@
+"""
+Operaciones sobre el tableau, intercambiables por backend
+
+Simplex Tradicional, Gran M y Dos Fases arman el tableau y lo recorren
+solo a través de un kernel: crear el tableau, elegir columna y fila
+pivote, pivotear, combinar filas, quitar filas o columnas y extraer la
+solución o los certificados (ver metodos.certificados). Una mejora en un
+backend llega así a los tres métodos.
+
+Backends registrados en BACKENDS:
+
+- 'python': listas de Python. Es el único que deja el tableau en las
+  trazas (y las razones y operaciones de pivoteo de Simplex Tradicional).
+- 'numpy': arreglo denso de numpy; con `tableau_en_disco`, un memmap
+  (ver metodos.tableau_numpy).
+- 'dispersa': filas como dict {columna: valor}, en Python puro. El
+  pivoteo solo recorre los no nulos de la fila pivote en las filas con
+  coeficiente en la columna pivote. Con el relleno de los pivoteos
+  numpy denso termina siendo más rápido; este backend es para modelos
+  muy dispersos cuyo tableau denso no cabe en memoria.
+- 'hilos': como 'numpy', con el pivoteo, el pricing y la razón mínima
+  repartidos entre `hilos` hilos (todos los núcleos si es None).
+
+Con `solver.kernel = None` (por defecto) `elegir` decide según el tamaño
+del tableau, la densidad de A, las trazas (`verbose`) y los hilos; con un
+nombre se usa ese backend. Todos aplican las mismas reglas de entrada
+(primer costo más negativo) y salida (primera razón mínima), así que los
+pivoteos coinciden entre backends salvo redondeo.
+
+En la razón mínima un RHS apenas negativo por redondeo cuenta como 0: la
+fila sigue siendo candidata (con razón 0) en lugar de quedar fuera y
+volverse más negativa con el pivoteo.
+
+El resultado de `resolver` trae el tableau como listas con cualquier
+backend, salvo en disco ('tableau' es None).
+"""
+
+MAX_CELDAS_TRAZAS = 20_000           # Con verbose, tableaux hasta este tamaño se muestran (backend 'python')
+MIN_CELDAS_NUMPY = 5_000             # Por debajo, las listas cuestan menos que cargar numpy (~0.07 s)
+MIN_CELDAS_DISPERSA = 100_000_000    # Tableau denso de 800 MB: desde ahí, con A dispersa, solo los no nulos
+DENSIDAD_DISPERSA = 0.01             # Densidad de A hasta la que se usa el backend 'dispersa'
+
+
+class KernelPython:
+    """Tableau como lista de filas (listas de Python)"""
+    nombre = 'python'
+
+    def __init__(self, tolerancia=1e-10, hilos=1, directorio=None):
+        self.tolerancia = tolerancia
+        self.hilos = hilos
+        self.directorio = directorio
+
+    def crear(self, A, b, fila_objetivo, columnas, reservadas=0, signos=None):
+        """
+        Tableau con A, b y la fila objetivo
+
+        Args:
+            fila_objetivo: Coeficientes de las columnas de A más el RHS
+            columnas: Ancho del tableau con el RHS (las columnas entre A y
+                el RHS quedan en 0)
+            reservadas: Columnas implícitas que se agregarán después; los
+                backends de ancho fijo las reservan desde el principio
+            signos: Factor 1.0 o -1.0 por fila de A y b (filas invertidas
+                en el tableau); A y b no se modifican
+        """
+        n = len(fila_objetivo) - 1
+        relleno = [0.0] * (columnas - n - 1)
+        tableau = []
+        for i in range(len(A)):
+            fila = [float(A[i][j]) for j in range(n)]
+            fila.extend(relleno)
+            fila.append(float(b[i]))  # RHS
+            if signos is not None and signos[i] < 0:
+                fila = [0.0 - valor for valor in fila]  # Sin -0.0 en las trazas
+            tableau.append(fila)
+        tableau.append([float(valor) for valor in fila_objetivo[:-1]] + relleno + [float(fila_objetivo[-1])])
+        return tableau
+
+    def columnas(self, tableau):
+        """Ancho del tableau, con el RHS"""
+        return len(tableau[0])
+
+    def columna_pivote(self, tableau):
+        """Columna con el costo más negativo de la fila objetivo (forma max), o -1"""
+        fila_objetivo = tableau[-1]
+        col_pivote = -1
+        mejor_valor = -self.tolerancia
+
+        for j in range(len(fila_objetivo) - 1):
+            if fila_objetivo[j] < mejor_valor:
+                mejor_valor = fila_objetivo[j]
+                col_pivote = j
+
+        return col_pivote
+
+    def fila_pivote(self, tableau, col_pivote, traza=None):
+        """Fila con la razón mínima sobre la columna pivote, o -1 (traza: función que recibe cada razón)"""
+        fila_pivote = -1
+        menor_ratio = float('inf')
+
+        for i in range(len(tableau) - 1):
+            coeficiente = tableau[i][col_pivote]
+            if coeficiente > self.tolerancia:
+                ratio = max(tableau[i][-1], 0.0) / coeficiente
+                if traza:
+                    traza(f"  Fila {i + 1}: {tableau[i][-1]:.3f} / {coeficiente:.3f} = {ratio:.3f}")
+                if ratio < menor_ratio:
+                    menor_ratio = ratio
+                    fila_pivote = i
+            elif traza:
+                traza(f"  Fila {i + 1}: No válida (coeficiente ≤ 0)")
+
+        return fila_pivote
+
+    def pivotear(self, tableau, fila_pivote, col_pivote, traza=None):
+        """Pivoteo en el lugar (traza: función que recibe cada operación de fila)"""
+        fila_p = tableau[fila_pivote]
+        pivot = fila_p[col_pivote]
+        if traza:
+            traza(f"\n⚙️ Operaciones de pivoteo:")
+            traza(f"Normalizando fila pivote (dividiendo por {pivot:.4f})")
+            traza("Eliminando en otras filas:")
+
+        # Normalizar fila pivote
+        fila_p[:] = [valor / pivot for valor in fila_p]
+
+        # Eliminar en otras filas (las que ya tienen 0 en la columna no cambian)
+        for i, fila in enumerate(tableau):
+            factor = fila[col_pivote]
+            if i != fila_pivote and factor != 0.0:
+                if traza and abs(factor) > self.tolerancia:
+                    traza(f"  Fila {i + 1}: R{i + 1} - ({factor:.3f}) * R{fila_pivote + 1}")
+                fila[:] = [valor - factor * p for valor, p in zip(fila, fila_p)]
+
+    def restar_fila(self, tableau, destino, origen, factor):
+        """Fila destino -= factor * fila origen"""
+        fila = tableau[destino]
+        for j, valor in enumerate(tableau[origen]):
+            fila[j] -= factor * valor
+
+    def fijar_fila(self, tableau, fila, valores):
+        """Reemplazar una fila: `valores` en las primeras columnas y 0 en el resto (RHS incluido)"""
+        tableau[fila][:] = [float(valor) for valor in valores] + [0.0] * (len(tableau[fila]) - len(valores))
+
+    def quitar(self, tableau, filas=(), columnas=()):
+        """Nuevo tableau sin las filas y columnas dadas (índices no negativos)"""
+        filas, columnas = set(filas), set(columnas)
+        return [[valor for j, valor in enumerate(fila) if j not in columnas]
+                for i, fila in enumerate(tableau) if i not in filas]
+
+    def columna(self, tableau, col):
+        """Coeficientes de una columna en las filas de restricción"""
+        return [tableau[i][col] for i in range(len(tableau) - 1)]
+
+    def sumar_filas(self, tableau, filas):
+        """Suma de las filas dadas, con el RHS al final"""
+        suma = [0.0] * self.columnas(tableau)
+        for i in filas:
+            suma = [total + valor for total, valor in zip(suma, tableau[i])]
+        return suma
+
+    def extraer_solucion(self, tableau, base_vars, num_vars_originales):
+        """Valores de las variables originales (0 las no básicas)"""
+        solucion = [0.0] * num_vars_originales
+
+        for i, var_base in enumerate(base_vars):
+            if 0 <= var_base < num_vars_originales:
+                solucion[var_base] = float(tableau[i][-1])
+
+        return solucion
+
+    def como_listas(self, tableau, implicitas=None):
+        """Tableau completo como listas, en el orden lógico de las columnas (None si no cabe en memoria)"""
+        return implicitas.expandir(tableau) if implicitas is not None else tableau
+
+
+class FilaDispersa(dict):
+    """Fila {columna: valor}: el RHS está en la clave -1 y las ausentes valen 0"""
+
+    def __missing__(self, columna):
+        return 0.0
+
+
+class TableauDisperso:
+    """Lista de FilaDispersa con ancho fijo (indexable como el tableau de listas)"""
+
+    def __init__(self, filas, columnas):
+        self.filas = filas
+        self.columnas = columnas
+
+    def __getitem__(self, i):
+        return self.filas[i]
+
+    def __len__(self):
+        return len(self.filas)
+
+    def __iter__(self):
+        return iter(self.filas)
+
+
+class KernelDisperso(KernelPython):
+    """Tableau disperso: cada fila guarda solo sus coeficientes no nulos"""
+    nombre = 'dispersa'
+
+    def crear(self, A, b, fila_objetivo, columnas, reservadas=0, signos=None):
+        n = len(fila_objetivo) - 1
+        filas = []
+        for i in range(len(A)):
+            signo = 1.0 if signos is None else signos[i]
+            fila = FilaDispersa((j, signo * float(valor)) for j, valor in enumerate(A[i]) if valor)
+            fila[-1] = signo * float(b[i])
+            filas.append(fila)
+        objetivo = FilaDispersa((j, float(valor)) for j, valor in enumerate(fila_objetivo[:n]) if valor)
+        objetivo[-1] = float(fila_objetivo[-1])
+        filas.append(objetivo)
+        return TableauDisperso(filas, columnas + reservadas)
+
+    def columnas(self, tableau):
+        return tableau.columnas
+
+    def columna_pivote(self, tableau):
+        # Empates: gana la columna de menor índice, como en el recorrido de las listas
+        candidata = min(((valor, j) for j, valor in tableau[-1].items() if j != -1), default=(0.0, -1))
+        return candidata[1] if candidata[0] < -self.tolerancia else -1
+
+    def fila_pivote(self, tableau, col_pivote, traza=None):
+        fila_pivote = -1
+        menor_ratio = float('inf')
+
+        for i in range(len(tableau) - 1):
+            fila = tableau[i]
+            coeficiente = fila.get(col_pivote, 0.0)
+            if coeficiente > self.tolerancia:
+                ratio = max(fila[-1], 0.0) / coeficiente
+                if ratio < menor_ratio:
+                    menor_ratio = ratio
+                    fila_pivote = i
+
+        return fila_pivote
+
+    def pivotear(self, tableau, fila_pivote, col_pivote, traza=None):
+        fila_p = tableau[fila_pivote]
+        pivot = fila_p[col_pivote]
+        for j in fila_p:
+            fila_p[j] /= pivot
+        no_nulos = list(fila_p.items())
+
+        for i, fila in enumerate(tableau):
+            factor = fila.get(col_pivote)
+            if i == fila_pivote or not factor:
+                continue
+            for j, valor in no_nulos:
+                nuevo = fila.get(j, 0.0) - factor * valor
+                if nuevo == 0.0 and j != -1:
+                    fila.pop(j, None)
+                else:
+                    fila[j] = nuevo
+
+    def restar_fila(self, tableau, destino, origen, factor):
+        fila = tableau[destino]
+        for j, valor in tableau[origen].items():
+            fila[j] = fila.get(j, 0.0) - factor * valor
+
+    def fijar_fila(self, tableau, fila, valores):
+        nueva = FilaDispersa((j, float(valor)) for j, valor in enumerate(valores) if valor)
+        nueva[-1] = 0.0
+        tableau.filas[fila] = nueva
+
+    def sumar_filas(self, tableau, filas):
+        suma = [0.0] * tableau.columnas
+        for i in filas:
+            for j, valor in tableau[i].items():
+                suma[j] += valor  # El RHS (clave -1) queda al final
+        return suma
+
+    def quitar(self, tableau, filas=(), columnas=()):
+        filas, quitadas = set(filas), set(columnas)
+        # Cada columna que queda se corre tantos lugares como columnas quitadas tiene antes
+        nuevo_indice = {-1: -1}
+        for j in range(tableau.columnas - 1):
+            if j not in quitadas:
+                nuevo_indice[j] = len(nuevo_indice) - 1
+
+        nuevas = [FilaDispersa((nuevo_indice[j], valor) for j, valor in fila.items() if j in nuevo_indice)
+                  for i, fila in enumerate(tableau) if i not in filas]
+        return TableauDisperso(nuevas, len(nuevo_indice))
+
+    def como_listas(self, tableau, implicitas=None):
+        if implicitas is not None:
+            return implicitas.expandir(tableau)
+        return [[fila[j] for j in range(tableau.columnas - 1)] + [fila[-1]] for fila in tableau]
+
+
+class KernelNumpy(KernelPython):
+    """Tableau como arreglo de numpy (memmap si hay directorio), ver metodos.tableau_numpy"""
+    nombre = 'numpy'
+
+    def __init__(self, tolerancia=1e-10, hilos=1, directorio=None):
+        super().__init__(tolerancia, 1, directorio)  # Un solo hilo (ver KernelHilos)
+
+    def crear(self, A, b, fila_objetivo, columnas, reservadas=0, signos=None):
+        from .tableau_numpy import desde_filas
+        return desde_filas(A, b, fila_objetivo, columnas + reservadas, self.directorio, signos)
+
+    def columnas(self, tableau):
+        return tableau.shape[1]
+
+    def columna_pivote(self, tableau):
+        from .tableau_numpy import columna_pivote
+        return columna_pivote(tableau, self.tolerancia, self.hilos)
+
+    def fila_pivote(self, tableau, col_pivote, traza=None):
+        from .tableau_numpy import fila_pivote
+        return fila_pivote(tableau, col_pivote, self.tolerancia, self.hilos)
+
+    def pivotear(self, tableau, fila_pivote, col_pivote, traza=None):
+        from .tableau_numpy import pivotear
+        pivotear(tableau, fila_pivote, col_pivote, self.hilos)
+
+    def restar_fila(self, tableau, destino, origen, factor):
+        tableau[destino] -= factor * tableau[origen]
+
+    def fijar_fila(self, tableau, fila, valores):
+        tableau[fila] = 0.0
+        tableau[fila, :len(valores)] = valores
+
+    def columna(self, tableau, col):
+        return tableau[:-1, col].tolist()
+
+    def sumar_filas(self, tableau, filas):
+        suma = tableau[0] * 0.0
+        for i in filas:
+            suma += tableau[i]
+        return suma.tolist()
+
+    def quitar(self, tableau, filas=(), columnas=()):
+        from .tableau_numpy import quitar
+        return quitar(tableau, filas, columnas, self.directorio)
+
+    def como_listas(self, tableau, implicitas=None):
+        if self.directorio:
+            return None
+        from .tableau_numpy import expandir
+        return expandir(tableau, implicitas)
+
+
+class KernelHilos(KernelNumpy):
+    """Arreglo de numpy con pivoteo, pricing y razón mínima en varios hilos"""
+    nombre = 'hilos'
+
+    def __init__(self, tolerancia=1e-10, hilos=None, directorio=None):
+        KernelPython.__init__(self, tolerancia, None if hilos == 1 else hilos, directorio)
+
+
+BACKENDS = {
+    'python': KernelPython,
+    'numpy': KernelNumpy,
+    'dispersa': KernelDisperso,
+    'hilos': KernelHilos,
+}
+
+
+def elegir(celdas, densidad=1.0, trazas=False, hilos=1, directorio=None):
+    """
+    Backend para un tableau de `celdas` coeficientes
+
+    Args:
+        densidad: Proporción de coeficientes no nulos de A
+        trazas: Si se quieren ver los pasos (verbose)
+        hilos: Hilos pedidos (None: todos los núcleos)
+        directorio: Tableau en disco (ver metodos.tableau_numpy)
+    """
+    varios_hilos = hilos is None or hilos > 1
+    if directorio:
+        return 'hilos' if varios_hilos else 'numpy'
+    if celdas < MIN_CELDAS_NUMPY or (trazas and celdas <= MAX_CELDAS_TRAZAS):
+        return 'python'
+    if celdas >= MIN_CELDAS_DISPERSA and densidad <= DENSIDAD_DISPERSA:
+        return 'dispersa'
+    return 'hilos' if varios_hilos else 'numpy'
+
+
+def densidad(A, columnas):
+    """Proporción de coeficientes no nulos de A (lista de listas, arreglo o matriz dispersa)"""
+    if not columnas:
+        return 1.0
+    if hasattr(A, 'nnz'):
+        no_nulos = A.nnz
+    elif hasattr(A, 'shape'):
+        import numpy as np
+        no_nulos = int(np.count_nonzero(A))
+    else:
+        no_nulos = sum(1 for fila in A for valor in fila if valor)
+    return no_nulos / (len(A) * columnas)
+
+
+def kernel_para(solver, A, celdas):
+    """
+    Kernel que usa `solver` para un tableau de `celdas` coeficientes
+
+    Lee del solver 'kernel' (nombre en BACKENDS o None para elegir),
+    'tolerancia', 'verbose', 'hilos' y 'tableau_en_disco'.
+    """
+    nombre = solver.kernel
+    directorio = solver.tableau_en_disco
+    if nombre is None:
+        # Contar los no nulos de A solo si la elección puede depender de eso
+        proporcion = densidad(A, len(A[0])) if celdas >= MIN_CELDAS_DISPERSA and len(A) else 1.0
+        nombre = elegir(celdas, proporcion, solver.verbose, solver.hilos, directorio)
+    if nombre not in BACKENDS:
+        raise ValueError(f"Backend desconocido: {nombre} (disponibles: {', '.join(BACKENDS)})")
+    if directorio and not issubclass(BACKENDS[nombre], KernelNumpy):
+        raise ValueError(f"El backend '{nombre}' no admite tableau en disco: use 'numpy' o 'hilos'")
+    return BACKENDS[nombre](solver.tolerancia, solver.hilos, directorio)
@@ -0,0 +1,85 @@
+"""
+Resolución de problemas en procesos de trabajo
+
+Los métodos imprimen cada paso y guardan el tableau completo en el
+resultado. Para repartir subproblemas entre procesos se usa esta función
+de nivel de módulo (serializable con pickle), que resuelve en silencio y
+devuelve solo las claves necesarias para combinar resultados.
+"""
+
+from .simplex import SimplexTradicional
+from .gran_m import GranMSimplex
+from .dos_fases import DosFasesSimplex
+from .simplex_dual import SimplexDual
+from .simplex_redes import SimplexRedes
+
+METODOS = {
+    'SimplexTradicional': SimplexTradicional,
+    'GranMSimplex': GranMSimplex,
+    'DosFasesSimplex': DosFasesSimplex,
+    'SimplexDual': SimplexDual,
+    'SimplexRedes': SimplexRedes,
+}
+
+
+def resolver_en_proceso(metodo, c, A, b, tipos, tipo_objetivo, opciones=None):
+    """
+    Resolver un problema sin imprimir pasos
+
+    Args:
+        metodo: Nombre de la clase del método (clave de METODOS)
+        c, A, b, tipos, tipo_objetivo: Problema a resolver
+        opciones: Atributos a fijar en el solver (p. ej. max_iteraciones)
+
+    Returns:
+        dict: 'solucion', 'valor_optimo', 'factible', 'ilimitado',
+              'certificado', 'rayo' y 'punto' (ver metodos.certificados), 'mensaje'
+              'estado' (ver estado_resultado) y 'stats' (None si el método
+              no los lleva)
+    """
+    solver = METODOS[metodo]()
+    solver.verbose = False
+    for nombre, valor in (opciones or {}).items():
+        setattr(solver, nombre, valor)
+
+    resultado = solver.resolver(c, A, b, tipos, tipo_objetivo)
+
+    return {
+        'solucion': resultado['solucion'],
+        'valor_optimo': resultado['valor_optimo'],
+        'factible': resultado['factible'],
+        'ilimitado': resultado.get('ilimitado', False),
+        'certificado': resultado.get('certificado'),
+        'rayo': resultado.get('rayo'),
+        'punto': resultado.get('punto'),
+        'mensaje': resultado.get('mensaje'),
+        'estado': estado_resultado(resultado),
+        'stats': resultado.get('stats')
+    }
+
+
+def estado_resultado(resultado):
+    """
+    Clasificar el final de una resolución
+
+    Los métodos marcan con 'limite_iteraciones' los resultados que se
+    cortaron por el máximo de iteraciones (o de un bloque o reoptimización
+    interna), sin veredicto sobre el problema.
+
+    Returns:
+        str: 'optimo', 'ilimitado', 'infactible', 'no_aplicable' (el método
+             rechazó el problema, p. ej. Simplex Tradicional con filas >=)
+             o 'limite_iteraciones'
+    """
+    if resultado['factible']:
+        return 'optimo'
+    if resultado.get('ilimitado'):
+        return 'ilimitado'
+    if resultado.get('limite_iteraciones'):
+        return 'limite_iteraciones'
+    mensaje = resultado.get('mensaje') or ''
+    if 'infactible' in mensaje.lower():
+        return 'infactible'
+    if mensaje:
+        return 'no_aplicable'
+    return 'infactible'
@@ -0,0 +1,211 @@
+"""
+Planos de corte de Gomory sobre el tableau óptimo
+
+Toma el tableau final de cualquiera de los métodos de resolución, genera
+cortes de Gomory enteros-mixtos (GMI) a partir de las filas cuya variable
+básica entera tiene valor fraccionario, los agrega como filas nuevas y
+reoptimiza con simplex dual sin reconstruir el tableau.
+"""
+
+import math
+
+from .dos_fases import DosFasesSimplex
+from .reoptimizacion import Reoptimizador
+
+
+class PlanosCorteGomory:
+    def __init__(self, solver=None):
+        self.solver = solver if solver is not None else DosFasesSimplex()
+        self.reoptimizador = Reoptimizador()
+        self.tolerancia = 1e-10
+        self.tolerancia_entera = 1e-6
+        self.max_rondas = 10
+        self.max_cortes_ronda = 5
+        self.densidad_maxima = 1.0  # Fracción máxima de coeficientes no nulos por corte
+        self.verbose = True  # Imprimir cada paso además de guardarlo
+        self.pasos = []
+
+    def agregar_paso(self, texto):
+        """Agregar un paso al proceso de solución"""
+        self.pasos.append(texto)
+        if self.verbose:
+            print(texto)
+
+    def resolver(self, c, A, b, tipos, tipo_objetivo, enteras=None):
+        """
+        Resolver la relajación lineal y ajustarla con rondas de cortes de Gomory
+
+        Args:
+            c, A, b, tipos, tipo_objetivo: Problema en el formato de los métodos
+            enteras: Índices de las variables enteras (por defecto todas)
+
+        Returns:
+            dict: Resultado con las claves habituales más 'entera',
+                  'cortes_agregados' y 'rondas'
+        """
+        enteras = set(range(len(c)) if enteras is None else enteras)
+
+        self.solver.verbose = self.reoptimizador.verbose = self.verbose
+        resultado = self.solver.resolver(c, A, b, tipos, tipo_objetivo)
+        self.pasos = list(resultado['pasos'])
+
+        if not resultado['factible']:
+            return resultado
+
+        tableau = resultado['tableau']
+        base_vars = resultado['base_vars']
+
+        # Las artificiales no básicas están fijas en cero: se descartan
+        self.reoptimizador.tolerancia = self.tolerancia
+        self.reoptimizador.eliminar_columnas(tableau, base_vars,
+                                             resultado.get('var_artificiales', []))
+
+        self.agregar_paso("\n" + "=" * 60)
+        self.agregar_paso("✂️ PLANOS DE CORTE DE GOMORY")
+        self.agregar_paso("=" * 60)
+
+        total_cortes = 0
+        ronda = 0
+        while ronda < self.max_rondas:
+            cortes = self.generar_cortes(tableau, base_vars, enteras)
+            if cortes is None:
+                self.agregar_paso("❌ PROBLEMA ENTERO INFACTIBLE - Una fila fija una variable entera en un valor fraccionario")
+                return {
+                    'solucion': None,
+                    'valor_optimo': None,
+                    'factible': False,
+                    'entera': False,
+                    'mensaje': 'El problema entero es infactible',
+                    'cortes_agregados': total_cortes,
+                    'rondas': ronda,
+                    'pasos': self.pasos
+                }
+            if not cortes:
+                break
+
+            ronda += 1
+            self.agregar_paso(f"\n🔪 RONDA {ronda}: {len(cortes)} corte(s) agregado(s)")
+
+            for coeficientes in cortes:
+                # Corte g·x >= 1  ->  -g·x <= -1
+                self.reoptimizador.agregar_fila(tableau, base_vars,
+                                                [-g for g in coeficientes], -1.0)
+            total_cortes += len(cortes)
+
+            reoptimizado = self.reoptimizador.simplex_dual(tableau, base_vars)
+            self.pasos.extend(self.reoptimizador.pasos)
+            self.reoptimizador.pasos = []
+
+            if not reoptimizado['convergido']:
+                if reoptimizado.get('infactible'):
+                    self.agregar_paso("❌ PROBLEMA ENTERO INFACTIBLE - Los cortes vacían la región factible")
+                return {
+                    'solucion': None,
+                    'valor_optimo': None,
+                    'factible': False,
+                    'limite_iteraciones': reoptimizado.get('limite_iteraciones', False),
+                    'cortes_agregados': total_cortes,
+                    'rondas': ronda,
+                    'pasos': self.pasos
+                }
+
+        solucion = [0.0] * len(c)
+        for i, var_base in enumerate(base_vars):
+            if var_base < len(c):
+                solucion[var_base] = tableau[i][-1]
+        valor_optimo = tableau[-1][-1] if tipo_objetivo == 'max' else -tableau[-1][-1]
+
+        es_entera = all(self.fraccion(solucion[j]) <= self.tolerancia_entera
+                        or self.fraccion(solucion[j]) >= 1 - self.tolerancia_entera
+                        for j in enteras)
+
+        self.agregar_paso(f"\n📊 Cortes agregados: {total_cortes} en {ronda} ronda(s)")
+        if es_entera:
+            self.agregar_paso("🎊 SOLUCIÓN ENTERA ENCONTRADA")
+        else:
+            self.agregar_paso("⚠️  Relajación ajustada, la solución sigue siendo fraccionaria")
+        self.agregar_paso(f"Valor óptimo: {valor_optimo:.4f}")
+
+        return {
+            'solucion': solucion,
+            'valor_optimo': valor_optimo,
+            'factible': True,
+            'entera': es_entera,
+            'cortes_agregados': total_cortes,
+            'rondas': ronda,
+            'tableau': tableau,
+            'base_vars': base_vars,
+            'pasos': self.pasos
+        }
+
+    def generar_cortes(self, tableau, base_vars, enteras):
+        """
+        Generar los cortes GMI de una ronda
+
+        Se eligen las filas cuya variable básica entera está más cerca de
+        tener parte fraccionaria 0.5, hasta max_cortes_ronda cortes y
+        descartando los que superan densidad_maxima.
+
+        Un corte con todos los coeficientes nulos dice 0 >= 1: la fila
+        escribe la variable entera como su valor fraccionario menos
+        múltiplos enteros de variables enteras, así que no hay solución
+        entera.
+
+        Returns:
+            list: Coeficientes g de cada corte g·x >= 1 sobre las columnas del
+                  tableau, o None si una fila prueba que no hay solución entera
+        """
+        candidatas = []
+        for i, var_base in enumerate(base_vars):
+            if var_base in enteras:
+                f0 = self.fraccion(tableau[i][-1])
+                if self.tolerancia_entera < f0 < 1 - self.tolerancia_entera:
+                    candidatas.append((abs(f0 - 0.5), i))
+        candidatas.sort()
+
+        basicas = set(base_vars)
+        num_no_basicas = (len(tableau[0]) - 1) - len(basicas)
+        cortes = []
+
+        for _, i in candidatas:
+            if len(cortes) >= self.max_cortes_ronda:
+                break
+
+            coeficientes = self.corte_gmi(tableau[i], basicas, enteras)
+            no_nulos = sum(1 for g in coeficientes if g != 0.0)
+            if no_nulos == 0:
+                self.agregar_paso(f"🚫 Fila {i + 1}: corte 0 >= 1, sin solución entera")
+                return None
+            if num_no_basicas > 0 and no_nulos / num_no_basicas > self.densidad_maxima:
+                self.agregar_paso(f"⏭️  Corte de la fila {i + 1} descartado por densidad")
+                continue
+
+            cortes.append(coeficientes)
+
+        return cortes
+
+    def corte_gmi(self, fila, basicas, enteras):
+        """Coeficientes del corte de Gomory entero-mixto de una fila del tableau"""
+        f0 = self.fraccion(fila[-1])
+        coeficientes = [0.0] * (len(fila) - 1)
+
+        for j in range(len(fila) - 1):
+            a = fila[j]
+            if j in basicas or abs(a) <= self.tolerancia:
+                continue
+
+            if j in enteras:
+                fj = self.fraccion(a)
+                if fj <= self.tolerancia_entera or fj >= 1 - self.tolerancia_entera:
+                    continue
+                g = fj / f0 if fj <= f0 else (1 - fj) / (1 - f0)
+            else:
+                g = a / f0 if a > 0 else -a / (1 - f0)
+
+            coeficientes[j] = g
+
+        return coeficientes
+
+    def fraccion(self, valor):
+        """Parte fraccionaria en [0, 1)"""
+        return valor - math.floor(valor)
@@ -0,0 +1,223 @@
+"""
+Operaciones incrementales sobre un tableau simplex ya optimizado
+
+Los métodos de resolución construyen el tableau desde cero en cada llamada
+a `resolver`. Los algoritmos que trabajan por rondas (planos de corte,
+generación de filas o columnas) necesitan en cambio modificar el tableau
+óptimo y volver a optimizar a partir de la base anterior.
+
+Convenciones (las mismas que usan los tres métodos):
+    - La última fila es la fila objetivo, en forma de maximización.
+    - La última columna es el lado derecho (RHS).
+    - base_vars[i] es la columna básica de la fila i.
+"""
+
+
+class Reoptimizador:
+    def __init__(self):
+        self.tolerancia = 1e-10
+        self.max_iteraciones = 100
+        self.verbose = True  # Imprimir cada paso además de guardarlo
+        self.pasos = []
+
+    def agregar_paso(self, texto):
+        """Agregar un paso al proceso de solución"""
+        self.pasos.append(texto)
+        if self.verbose:
+            print(texto)
+
+    def agregar_fila(self, tableau, base_vars, coeficientes, rhs):
+        """
+        Agregar la restricción coeficientes·x <= rhs con una nueva holgura básica
+
+        Args:
+            tableau: Tableau actual (se modifica en el lugar)
+            base_vars: Variables básicas actuales (se modifica en el lugar)
+            coeficientes: Coeficientes sobre las columnas actuales del tableau
+            rhs: Lado derecho de la restricción
+
+        Returns:
+            int: Índice de la columna de holgura agregada
+        """
+        num_cols = len(tableau[0]) - 1
+        col_holgura = num_cols
+
+        # Nueva columna de holgura (cero en todas las filas existentes)
+        for fila in tableau:
+            fila.insert(-1, 0.0)
+
+        nueva_fila = [float(a) for a in coeficientes]
+        nueva_fila += [0.0] * (num_cols - len(nueva_fila))
+        nueva_fila += [1.0, float(rhs)]
+
+        # Expresar la fila en términos de la base actual
+        for i, var_base in enumerate(base_vars):
+            factor = nueva_fila[var_base]
+            if abs(factor) > self.tolerancia:
+                fila_base = tableau[i]
+                for j in range(len(nueva_fila)):
+                    nueva_fila[j] -= factor * fila_base[j]
+
+        tableau.insert(len(tableau) - 1, nueva_fila)
+        base_vars.append(col_holgura)
+
+        return col_holgura
+
+    def agregar_columna(self, tableau, columna, entrada_objetivo):
+        """
+        Agregar una columna ya expresada en la base actual (B^-1·a)
+
+        Args:
+            tableau: Tableau actual (se modifica en el lugar)
+            columna: Valores de la columna en cada fila de restricción
+            entrada_objetivo: Costo reducido en la fila objetivo
+
+        Returns:
+            int: Índice de la nueva columna
+        """
+        col_nueva = len(tableau[0]) - 1
+
+        for i in range(len(tableau) - 1):
+            tableau[i].insert(-1, float(columna[i]))
+        tableau[-1].insert(-1, float(entrada_objetivo))
+
+        return col_nueva
+
+    def simplex_primal(self, tableau, base_vars):
+        """
+        Reoptimizar con el método simplex primal desde la base actual
+
+        Requiere un tableau primal factible (RHS >= 0), como el que queda al
+        agregar columnas a un tableau óptimo.
+
+        Returns:
+            dict: 'convergido' (con 'iteraciones', los pivoteos hechos) y, si
+                  aplica, 'ilimitado' (con 'col_pivote', la columna sin fila
+                  pivote) o 'limite_iteraciones'
+        """
+        iteracion = 1
+
+        while iteracion <= self.max_iteraciones:
+            # Columna que entra: coeficiente más negativo de la fila objetivo
+            fila_objetivo = tableau[-1]
+            col_pivote = -1
+            mejor_valor = -self.tolerancia
+            for j in range(len(fila_objetivo) - 1):
+                if fila_objetivo[j] < mejor_valor:
+                    mejor_valor = fila_objetivo[j]
+                    col_pivote = j
+
+            if col_pivote == -1:
+                return {'convergido': True, 'iteraciones': iteracion - 1}
+
+            # Fila que sale: razón mínima
+            fila_pivote = -1
+            menor_ratio = float('inf')
+            for i in range(len(tableau) - 1):
+                if tableau[i][col_pivote] > self.tolerancia:
+                    ratio = tableau[i][-1] / tableau[i][col_pivote]
+                    if ratio < menor_ratio:
+                        menor_ratio = ratio
+                        fila_pivote = i
+
+            if fila_pivote == -1:
+                self.agregar_paso(f"❌ Columna x{col_pivote + 1} sin coeficientes positivos - Problema ilimitado")
+                return {'convergido': False, 'ilimitado': True, 'col_pivote': col_pivote}
+
+            self.agregar_paso(f"🔄 Simplex primal {iteracion}: entra x{col_pivote + 1}, sale fila {fila_pivote + 1}")
+
+            base_vars[fila_pivote] = col_pivote
+            self.pivotear(tableau, fila_pivote, col_pivote)
+
+            iteracion += 1
+
+        self.agregar_paso("❌ MÁXIMO NÚMERO DE ITERACIONES ALCANZADO")
+        return {'convergido': False, 'limite_iteraciones': True}
+
+    def simplex_dual(self, tableau, base_vars):
+        """
+        Reoptimizar con el método simplex dual
+
+        Requiere un tableau dualmente factible (fila objetivo >= 0), como el
+        que queda al agregar filas a un tableau óptimo.
+
+        Returns:
+            dict: 'convergido' (con 'iteraciones', los pivoteos hechos) y, si
+                  aplica, 'infactible' (con 'fila_pivote', la fila sin
+                  coeficientes negativos) o 'limite_iteraciones'
+        """
+        iteracion = 1
+
+        while iteracion <= self.max_iteraciones:
+            # Fila que sale: RHS más negativo
+            fila_pivote = -1
+            menor_rhs = -self.tolerancia
+            for i in range(len(tableau) - 1):
+                if tableau[i][-1] < menor_rhs:
+                    menor_rhs = tableau[i][-1]
+                    fila_pivote = i
+
+            if fila_pivote == -1:
+                return {'convergido': True, 'iteraciones': iteracion - 1}
+
+            # Columna que entra: razón mínima sobre coeficientes negativos
+            fila = tableau[fila_pivote]
+            fila_objetivo = tableau[-1]
+            col_pivote = -1
+            menor_ratio = float('inf')
+            for j in range(len(fila) - 1):
+                if fila[j] < -self.tolerancia:
+                    ratio = fila_objetivo[j] / -fila[j]
+                    if ratio < menor_ratio:
+                        menor_ratio = ratio
+                        col_pivote = j
+
+            if col_pivote == -1:
+                self.agregar_paso(f"❌ Fila {fila_pivote + 1} sin coeficientes negativos - Problema infactible")
+                return {'convergido': False, 'infactible': True, 'fila_pivote': fila_pivote}
+
+            self.agregar_paso(f"🔄 Simplex dual {iteracion}: sale fila {fila_pivote + 1}, entra x{col_pivote + 1}")
+
+            base_vars[fila_pivote] = col_pivote
+            self.pivotear(tableau, fila_pivote, col_pivote)
+
+            iteracion += 1
+
+        self.agregar_paso("❌ MÁXIMO NÚMERO DE ITERACIONES ALCANZADO")
+        return {'convergido': False, 'limite_iteraciones': True}
+
+    def pivotear(self, tableau, fila_pivote, col_pivote):
+        """Realizar operaciones de pivoteo"""
+        pivot = tableau[fila_pivote][col_pivote]
+        fila_p = tableau[fila_pivote]
+
+        # Normalizar fila pivote
+        for j in range(len(fila_p)):
+            fila_p[j] /= pivot
+
+        # Eliminar en otras filas
+        for i in range(len(tableau)):
+            if i != fila_pivote:
+                factor = tableau[i][col_pivote]
+                if abs(factor) > self.tolerancia:
+                    fila = tableau[i]
+                    for j in range(len(fila)):
+                        fila[j] -= factor * fila_p[j]
+                    fila[col_pivote] = 0.0
+
+    def eliminar_columnas(self, tableau, base_vars, columnas):
+        """
+        Eliminar columnas no básicas del tableau (p. ej. artificiales en cero)
+
+        Los índices de base_vars se ajustan al desplazamiento de columnas.
+        """
+        eliminar = set(columnas) - set(base_vars)
+        if not eliminar:
+            return
+
+        for i in range(len(tableau)):
+            tableau[i] = [v for j, v in enumerate(tableau[i]) if j not in eliminar]
+
+        ordenadas = sorted(eliminar)
+        for i, var_base in enumerate(base_vars):
+            base_vars[i] = var_base - sum(1 for col in ordenadas if col < var_base)
@@ -0,0 +1,266 @@
+"""
+Selección automática de método con un modelo de costo calibrado
+
+Se extraen características del problema (forma, densidad, mezcla de tipos
+de restricción, rango de coeficientes, estructura de red o de bloques), se
+estima el tiempo de cada método aplicable como
+
+    pivoteos estimados × celdas del tableau × segundos por celda
+
+y se elige el de menor costo junto con sus opciones (tolerancia escalada
+al rango de coeficientes y límite de iteraciones acorde al tamaño). Cada
+decisión queda registrada en 'razones' para mostrarla al usuario.
+
+Las constantes de COSTOS se midieron con `SelectorMetodo.calibrar` en el
+equipo de referencia; conviene recalibrarlas en equipos muy distintos.
+"""
+
+import time
+
+import numpy as np
+
+from utils.estructura import coeficientes_no_nulos, detectar_bloques, detectar_red
+
+from .simplex import SimplexTradicional
+from .gran_m import GranMSimplex
+from .dos_fases import DosFasesSimplex
+from .simplex_dual import SimplexDual
+from .simplex_redes import SimplexRedes
+from .bloques import SolverPorBloques
+from .sifting import SiftingSimplex
+from .generacion_filas import GeneracionFilas
+
+SOLVERS = {
+    'SimplexTradicional': SimplexTradicional,
+    'GranMSimplex': GranMSimplex,
+    'DosFasesSimplex': DosFasesSimplex,
+    'SimplexDual': SimplexDual,
+    'SimplexRedes': SimplexRedes,
+    'SolverPorBloques': SolverPorBloques,
+    'SiftingSimplex': SiftingSimplex,
+    'GeneracionFilas': GeneracionFilas,
+}
+
+COSTOS = {
+    # Segundos por celda del tableau y pivoteo (listas de Python, con pasos)
+    'celda_primal': 3.0e-7,
+    'celda_dual': 8.0e-8,
+    # Pivoteos: por fila+columna en el primal, por fila artificial en Fase I
+    # (o con penalización M), y por fila+columna en el dual
+    'pivoteos_primal': 0.4,
+    'pivoteos_artificial': 3.0,
+    'pivoteos_dual': 0.2,
+    # Simplex de redes: por arco (pricing vectorizado) y por nodo (árbol)
+    'arco_red': 5.0e-9,
+    'nodo_red': 1.0e-6,
+    'pivoteos_red': 1.5,
+    # Pricing vectorizado de sifting / revisión de filas perezosas
+    'celda_numpy': 2.0e-9,
+}
+
+# Proporciones a partir de las cuales conviene trabajar con subconjuntos
+PROPORCION_SIFTING = 10      # columnas por fila
+PROPORCION_FILAS = 10        # filas <= por variable
+RANGO_MAXIMO_GRAN_M = 1e6    # Rango de coeficientes tolerable con M = 1e6
+
+
+class SelectorMetodo:
+    def __init__(self):
+        self.costos = dict(COSTOS)
+        self.razones = []
+
+    def seleccionar(self, c, A, b, tipos, tipo_objetivo):
+        """
+        Elegir método y opciones para el problema
+
+        Returns:
+            dict: 'metodo' (nombre en SOLVERS), 'opciones' (atributos a fijar
+                  en el solver), 'estimaciones' (segundos estimados por
+                  método aplicable), 'caracteristicas' y 'razones'
+        """
+        self.razones = []
+        datos = self.caracteristicas(c, A, b, tipos, tipo_objetivo)
+        m, n = datos['m'], datos['n']
+
+        self.razones.append(f"Forma: {m} restricciones x {n} variables, densidad {datos['densidad']:.0%}")
+        self.razones.append(f"Restricciones: {datos['menor_igual']} <=, {datos['mayor_igual']} >=, "
+                            f"{datos['igual']} =")
+        self.razones.append(f"Rango de coeficientes: {datos['rango']:.1e}")
+
+        estimaciones = self.estimar(datos)
+
+        metodo = min(estimaciones, key=estimaciones.get)
+        for nombre, segundos in sorted(estimaciones.items(), key=lambda par: par[1]):
+            self.razones.append(f"  {nombre}: {segundos:.2e} s estimados")
+        self.razones.append(f"Elegido: {metodo} (menor costo estimado)")
+        if metodo == 'SimplexRedes':
+            self.razones.append("Si no llega al óptimo se resuelve de nuevo con DosFasesSimplex")
+
+        return {
+            'metodo': metodo,
+            'opciones': self.opciones(metodo, datos),
+            'estimaciones': estimaciones,
+            'caracteristicas': datos,
+            'razones': self.razones
+        }
+
+    def caracteristicas(self, c, A, b, tipos, tipo_objetivo):
+        """Medidas del problema que usa el modelo de costo"""
+        filas, columnas, valores, forma = coeficientes_no_nulos(A)
+        m = len(tipos)
+        n = len(c)
+
+        magnitudes = np.abs(np.concatenate([valores, np.asarray(b, dtype=float), np.asarray(c, dtype=float)]))
+        magnitudes = magnitudes[magnitudes > 0]
+        if len(magnitudes):
+            rango = float(magnitudes.max() / magnitudes.min())
+            escala = float(magnitudes.max())
+        else:
+            rango = escala = 1.0
+
+        b_negativo = [valor < 0 for valor in b]
+        menor_igual = sum(1 for tipo in tipos if tipo == '<=')
+        return {
+            'm': m,
+            'n': n,
+            'densidad': len(valores) / max(m * n, 1),
+            'menor_igual': menor_igual,
+            'mayor_igual': sum(1 for tipo in tipos if tipo == '>='),
+            'igual': sum(1 for tipo in tipos if tipo == '='),
+            # Filas que necesitan artificial tras normalizar b >= 0
+            'artificiales': sum(1 for tipo, neg in zip(tipos, b_negativo)
+                                if tipo == '=' or (tipo == '>=') != neg),
+            'forma_estandar': all(tipo == '<=' and not neg for tipo, neg in zip(tipos, b_negativo)),
+            'dual_factible': SimplexDual().es_dual_factible(c, tipo_objetivo),
+            'max_costo': float(np.max(np.abs(c))) if n else 0.0,
+            'rango': rango,
+            'escala': escala,
+            'red': m > 0 and detectar_red(A, tipos, n) is not None,
+            'bloques': [(len(bloque['filas']), len(bloque['columnas'])) for bloque in detectar_bloques(A, n)],
+        }
+
+    def estimar(self, datos):
+        """Segundos estimados por cada método aplicable"""
+        m, n = datos['m'], datos['n']
+        k = self.costos
+        estimaciones = {}
+
+        if datos['red']:
+            pivoteos = k['pivoteos_red'] * (m + n)
+            estimaciones['SimplexRedes'] = pivoteos * (k['arco_red'] * (n + m) + k['nodo_red'] * m)
+            self.razones.append("Matriz de incidencia nodo-arco: simplex de redes aplicable")
+
+        if datos['forma_estandar']:
+            estimaciones['SimplexTradicional'] = self.costo_primal(m, n, 0)
+        else:
+            self.razones.append("SimplexTradicional descartado: hay filas >=, = o b < 0")
+
+        if datos['dual_factible']:
+            filas = m + datos['igual']
+            pivoteos = k['pivoteos_dual'] * (filas + n)
+            estimaciones['SimplexDual'] = pivoteos * (filas + 1) * (n + filas + 1) * k['celda_dual']
+        else:
+            self.razones.append("SimplexDual descartado: la base de holguras no es dualmente factible")
+
+        estimaciones['DosFasesSimplex'] = self.costo_primal(m, n, datos['artificiales'])
+
+        if datos['rango'] > RANGO_MAXIMO_GRAN_M or datos['max_costo'] * 1e3 > GranMSimplex().M:
+            self.razones.append("GranMSimplex descartado: M no domina con este rango de coeficientes")
+        else:
+            # Mismos pivoteos que Dos Fases sin reconstruir la fila objetivo
+            # entre fases; sin artificiales ambos son el mismo simplex primal
+            descuento = 0.95 if datos['artificiales'] else 1.0
+            estimaciones['GranMSimplex'] = descuento * estimaciones['DosFasesSimplex']
+
+        bloques = [bloque for bloque in datos['bloques'] if bloque[0] and bloque[1]]
+        if len(datos['bloques']) > 1:
+            proporcion = datos['artificiales'] / max(m, 1)
+            estimaciones['SolverPorBloques'] = sum(self.costo_primal(filas, cols, proporcion * filas)
+                                                   for filas, cols in bloques)
+            self.razones.append(f"{len(datos['bloques'])} bloques independientes: suma de cuadrados "
+                                f"en lugar del cuadrado de la suma")
+
+        if m and n >= PROPORCION_SIFTING * m:
+            trabajo = min(n, 3 * max(m, 10))
+            rondas = 1 + np.log2(n / trabajo + 1)
+            estimaciones['SiftingSimplex'] = (rondas * self.costo_primal(m, trabajo, datos['artificiales'])
+                                              + rondas * m * n * k['celda_numpy'])
+            self.razones.append(f"{n / m:.0f} columnas por fila: sifting aplicable")
+
+        perezosas = datos['menor_igual']
+        if n and perezosas >= PROPORCION_FILAS * n:
+            activas = m - perezosas + 2 * n
+            rondas = 1 + np.log2(perezosas / (2 * n) + 1)
+            estimaciones['GeneracionFilas'] = (rondas * self.costo_primal(activas, n, m - perezosas)
+                                               + rondas * m * n * k['celda_numpy'])
+            self.razones.append(f"{perezosas / n:.0f} filas <= por variable: generación de filas aplicable")
+
+        return {nombre: float(segundos) for nombre, segundos in estimaciones.items()}
+
+    def costo_primal(self, m, n, artificiales):
+        """Costo de un simplex primal de tableau denso"""
+        k = self.costos
+        pivoteos = k['pivoteos_primal'] * (m + n) + k['pivoteos_artificial'] * artificiales
+        celdas = (m + 1) * (n + m + 2 * artificiales + 1)
+        return pivoteos * celdas * k['celda_primal']
+
+    def opciones(self, metodo, datos):
+        """Tolerancia escalada y límite de iteraciones para el método elegido"""
+        opciones = {'tolerancia': 1e-10 * max(1.0, datos['escala'])}
+        if metodo == 'SimplexRedes':
+            # Infactible, ilimitado o sin converger: se confirma con Dos Fases
+            opciones['respaldo'] = True
+        if metodo != 'SiftingSimplex':
+            m, n = datos['m'], datos['n']
+            estimados = (m + n) + self.costos['pivoteos_artificial'] * datos['artificiales']
+            opciones['max_iteraciones'] = max(100, int(5 * estimados))
+        return opciones
+
+    def calibrar(self, tamanos=(10, 20, 30), semilla=0):
+        """
+        Medir las constantes de costo por celda en este equipo
+
+        Resuelve problemas aleatorios pequeños con Simplex Tradicional y
+        Simplex Dual y ajusta 'celda_primal' y 'celda_dual'.
+
+        Returns:
+            dict: Constantes actualizadas
+        """
+        generador = np.random.default_rng(semilla)
+        muestras = {'celda_primal': [], 'celda_dual': []}
+
+        for tam in tamanos:
+            A = generador.uniform(0, 1, (tam, tam)).round(2).tolist()
+            b = generador.uniform(5, 10, tam).round(2).tolist()
+            c = generador.uniform(1, 5, tam).round(2).tolist()
+
+            for clave, solver, tipos, tipo_objetivo in (
+                    ('celda_primal', SimplexTradicional(), ['<='] * tam, 'max'),
+                    ('celda_dual', SimplexDual(), ['>='] * tam, 'min')):
+                solver.max_iteraciones = 100 * tam
+                solver.verbose = False
+                inicio = time.perf_counter()
+                resultado = solver.resolver(c, A, b, tipos, tipo_objetivo)
+                segundos = time.perf_counter() - inicio
+                if not resultado['factible']:
+                    continue
+                pivoteos = resultado['stats']['pivoteos'] if 'stats' in resultado else resultado['iteraciones']
+                if pivoteos:
+                    muestras[clave].append(segundos / pivoteos / ((tam + 1) * (2 * tam + 1)))
+
+        for clave, valores in muestras.items():
+            if valores:
+                self.costos[clave] = float(np.median(valores))
+        return self.costos
+
+
+def crear_solver(metodo, opciones=None):
+    """Instanciar un método por nombre y fijar sus opciones"""
+    solver = SOLVERS[metodo]()
+    # Los métodos por rondas delegan en un solver o generador interno
+    objetivos = [solver] + [getattr(solver, interno) for interno in ('solver', 'generador') if hasattr(solver, interno)]
+    for objetivo in objetivos:
+        for nombre, valor in (opciones or {}).items():
+            if hasattr(objetivo, nombre):
+                setattr(objetivo, nombre, valor)
+    return solver
@@ -0,0 +1,116 @@
+"""
+Sifting (conjunto de trabajo) para problemas con muchas más columnas que filas
+
+Se resuelve un subproblema con un conjunto pequeño de columnas, se evalúa
+el costo reducido de todas las columnas con los duales obtenidos en una sola
+pasada vectorizada y se incorporan las mejores candidatas. El proceso se
+repite hasta que ninguna columna mejora, lo que prueba la optimalidad sobre
+el conjunto completo sin construir nunca el tableau con todas las columnas.
+
+Internamente es una generación de columnas cuyo oráculo de pricing es la
+propia matriz A.
+"""
+
+import numpy as np
+
+from .generacion_columnas import GeneracionColumnas
+
+
+class SiftingSimplex:
+    def __init__(self):
+        self.generador = GeneracionColumnas()
+        self.tolerancia = 1e-9
+        self.tam_inicial = None  # Columnas iniciales (por defecto max(2m, 10))
+        self.lote = None         # Columnas agregadas por ronda (por defecto max(m, 10))
+        self.max_rondas = 1000
+        self.verbose = True  # Imprimir cada paso además de guardarlo
+        self.pasos = []
+
+    def resolver(self, c, A, b, tipos, tipo_objetivo):
+        """
+        Resolver el problema completo a través de un conjunto de trabajo de columnas
+
+        Args:
+            c, A, b, tipos, tipo_objetivo: Problema completo. A puede ser una
+                lista de listas, un arreglo de numpy o una matriz dispersa
+                de scipy.
+
+        Returns:
+            dict: Resultado con las claves habituales más 'columnas_trabajo'
+                  (índices de las columnas que llegaron al tableau) y 'rondas'
+        """
+        matriz = A.tocsc() if hasattr(A, 'tocsc') else np.asarray(A, dtype=float)
+        costos = np.asarray(c, dtype=float)
+        m, n = matriz.shape
+        sentido = 1.0 if tipo_objetivo == 'max' else -1.0
+
+        tam_inicial = self.tam_inicial or max(2 * m, 10)
+        lote = self.lote or max(m, 10)
+
+        # Conjunto inicial: columnas con mejor costo por unidad de coeficiente
+        normas = np.asarray(abs(matriz).sum(axis=0)).ravel() + 1.0
+        atractivo = sentido * costos / normas
+        if tam_inicial < n:
+            trabajo = np.argpartition(-atractivo, tam_inicial - 1)[:tam_inicial]
+        else:
+            trabajo = np.arange(n)
+        trabajo = [int(j) for j in np.sort(trabajo)]
+
+        en_trabajo = np.zeros(n, dtype=bool)
+        en_trabajo[trabajo] = True
+        agregadas = []
+
+        def pricing(duales):
+            # Costos reducidos de todas las columnas en una sola pasada
+            reducidos = sentido * (costos - matriz.T @ np.asarray(duales, dtype=float))
+            reducidos[en_trabajo] = -np.inf
+            candidatas = np.flatnonzero(reducidos > self.tolerancia)
+            if len(candidatas) > lote:
+                orden = np.argpartition(-reducidos[candidatas], lote - 1)[:lote]
+                candidatas = candidatas[orden]
+
+            en_trabajo[candidatas] = True
+            agregadas.extend(int(j) for j in candidatas)
+            return [(costos[j], self.columna(matriz, j)) for j in candidatas]
+
+        # El generador vuelve a filtrar con los mismos duales: una tolerancia
+        # menor evita que rechace por redondeo una columna ya marcada
+        self.generador.tolerancia = self.tolerancia / 2
+        self.generador.verbose = self.verbose
+        self.generador.max_rondas = self.max_rondas
+
+        resultado = self.generador.resolver(costos[trabajo].tolist(),
+                                            [self.fila_trabajo(matriz, i, trabajo) for i in range(m)],
+                                            list(b), list(tipos), tipo_objetivo, pricing)
+        self.pasos = resultado['pasos']
+
+        indices = trabajo + agregadas
+        resultado['columnas_trabajo'] = indices
+
+        if resultado['factible']:
+            solucion = [0.0] * n
+            for j, valor in zip(indices, resultado['solucion']):
+                solucion[j] = valor
+            resultado['solucion'] = solucion
+            self.generador.agregar_paso(f"🧮 Columnas en el tableau: {len(indices)} de {n}")
+        elif resultado.get('rayo') is not None:
+            # Rayo y punto del subproblema, llevados a los índices del problema completo
+            for clave in ('rayo', 'punto'):
+                vector = [0.0] * n
+                for j, valor in zip(indices, resultado[clave]):
+                    vector[j] = valor
+                resultado[clave] = vector
+
+        return resultado
+
+    def columna(self, matriz, j):
+        """Columna j de la matriz como lista de floats"""
+        if hasattr(matriz, 'toarray'):
+            return matriz[:, [j]].toarray().ravel().tolist()
+        return matriz[:, j].tolist()
+
+    def fila_trabajo(self, matriz, i, trabajo):
+        """Fila i restringida a las columnas del conjunto de trabajo"""
+        if hasattr(matriz, 'toarray'):
+            return matriz[[i], :][:, trabajo].toarray().ravel().tolist()
+        return matriz[i, trabajo].tolist()
@@ -1,20 +1,43 @@
-import numpy as np
-from sympy import symbols, sympify, Matrix
-from sympy.parsing.sympy_parser import parse_expr
+from time import perf_counter
+
+from .certificados import rayo_mejora, resumen, verificar_rayo
+from .estadisticas import Estadisticas
+from .eventos import consumir, evento_pivoteo, evento_resultado, valor_tableau
+from .implicitas import ColumnasImplicitas
+from .kernels import kernel_para
 
 class SimplexTradicional:
     def __init__(self):
         self.tolerancia = 1e-10
         self.max_iteraciones = 100
+        self.verbose = True  # Imprimir cada paso además de guardarlo
         self.pasos = []
+        self.estadisticas = Estadisticas()  # Tiempos y contadores de la última resolución
+        self.tableau_en_disco = None  # True o un directorio: tableau en numpy.memmap (ver metodos.tableau_numpy)
+        self.hilos = 1  # Hilos para pivotear tableaux grandes (None: todos los núcleos)
+        self.kernel = None  # Backend de metodos.kernels ('python', 'numpy', 'dispersa', 'hilos'; None: automático)
 
     def agregar_paso(self, texto):
         """Agregar un paso al proceso de solución"""
+        self.estadisticas.iniciar('trazas')
         self.pasos.append(texto)
-        print(texto)
+        if self.verbose:
+            print(texto)
+        self.estadisticas.detener()
 
     def resolver(self, c, A, b, tipos, tipo_objetivo):
         """Método principal para resolver con Simplex tradicional"""
+        return consumir(self.iter_resolver(c, A, b, tipos, tipo_objetivo))
+
+    def iter_resolver(self, c, A, b, tipos, tipo_objetivo):
+        """Resolver paso a paso: un evento por pivoteo y uno final con el resultado"""
+        self.estadisticas = Estadisticas(self.tolerancia)
+        resultado = yield from self.iterar(c, A, b, tipos, tipo_objetivo)
+        resultado['stats'] = self.estadisticas.como_dict()
+        yield evento_resultado(resultado)
+
+    def iterar(self, c, A, b, tipos, tipo_objetivo):
+        """Generador del método: emite los pivoteos y devuelve el resultado"""
         self.pasos = []
         self.agregar_paso("🎯 INICIANDO MÉTODO SIMPLEX TRADICIONAL")
         self.agregar_paso(f"Tipo de problema: {tipo_objetivo.upper()}")
@@ -32,7 +55,10 @@ class SimplexTradicional:
             }
         
         # Convertir a forma estándar para Simplex tradicional
+        estadisticas = self.estadisticas
+        estadisticas.iniciar('forma_estandar')
         resultado = self.convertir_forma_estandar_simple(c, A, b, tipo_objetivo)
+        estadisticas.detener()
         
         if not resultado['factible']:
             return {
@@ -44,57 +70,94 @@ class SimplexTradicional:
         
         tableau = resultado['tableau']
         base_vars = resultado['base_vars']
+        implicitas = resultado['implicitas']
+        kernel = resultado['kernel']
+        traza = self.agregar_paso if kernel.nombre == 'python' else None
         
-        self.mostrar_tableau(tableau, base_vars, 0)
+        self.mostrar_tableau(tableau, base_vars, 0, implicitas)
         
         # Aplicar método simplex
+        inicio_fase = perf_counter()
         iteracion = 1
         while iteracion <= self.max_iteraciones:
             # Verificar optimalidad
-            col_pivote = self.encontrar_columna_pivote(tableau, tipo_objetivo)
+            estadisticas.iniciar('pricing')
+            col_pivote = kernel.columna_pivote(tableau)
+            estadisticas.detener()
             
             if col_pivote == -1:
                 self.agregar_paso("✅ CONDICIÓN DE OPTIMALIDAD ALCANZADA")
                 break
             
             # Encontrar fila pivote
-            fila_pivote = self.encontrar_fila_pivote(tableau, col_pivote)
+            estadisticas.iniciar('razon_minima')
+            entra = implicitas.logicas[col_pivote]
+            if traza:
+                self.agregar_paso(f"\n🔍 Calculando razones para variable entrante x{entra + 1}:")
+            fila_pivote = kernel.fila_pivote(tableau, col_pivote, traza)
+            if traza and fila_pivote != -1:
+                menor_ratio = max(tableau[fila_pivote][-1], 0.0) / tableau[fila_pivote][col_pivote]
+                self.agregar_paso(f"🎯 Razón mínima: {menor_ratio:.3f} en fila {fila_pivote + 1}")
+            estadisticas.detener()
             
             if fila_pivote == -1:
+                estadisticas.sumar_fase(2, inicio_fase)
                 self.agregar_paso("❌ PROBLEMA ILIMITADO - No hay solución acotada")
+                # Las filas con b < 0 entran invertidas al tableau sin cambiar
+                # su tipo: el rayo se verifica contra las filas así resueltas
+                invertidas = set(resultado['invertidas'])
+                tipos_originales = ['>=' if i in invertidas else tipo for i, tipo in enumerate(tipos)]
+                rayo = rayo_mejora(kernel.columna(tableau, col_pivote), base_vars, entra, len(c))
+                punto = kernel.extraer_solucion(tableau, base_vars, len(c))
+                if not verificar_rayo(c, A, b, tipos_originales, tipo_objetivo, rayo, punto):
+                    rayo = punto = None
+                self.agregar_paso(f"📐 Rayo de mejora: {resumen(rayo, 'x')}" if rayo
+                                  else "⚠️ No se pudo verificar un rayo de mejora desde un punto factible")
                 return {
                     'solucion': None,
                     'valor_optimo': None,
                     'factible': False,
                     'ilimitado': True,
+                    'rayo': rayo,
+                    'punto': punto,
                     'pasos': self.pasos
                 }
             
             self.agregar_paso(f"\n🔄 ITERACIÓN {iteracion}")
-            self.agregar_paso(f"Variable que entra: x{col_pivote + 1}")
+            self.agregar_paso(f"Variable que entra: x{entra + 1}")
             self.agregar_paso(f"Variable que sale: x{base_vars[fila_pivote] + 1}")
             self.agregar_paso(f"Elemento pivote: {tableau[fila_pivote][col_pivote]:.4f}")
             
             # Actualizar variable base
-            base_vars[fila_pivote] = col_pivote
+            sale = base_vars[fila_pivote]
+            base_vars[fila_pivote] = entra
             
-            # Operaciones de pivoteo
-            self.pivotear(tableau, fila_pivote, col_pivote)
-            self.mostrar_tableau(tableau, base_vars, iteracion)
+            # Operaciones de pivoteo (la holgura que sale deja de ser unitaria)
+            estadisticas.registrar_pivoteo(tableau[fila_pivote][col_pivote], tableau[fila_pivote][-1])
+            estadisticas.iniciar('pivoteo')
+            implicitas.materializar(tableau, fila_pivote)
+            kernel.pivotear(tableau, fila_pivote, col_pivote, traza)
+            estadisticas.detener()
+            self.mostrar_tableau(tableau, base_vars, iteracion, implicitas)
+            estadisticas.sumar_fase(2, inicio_fase)
+            yield evento_pivoteo(iteracion, None, entra, sale, valor_tableau(tableau, tipo_objetivo))
+            inicio_fase = perf_counter()
             
             iteracion += 1
         
+        estadisticas.sumar_fase(2, inicio_fase)
         if iteracion > self.max_iteraciones:
             self.agregar_paso("❌ MÁXIMO NÚMERO DE ITERACIONES ALCANZADO")
             return {
                 'solucion': None,
                 'valor_optimo': None,
                 'factible': False,
+                'limite_iteraciones': True,
                 'pasos': self.pasos
             }
         
         # Extraer solución
-        solucion = self.extraer_solucion(tableau, base_vars, len(c))
+        solucion = kernel.extraer_solucion(tableau, base_vars, len(c))
         valor_optimo = tableau[-1][-1] if tipo_objetivo == 'max' else -tableau[-1][-1]
         
         self.agregar_paso("\n🎊 SOLUCIÓN ÓPTIMA ENCONTRADA")
@@ -104,6 +167,8 @@ class SimplexTradicional:
             'solucion': solucion,
             'valor_optimo': valor_optimo,
             'factible': True,
+            'tableau': kernel.como_listas(tableau, implicitas),
+            'base_vars': base_vars,
             'pasos': self.pasos
         }
 
@@ -112,44 +177,44 @@ class SimplexTradicional:
         return all(tipo == '<=' for tipo in tipos)
 
     def convertir_forma_estandar_simple(self, c, A, b, tipo_objetivo):
-        """Convertir a forma estándar agregando variables de holgura"""
+        """
+        Convertir a forma estándar agregando variables de holgura
+
+        Las holguras no ocupan columnas en el tableau devuelto: quedan en
+        'implicitas' hasta que su fila es fila pivote (ver
+        metodos.implicitas). `implicitas.expandir(tableau)` da el tableau
+        completo; 'base_vars' usa los índices de ese tableau completo.
+        """
         m = len(A)
         n = len(c)
         
         self.agregar_paso("\n📋 CONVERSIÓN A FORMA ESTÁNDAR")
         
-        # Verificar factibilidad básica (b >= 0)
+        # Verificar factibilidad básica (b >= 0); el signo se aplica al armar
+        # el tableau, sin escribir en A ni b (pueden ser de solo lectura)
+        invertidas = []
         for i in range(m):
             if b[i] < 0:
                 self.agregar_paso(f"❌ b[{i}] = {b[i]} < 0. Multiplicando restricción por -1")
-                b[i] = -b[i]
-                for j in range(n):
-                    A[i][j] = -A[i][j]
+                invertidas.append(i)
+        signos = [-1.0 if b[i] < 0 else 1.0 for i in range(m)]
         
-        # Construir tableau con variables de holgura
-        total_cols = n + m + 1  # vars originales + vars holgura + RHS
-        tableau = []
-        base_vars = []
-        
-        # Construir restricciones con variables de holgura
-        for i in range(m):
-            fila = [0.0] * total_cols
-            # Variables originales
-            for j in range(n):
-                fila[j] = float(A[i][j])
-            # Variable de holgura
-            fila[n + i] = 1.0
-            # RHS
-            fila[-1] = float(b[i])
-            tableau.append(fila)
-            base_vars.append(n + i)  # Variable de holgura es básica
+        # Construir tableau: variables originales + RHS; la holgura de cada
+        # fila es una columna unitaria implícita
+        implicitas = ColumnasImplicitas(n)
+        base_vars = [implicitas.agregar(i, 1.0) for i in range(m)]  # Variables de holgura básicas
         
         # Función objetivo
-        fila_objetivo = [0.0] * total_cols
-        for j in range(n):
-            fila_objetivo[j] = -float(c[j]) if tipo_objetivo == 'max' else float(c[j])
+        fila_objetivo = [-float(c[j]) if tipo_objetivo == 'max' else float(c[j]) for j in range(n)]
+        fila_objetivo.append(0.0)
         
-        tableau.append(fila_objetivo)
+        # Las holguras no ocupan columnas (los backends de ancho fijo les
+        # reservan lugar al final)
+        kernel = kernel_para(self, A, (m + 1) * (implicitas.total + 1))
+        tableau = kernel.crear(A, b, fila_objetivo, n + 1, reservadas=m, signos=signos)
+        if kernel.nombre != 'python':
+            self.agregar_paso(f"Tableau de {m + 1} x {implicitas.total + 1} con el backend '{kernel.nombre}'"
+                              f"{' en disco' if kernel.directorio else ''}")
         
         self.agregar_paso(f"Variables de holgura agregadas: s1, s2, ..., s{m}")
         self.agregar_paso(f"Variables básicas iniciales: {[f's{i+1}' for i in range(m)]}")
@@ -157,87 +222,26 @@ class SimplexTradicional:
         return {
             'tableau': tableau,
             'base_vars': base_vars,
+            'implicitas': implicitas,
+            'kernel': kernel,
+            'invertidas': invertidas,
             'factible': True
         }
 
-    def encontrar_columna_pivote(self, tableau, tipo_objetivo):
-        """Encontrar columna pivote (variable que entra)"""
-        fila_objetivo = tableau[-1]
-        col_pivote = -1
-        mejor_valor = 0
-        
-        for j in range(len(fila_objetivo) - 1):
-            if tipo_objetivo == 'max':
-                if fila_objetivo[j] < mejor_valor:
-                    mejor_valor = fila_objetivo[j]
-                    col_pivote = j
-            else:
-                if fila_objetivo[j] > mejor_valor:
-                    mejor_valor = fila_objetivo[j]
-                    col_pivote = j
-        
-        return col_pivote
-
-    def encontrar_fila_pivote(self, tableau, col_pivote):
-        """Encontrar fila pivote (variable que sale) usando razón mínima"""
-        fila_pivote = -1
-        menor_ratio = float('inf')
-        
-        self.agregar_paso(f"\n🔍 Calculando razones para variable entrante x{col_pivote + 1}:")
-        
-        for i in range(len(tableau) - 1):
-            if tableau[i][col_pivote] > self.tolerancia:
-                ratio = tableau[i][-1] / tableau[i][col_pivote]
-                self.agregar_paso(f"  Fila {i + 1}: {tableau[i][-1]:.3f} / {tableau[i][col_pivote]:.3f} = {ratio:.3f}")
-                if ratio >= 0 and ratio < menor_ratio:
-                    menor_ratio = ratio
-                    fila_pivote = i
-            else:
-                self.agregar_paso(f"  Fila {i + 1}: No válida (coeficiente ≤ 0)")
-        
-        if fila_pivote != -1:
-            self.agregar_paso(f"🎯 Razón mínima: {menor_ratio:.3f} en fila {fila_pivote + 1}")
-        
-        return fila_pivote
-
-    def pivotear(self, tableau, fila_pivote, col_pivote):
-        """Realizar operaciones de pivoteo"""
-        pivot = tableau[fila_pivote][col_pivote]
-        self.agregar_paso(f"\n⚙️ Operaciones de pivoteo:")
-        self.agregar_paso(f"Normalizando fila pivote (dividiendo por {pivot:.4f})")
-        
-        # Normalizar fila pivote
-        for j in range(len(tableau[0])):
-            tableau[fila_pivote][j] /= pivot
-        
-        # Eliminar en otras filas
-        self.agregar_paso("Eliminando en otras filas:")
-        for i in range(len(tableau)):
-            if i != fila_pivote:
-                factor = tableau[i][col_pivote]
-                if abs(factor) > self.tolerancia:
-                    self.agregar_paso(f"  Fila {i + 1}: R{i + 1} - ({factor:.3f}) * R{fila_pivote + 1}")
-                    for j in range(len(tableau[0])):
-                        tableau[i][j] -= factor * tableau[fila_pivote][j]
-
-    def extraer_solucion(self, tableau, base_vars, num_vars_originales):
-        """Extraer la solución final"""
-        solucion = [0.0] * num_vars_originales
-        
-        for i in range(len(base_vars)):
-            if base_vars[i] < num_vars_originales:
-                solucion[base_vars[i]] = tableau[i][-1]
-        
-        return solucion
-
-    def mostrar_tableau(self, tableau, base_vars, iteracion):
-        """Mostrar el tableau en formato tabular"""
+    def mostrar_tableau(self, tableau, base_vars, iteracion, implicitas=None):
+        """Mostrar el tableau en formato tabular (sin las columnas implícitas)"""
+        self.estadisticas.iniciar('trazas')
         self.agregar_paso(f"\n📊 TABLEAU - ITERACIÓN {iteracion}")
+        if not isinstance(tableau, list):
+            self.agregar_paso(f"({len(tableau) - 1} filas: el tableau solo se muestra con el backend 'python')")
+            self.estadisticas.detener()
+            return
         self.agregar_paso("=" * 60)
         
         # Encabezados
+        logicas = implicitas.logicas if implicitas is not None else range(len(tableau[0]) - 1)
         encabezado = "Base\t\t"
-        for j in range(len(tableau[0]) - 1):
+        for j in logicas:
             encabezado += f"x{j + 1}\t"
         encabezado += "RHS"
         self.agregar_paso(encabezado)
@@ -245,10 +249,7 @@ class SimplexTradicional:
         
         # Filas de restricciones
         for i in range(len(tableau) - 1):
-            if base_vars[i] < len(tableau[0]) - 1:
-                fila = f"x{base_vars[i] + 1}\t\t"
-            else:
-                fila = f"s{base_vars[i] - len(tableau[0]) + 2}\t\t"
+            fila = f"x{base_vars[i] + 1}\t\t"
             
             for j in range(len(tableau[0])):
                 fila += f"{tableau[i][j]:.3f}\t"
@@ -259,120 +260,16 @@ class SimplexTradicional:
         for j in range(len(tableau[0])):
             fila_obj += f"{tableau[-1][j]:.3f}\t"
         self.agregar_paso(fila_obj)
-
-
-# Paso 1: Leer función objetivo (manteniendo tu estructura)
-def leer_funcion_objetivo():
-    entrada = input("Introduce la función objetivo: ").strip()
-
-    if entrada.lower().startswith("max"):
-        tipo = "max"
-        expr_str = entrada[3:].strip()
-    elif entrada.lower().startswith("min"):
-        tipo = "min"
-        expr_str = entrada[3:].strip()
-    else:
-        expr_str = entrada
-        tipo = input("¿El problema es de Maximización o Minimización? (Escribe 'max' o 'min'): ").strip().lower()
-
-    try:
-        expr = sympify(expr_str)
-    except Exception as e:
-        print("Error al analizar la función objetivo:", e)
-        return None, None, None, None
-
-    variables = sorted(expr.free_symbols, key=lambda x: x.name)
-    coeficientes = [float(expr.coeff(var)) for var in variables]
-
-    return tipo, expr, variables, coeficientes
-
-
-# Paso 2: Leer restricciones (mejorado para manejar <=, >= y =)
-def leer_restricciones(variables):
-    num_restricciones = int(input("¿Cuántas restricciones deseas ingresar?: "))
-    restricciones = []
-    resultados = []
-    relaciones = []
-
-    print("\n💡 Formatos aceptados:")
-    print("  • Para ≤: usar '<='  (ej: 2*x1 + 3*x2 <= 10)")
-    print("  • Para ≥: usar '>='  (ej: x1 + x2 >= 5)")
-    print("  • Para =: usar '='   (ej: x1 + 2*x2 = 8)")
-    print()
-
-    for i in range(num_restricciones):
-        restr = input(f"Restricción {i + 1}: ").strip()
-
-        # Determinar el tipo de relación
-        if "<=" in restr:
-            izquierda_str, derecha_str = restr.split("<=")
-            relacion = "<="
-        elif ">=" in restr:
-            izquierda_str, derecha_str = restr.split(">=")
-            relacion = ">="
-        elif "=" in restr and "<=" not in restr and ">=" not in restr:
-            izquierda_str, derecha_str = restr.split("=")
-            relacion = "="
-        else:
-            print("❌ Error: Formato de restricción no válido. Use '<=', '>=' o '='")
-            return None, None, None
-
-        try:
-            izquierda = sympify(izquierda_str.strip())
-            derecha = sympify(derecha_str.strip())
-        except Exception as e:
-            print(f"❌ Error al procesar la restricción {i+1}:", e)
-            return None, None, None
-
-        # Extraer coeficientes
-        coef_restriccion = []
-        for var in variables:
-            coef = float(izquierda.coeff(var))
-            coef_restriccion.append(coef)
-
-        restricciones.append(coef_restriccion)
-        resultados.append(float(derecha))
-        relaciones.append(relacion)
-
-    # Convertir a matrices (manteniendo compatibilidad con tu código)
-    matriz_coef = Matrix(restricciones)
-    vector_resultados = Matrix([[r] for r in resultados])
-
-    return matriz_coef, vector_resultados, relaciones
-
-
-# Paso 3: Mostrar resumen (mejorado)
-def mostrar_resumen(tipo, funcion_objetivo, variables, coef_objetivo,
-                    matriz_restricciones, vector_resultados, relaciones):
-    print("\n" + "="*60)
-    print("📋 RESUMEN DEL PROBLEMA DE PROGRAMACIÓN LINEAL")
-    print("="*60)
-    print(f"\n🎯 Función objetivo: {funcion_objetivo}")
-    print(f"📊 Tipo de problema: {tipo.upper()}")
-    print(f"🔢 Variables detectadas: {variables}")
-    print(f"📈 Coeficientes de la función objetivo: {coef_objetivo}")
-    
-    print("\n📋 Restricciones:")
-    for i, rel in enumerate(relaciones):
-        restriccion_str = " + ".join([f"{coef}*{var}" for coef, var in zip(matriz_restricciones.row(i), variables) if coef != 0])
-        print(f"  {i+1}. {restriccion_str} {rel} {vector_resultados.row(i)[0]}")
-    
-    print(f"\n📐 Matriz de coeficientes de las restricciones:")
-    print(matriz_restricciones)
-    print(f"\n📊 Vector de resultados:")
-    print(vector_resultados)
-    
-    # Verificar compatibilidad con Simplex tradicional
-    tiene_no_estandar = any(rel in ['>=', '='] for rel in relaciones)
-    if tiene_no_estandar:
-        print("\n⚠️  ADVERTENCIA:")
-        print("   Este problema contiene restricciones >= o =")
-        print("   El método Simplex tradicional solo maneja restricciones <=")
-        print("   💡 Considere usar el método de Gran M o Dos Fases")
+        if implicitas is not None and implicitas.pendientes:
+            omitidas = ', '.join(f"x{j + 1}" for j in implicitas.sin_materializar())
+            self.agregar_paso(f"Columnas unitarias sin mostrar (holguras básicas): {omitidas}")
+        self.estadisticas.detener()
 
 
 # Ejecución del programa mejorado
 def ejecutar_programa_mejorado():
+    from utils.validadores import leer_funcion_objetivo, leer_restricciones, mostrar_resumen
+
     print("🚀 MÉTODO SIMPLEX TRADICIONAL MEJORADO")
     print("="*50)
     
@@ -396,18 +293,13 @@ def ejecutar_programa_mejorado():
         print("👋 Programa terminado.")
         return
 
-    # Convertir datos para el solver
-    A_lista = [[float(matriz_restricciones[i, j]) for j in range(len(variables))] 
-               for i in range(matriz_restricciones.rows)]
-    b_lista = [float(vector_resultados[i, 0]) for i in range(vector_resultados.rows)]
-
     # Resolver con Simplex
     print("\n" + "="*60)
     print("🔧 RESOLVIENDO CON MÉTODO SIMPLEX")
     print("="*60)
     
     simplex = SimplexTradicional()
-    resultado = simplex.resolver(coef_objetivo, A_lista, b_lista, relaciones, tipo)
+    resultado = simplex.resolver(coef_objetivo, matriz_restricciones, vector_resultados, relaciones, tipo)
 
     # Mostrar resultado final
     print("\n" + "="*60)
@@ -0,0 +1,131 @@
+"""
+Simplex dual desde la base de holguras
+
+Si la fila objetivo en forma de maximización ya es no negativa (max con
+c <= 0 o min con c >= 0), la base formada por las holguras es dualmente
+factible aunque el lado derecho tenga entradas negativas. Basta entonces
+escribir cada restricción como <= (las >= se multiplican por -1 y las =
+se separan en dos desigualdades) y aplicar el simplex dual: no hacen falta
+variables artificiales ni Fase I.
+
+Si una fila con lado derecho negativo no tiene coeficientes negativos, sus
+entradas en las columnas de holgura son multiplicadores y >= 0 de las
+filas <= con y^T A >= 0 e y·b < 0: el certificado de Farkas, que se lleva
+a las filas originales (ver metodos.certificados).
+"""
+
+from .certificados import resumen, verificar_certificado
+from .reoptimizacion import Reoptimizador
+
+
+class SimplexDual:
+    def __init__(self):
+        self.tolerancia = 1e-10
+        self.max_iteraciones = 100
+        self.reoptimizador = Reoptimizador()
+        self.verbose = True  # Imprimir cada paso además de guardarlo
+        self.pasos = []
+
+    def agregar_paso(self, texto):
+        """Agregar un paso al proceso de solución"""
+        self.pasos.append(texto)
+        if self.verbose:
+            print(texto)
+
+    def resolver(self, c, A, b, tipos, tipo_objetivo):
+        """Método principal para resolver con simplex dual"""
+        self.pasos = []
+        self.agregar_paso("🎯 INICIANDO MÉTODO SIMPLEX DUAL")
+        self.agregar_paso(f"Tipo de problema: {tipo_objetivo.upper()}")
+
+        if not self.es_dual_factible(c, tipo_objetivo):
+            self.agregar_paso("❌ LA BASE DE HOLGURAS NO ES DUALMENTE FACTIBLE")
+            self.agregar_paso("💡 Requiere c >= 0 al minimizar o c <= 0 al maximizar")
+            return {
+                'solucion': None,
+                'valor_optimo': None,
+                'factible': False,
+                'mensaje': 'La base de holguras no es dualmente factible',
+                'pasos': self.pasos
+            }
+
+        n = len(c)
+
+        # Todas las restricciones como <=, recordando la fila original y su signo
+        filas = []
+        origen = []
+        for k, (fila, rhs, tipo) in enumerate(zip(A, b, tipos)):
+            if tipo in ['<=', '=']:
+                filas.append(([float(a) for a in fila], float(rhs)))
+                origen.append((k, 1.0))
+            if tipo in ['>=', '=']:
+                filas.append(([-float(a) for a in fila], -float(rhs)))
+                origen.append((k, -1.0))
+        m = len(filas)
+
+        tableau = []
+        for i, (fila, rhs) in enumerate(filas):
+            holguras = [1.0 if k == i else 0.0 for k in range(m)]
+            tableau.append(fila + holguras + [rhs])
+        sentido = -1.0 if tipo_objetivo == 'max' else 1.0
+        tableau.append([sentido * float(valor) for valor in c] + [0.0] * m + [0.0])
+        base_vars = [n + i for i in range(m)]
+
+        self.agregar_paso(f"Restricciones como <=: {m}, variables de holgura: {m}")
+
+        self.reoptimizador.tolerancia = self.tolerancia
+        self.reoptimizador.verbose = self.verbose
+        self.reoptimizador.max_iteraciones = self.max_iteraciones
+        self.reoptimizador.pasos = []
+        resultado = self.reoptimizador.simplex_dual(tableau, base_vars)
+        self.pasos.extend(self.reoptimizador.pasos)
+
+        if not resultado['convergido']:
+            certificado = None
+            if resultado.get('infactible'):
+                self.agregar_paso("❌ PROBLEMA INFACTIBLE")
+                # Entradas de la fila en las holguras: multiplicadores de las filas <=
+                certificado = [0.0] * len(A)
+                fila = tableau[resultado['fila_pivote']]
+                for (k, signo), y in zip(origen, fila[n:n + m]):
+                    certificado[k] += signo * y
+                if verificar_certificado(A, b, tipos, certificado):
+                    self.agregar_paso(f"📐 Certificado de Farkas: {resumen(certificado, 'y')}")
+                else:
+                    certificado = None
+                    self.agregar_paso("⚠️ No se pudo verificar un certificado de Farkas")
+            return {
+                'solucion': None,
+                'valor_optimo': None,
+                'factible': False,
+                'certificado': certificado,
+                'limite_iteraciones': resultado.get('limite_iteraciones', False),
+                'pasos': self.pasos
+            }
+
+        self.agregar_paso("✅ CONDICIÓN DE FACTIBILIDAD PRIMAL ALCANZADA")
+
+        solucion = [0.0] * n
+        for i, var_base in enumerate(base_vars):
+            if var_base < n:
+                solucion[var_base] = tableau[i][-1]
+        valor_optimo = tableau[-1][-1] if tipo_objetivo == 'max' else -tableau[-1][-1]
+
+        self.agregar_paso("\n🎊 SOLUCIÓN ÓPTIMA ENCONTRADA")
+        self.agregar_paso(f"Valor óptimo: {valor_optimo:.4f}")
+
+        return {
+            'solucion': solucion,
+            'valor_optimo': valor_optimo,
+            'factible': True,
+            'iteraciones': resultado['iteraciones'],
+            'tableau': tableau,
+            'base_vars': base_vars,
+            'pasos': self.pasos
+        }
+
+    def es_dual_factible(self, c, tipo_objetivo):
+        """La fila objetivo inicial (forma max) es no negativa"""
+        if tipo_objetivo == 'max':
+            return all(valor <= self.tolerancia for valor in c)
+        return all(valor >= -self.tolerancia for valor in c)
@@ -0,0 +1,367 @@
+"""
+Simplex de redes para flujo de costo mínimo, transporte y asignación
+
+Cuando A es una matriz de incidencia nodo-arco (ver
+utils.estructura.detectar_red) cada base es un árbol generador. Los
+potenciales de los nodos se obtienen recorriendo el árbol, el ciclo que
+forma el arco entrante se encuentra subiendo desde sus extremos (costo
+proporcional a la profundidad) y solo el subárbol que cuelga del arco
+saliente se vuelve a enganchar. No se construye ningún tableau.
+
+Cada fila es un nodo con oferta b_i; las restricciones <= y >= agregan un
+arco de holgura hacia o desde el nodo raíz ficticio. La base inicial usa
+arcos artificiales entre cada nodo y la raíz con costo M; se elige el arco
+saliente con la regla de Cunningham (árbol fuertemente factible) para
+evitar ciclado en pivoteos degenerados.
+
+Si los artificiales siguen con flujo al llegar al óptimo o al encontrar un
+ciclo sin cota, el veredicto depende de si el problema es factible: se
+cambian los costos a los de la Fase I (1 en los artificiales, 0 en el
+resto) y se sigue pivoteando desde el mismo árbol. Con flujo artificial al
+final de la Fase I los potenciales dan el certificado de Farkas; sin él se
+informa el ciclo pendiente o se vuelve a los costos con M.
+
+Con `respaldo` (lo activa la selección automática) todo resultado que no
+sea el óptimo se confirma resolviendo de nuevo con Dos Fases.
+"""
+
+import numpy as np
+
+from utils.estructura import detectar_red
+
+from .certificados import resumen, verificar_certificado, verificar_rayo
+from .dos_fases import DosFasesSimplex
+from .eventos import consumir, evento_pivoteo, evento_resultado
+
+
+class SimplexRedes:
+    def __init__(self):
+        self.tolerancia = 1e-10
+        self.max_iteraciones = 10000
+        self.verbose = True  # Imprimir cada paso además de guardarlo
+        self.pasos = []
+        self.respaldo = False  # Sin óptimo, resolver de nuevo con Dos Fases
+
+    def agregar_paso(self, texto):
+        """Agregar un paso al proceso de solución"""
+        self.pasos.append(texto)
+        if self.verbose:
+            print(texto)
+
+    def resolver(self, c, A, b, tipos, tipo_objetivo):
+        """Método principal para resolver con simplex de redes"""
+        return consumir(self.iter_resolver(c, A, b, tipos, tipo_objetivo))
+
+    def iter_resolver(self, c, A, b, tipos, tipo_objetivo):
+        """Resolver paso a paso: un evento por pivoteo y uno final con el resultado"""
+        resultado = yield from self.iterar(c, A, b, tipos, tipo_objetivo)
+        if self.respaldo and resultado.get('solucion') is None:
+            resultado = yield from self.resolver_respaldo(c, A, b, tipos, tipo_objetivo)
+        yield evento_resultado(resultado)
+
+    def resolver_respaldo(self, c, A, b, tipos, tipo_objetivo):
+        """Resolver con Dos Fases, reemitiendo sus pivoteos, y sumar sus pasos a los propios"""
+        self.agregar_paso("\n🔁 Sin óptimo con el simplex de redes: se confirma con Dos Fases")
+        solver = DosFasesSimplex()
+        solver.tolerancia = self.tolerancia
+        solver.max_iteraciones = self.max_iteraciones
+        solver.verbose = self.verbose
+        for evento in solver.iter_resolver(c, A, b, tipos, tipo_objetivo):
+            if evento['tipo'] == 'resultado':
+                resultado = evento['resultado']
+            else:
+                yield evento
+        self.pasos.extend(resultado['pasos'])
+        resultado['pasos'] = self.pasos
+        return resultado
+
+    def iterar(self, c, A, b, tipos, tipo_objetivo):
+        """Generador del método: emite los pivoteos y devuelve el resultado"""
+        self.pasos = []
+        self.agregar_paso("🎯 INICIANDO SIMPLEX DE REDES")
+        self.agregar_paso(f"Tipo de problema: {tipo_objetivo.upper()}")
+
+        red = detectar_red(A, tipos, len(c))
+        if red is None:
+            self.agregar_paso("❌ EL PROBLEMA NO TIENE ESTRUCTURA DE RED")
+            self.agregar_paso("💡 Use el método de Gran M o Dos Fases")
+            return {
+                'solucion': None,
+                'valor_optimo': None,
+                'factible': False,
+                'mensaje': 'El problema no tiene estructura de red',
+                'pasos': self.pasos
+            }
+
+        m = len(tipos)
+        n = len(c)
+        raiz = m
+        sentido = 1.0 if tipo_objetivo == 'min' else -1.0
+
+        # Arcos: columnas originales, holguras y artificiales
+        origen = list(red['origen'])
+        destino = list(red['destino'])
+        costo = [sentido * float(valor) for valor in c]
+        oferta = [s * float(valor) for s, valor in zip(red['signos'], b)]
+
+        for i, (s, tipo) in enumerate(zip(red['signos'], tipos)):
+            if tipo == '=':
+                continue
+            if (tipo == '<=') == (s == 1):
+                origen.append(i)
+                destino.append(raiz)
+            else:
+                origen.append(raiz)
+                destino.append(i)
+            costo.append(0.0)
+
+        num_reales = len(costo)
+        M = 1.0 + (m + 1) * max([abs(valor) for valor in costo] + [0.0])
+
+        # Árbol inicial: un arco artificial por nodo, alejándose de la raíz
+        # salvo que el nodo tenga oferta positiva
+        self.padre = [raiz] * m + [-1]
+        self.arco_padre = [-1] * (m + 1)
+        self.hijos = [set() for _ in range(m)] + [set(range(m))]
+        self.profundidad = [1] * m + [0]
+        flujo = [0.0] * num_reales
+        for i in range(m):
+            if oferta[i] > 0:
+                origen.append(i)
+                destino.append(raiz)
+            else:
+                origen.append(raiz)
+                destino.append(i)
+            costo.append(M)
+            flujo.append(abs(oferta[i]))
+            self.arco_padre[i] = len(costo) - 1
+
+        self.origen = origen
+        self.destino = destino
+        self.costo = costo
+        self.flujo = flujo
+        self.potencial = np.zeros(m + 1)
+        for i in range(m):
+            self.actualizar_potencial(i)
+
+        origen_np = np.array(origen, dtype=int)
+        destino_np = np.array(destino, dtype=int)
+        costo_np = np.array(costo)
+
+        self.agregar_paso(f"Nodos: {m} + raíz, arcos: {n} variables + {num_reales - n} holguras")
+
+        # Costo actual (forma min, con la penalización de los artificiales)
+        costo_total = sum(valor * x for valor, x in zip(costo, flujo))
+        costo_fase_1 = [0.0] * num_reales + [1.0] * m
+        fase_1 = False
+        rayo_pendiente = None
+
+        iteracion = 1
+        while iteracion <= self.max_iteraciones:
+            # Costos reducidos de todos los arcos en una sola pasada
+            reducidos = costo_np - self.potencial[origen_np] + self.potencial[destino_np]
+            entra = int(np.argmin(reducidos))
+            if reducidos[entra] >= -self.tolerancia:
+                con_artificiales = any(valor > self.tolerancia for valor in self.flujo[num_reales:])
+                if fase_1 and con_artificiales:
+                    self.agregar_paso("❌ PROBLEMA INFACTIBLE - Arcos artificiales con flujo > 0")
+                    certificado = [-s * float(self.potencial[i]) for i, s in enumerate(red['signos'])]
+                    if not verificar_certificado(A, b, tipos, certificado):
+                        certificado = None
+                    self.agregar_paso(f"📐 Certificado de Farkas: {resumen(certificado, 'y')}" if certificado
+                                      else "⚠️ No se pudo verificar un certificado de Farkas")
+                    return {
+                        'solucion': None,
+                        'valor_optimo': None,
+                        'factible': False,
+                        'certificado': certificado,
+                        'pasos': self.pasos
+                    }
+                if con_artificiales:
+                    self.agregar_paso("⚠️ Arcos artificiales con flujo > 0 en el óptimo: Fase I sobre los artificiales")
+                elif fase_1 and rayo_pendiente is not None:
+                    return self.resultado_ilimitado(c, A, b, tipos, tipo_objetivo, rayo_pendiente)
+                elif fase_1:
+                    self.agregar_paso("✅ Flujo artificial nulo: se vuelve a los costos originales")
+                else:
+                    self.agregar_paso("✅ CONDICIÓN DE OPTIMALIDAD ALCANZADA")
+                    break
+                fase_1 = not fase_1
+                costo_np = self.cambiar_costos(costo_fase_1 if fase_1 else costo)
+                costo_total = sum(valor * x for valor, x in zip(self.costo, self.flujo))
+                continue
+
+            ciclo = self.ciclo(entra)
+            bloqueantes = [(self.flujo[arco], k) for k, (arco, aumenta) in enumerate(ciclo) if not aumenta]
+            if not bloqueantes:
+                # Todos los arcos del ciclo aumentan: los de variables originales forman el rayo
+                rayo = [0.0] * n
+                for arco, _ in ciclo:
+                    if arco < n:
+                        rayo[arco] = 1.0
+                if not any(valor > self.tolerancia for valor in self.flujo[num_reales:]):
+                    return self.resultado_ilimitado(c, A, b, tipos, tipo_objetivo, rayo)
+                # Sin un flujo factible el ciclo no prueba nada: Fase I antes del veredicto
+                self.agregar_paso("⚠️ Ciclo de costo negativo sin cota con arcos artificiales con flujo > 0: "
+                                  "Fase I sobre los artificiales")
+                rayo_pendiente = rayo
+                fase_1 = True
+                costo_np = self.cambiar_costos(costo_fase_1)
+                costo_total = sum(valor * x for valor, x in zip(self.costo, self.flujo))
+                continue
+
+            # Regla de Cunningham: el último arco bloqueante del ciclo
+            theta = min(valor for valor, _ in bloqueantes)
+            sale = max(k for valor, k in bloqueantes if valor <= theta + self.tolerancia)
+            theta = self.flujo[ciclo[sale][0]]
+            arco_sale = ciclo[sale][0]
+
+            for arco, aumenta in ciclo:
+                self.flujo[arco] += theta if aumenta else -theta
+            self.flujo[arco_sale] = 0.0
+
+            self.agregar_paso(f"\n🔄 ITERACIÓN {iteracion}")
+            self.agregar_paso(f"Arco que entra: {self.nombre_arco(entra, n, num_reales)} "
+                              f"(costo reducido {reducidos[entra]:.4f})")
+            self.agregar_paso(f"Arco que sale: {self.nombre_arco(arco_sale, n, num_reales)}, flujo enviado: {theta:.4f}")
+
+            if arco_sale != entra:
+                self.cambiar_base(entra, arco_sale)
+            costo_total += reducidos[entra] * theta
+            yield evento_pivoteo(iteracion, None, entra, arco_sale, sentido * float(costo_total))
+            iteracion += 1
+        else:
+            self.agregar_paso("❌ MÁXIMO NÚMERO DE ITERACIONES ALCANZADO")
+            return {
+                'solucion': None,
+                'valor_optimo': None,
+                'factible': False,
+                'limite_iteraciones': True,
+                'pasos': self.pasos
+            }
+
+        solucion = self.flujo[:n]
+        valor_optimo = sum(valor * x for valor, x in zip(c, solucion))
+
+        self.agregar_paso("\n🎊 SOLUCIÓN ÓPTIMA ENCONTRADA")
+        self.agregar_paso(f"Valor óptimo: {valor_optimo:.4f}")
+
+        return {
+            'solucion': solucion,
+            'valor_optimo': valor_optimo,
+            'factible': True,
+            'iteraciones': iteracion - 1,
+            'pasos': self.pasos
+        }
+
+    def resultado_ilimitado(self, c, A, b, tipos, tipo_objetivo, rayo):
+        """Resultado para un ciclo de costo negativo sin cota con flujo factible"""
+        self.agregar_paso("❌ PROBLEMA ILIMITADO - Ciclo de costo negativo sin cota")
+        # Sin flujo artificial, el flujo de los arcos originales es el punto factible
+        punto = [float(valor) for valor in self.flujo[:len(c)]]
+        if not verificar_rayo(c, A, b, tipos, tipo_objetivo, rayo, punto):
+            rayo = punto = None
+        self.agregar_paso(f"📐 Rayo de mejora: {resumen(rayo, 'x')}" if rayo
+                          else "⚠️ No se pudo verificar un rayo de mejora desde un punto factible")
+        return {
+            'solucion': None,
+            'valor_optimo': None,
+            'factible': False,
+            'ilimitado': True,
+            'rayo': rayo,
+            'punto': punto,
+            'pasos': self.pasos
+        }
+
+    def cambiar_costos(self, costo):
+        """Cambiar los costos de los arcos y recalcular los potenciales de todo el árbol"""
+        self.costo = costo
+        pila = list(self.hijos[len(self.padre) - 1])
+        while pila:
+            w = pila.pop()
+            self.actualizar_potencial(w)
+            pila.extend(self.hijos[w])
+        return np.array(costo)
+
+    def ciclo(self, entra):
+        """
+        Ciclo que forma el arco entrante con el árbol
+
+        Returns:
+            list: (arco, aumenta) en el sentido del ciclo, desde el vértice
+                  común (ápice) bajando hacia el origen del arco entrante,
+                  luego el arco entrante y subiendo desde su destino
+        """
+        u, v = self.origen[entra], self.destino[entra]
+        lado_u, lado_v = [], []
+
+        while u != v:
+            if self.profundidad[u] >= self.profundidad[v]:
+                arco = self.arco_padre[u]
+                # Bajando hacia u el ciclo recorre padre(u) -> u
+                lado_u.append((arco, self.destino[arco] == u))
+                u = self.padre[u]
+            else:
+                arco = self.arco_padre[v]
+                # Subiendo desde v el ciclo recorre v -> padre(v)
+                lado_v.append((arco, self.origen[arco] == v))
+                v = self.padre[v]
+
+        return lado_u[::-1] + [(entra, True)] + lado_v
+
+    def cambiar_base(self, entra, sale):
+        """Reemplazar el arco saliente por el entrante y reenganchar el subárbol cortado"""
+        # Nodo que queda separado de la raíz al quitar el arco saliente
+        q = self.origen[sale] if self.padre[self.origen[sale]] == self.destino[sale] else self.destino[sale]
+
+        # Extremo del arco entrante dentro del subárbol de q
+        x, y = self.origen[entra], self.destino[entra]
+        if not self.en_subarbol(x, q):
+            x, y = y, x
+
+        # Invertir el camino x -> q: cada nodo pasa a colgar del anterior
+        nuevo_padre, nuevo_arco = y, entra
+        w = x
+        while True:
+            viejo_padre, viejo_arco = self.padre[w], self.arco_padre[w]
+            self.hijos[viejo_padre].discard(w)
+            self.padre[w] = nuevo_padre
+            self.arco_padre[w] = nuevo_arco
+            self.hijos[nuevo_padre].add(w)
+            if w == q:
+                break
+            nuevo_padre, nuevo_arco = w, viejo_arco
+            w = viejo_padre
+
+        # Profundidad y potenciales solo del subárbol reenganchado
+        pila = [x]
+        while pila:
+            w = pila.pop()
+            self.profundidad[w] = self.profundidad[self.padre[w]] + 1
+            self.actualizar_potencial(w)
+            pila.extend(self.hijos[w])
+
+    def en_subarbol(self, nodo, q):
+        """Indicar si nodo cuelga de q (subiendo a lo sumo hasta la profundidad de q)"""
+        while self.profundidad[nodo] > self.profundidad[q]:
+            nodo = self.padre[nodo]
+        return nodo == q
+
+    def actualizar_potencial(self, w):
+        """Potencial de w a partir de su padre: el arco del árbol tiene costo reducido 0"""
+        arco = self.arco_padre[w]
+        if self.destino[arco] == w:
+            self.potencial[w] = self.potencial[self.origen[arco]] - self.costo[arco]
+        else:
+            self.potencial[w] = self.potencial[self.destino[arco]] + self.costo[arco]
+
+    def nombre_arco(self, arco, n, num_reales):
+        """Descripción legible de un arco"""
+        raiz = len(self.padre) - 1
+        nodos = ['raíz' if nodo == raiz else str(nodo + 1) for nodo in (self.origen[arco], self.destino[arco])]
+        extremos = '->'.join(nodos)
+        if arco < n:
+            return f"x{arco + 1} ({extremos})"
+        if arco < num_reales:
+            return f"holgura ({extremos})"
+        return f"artificial ({extremos})"
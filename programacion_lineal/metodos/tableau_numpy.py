@@ -0,0 +1,206 @@
+"""
+Tableau como arreglo de numpy: en memoria, en disco y con varios hilos
+
+Funciones de los backends 'numpy' y 'hilos' de metodos.kernels:
+
+- `solver.tableau_en_disco = True` (o un directorio): el tableau es un
+  numpy.memmap sobre un archivo temporal, para modelos que no caben en
+  memoria: 8 bytes por coeficiente en vez de ~32, y el sistema operativo
+  decide qué parte vive en RAM. El archivo se borra al liberar el tableau.
+- `solver.hilos = 8` (None: todos los núcleos): el pivoteo, el pricing y
+  la razón mínima se reparten entre hilos.
+
+    solver = GranMSimplex()
+    solver.tableau_en_disco = '/datos/tmp'
+    solver.hilos = None
+    solver.verbose = False
+    resultado = solver.resolver(c, A, b, tipos, 'max')   # A puede ser un memmap
+
+El pivoteo recorre el tableau por bloques de filas de hasta BYTES_BLOQUE:
+cada bloque se lee, se actualiza con operaciones de numpy y vuelve a la
+memoria (o al archivo) una sola vez por pivoteo, con temporales acotados
+al tamaño del bloque. Con hilos, los bloques se reparten en un pool: las
+operaciones de numpy sobre float64 liberan el GIL, así que los bloques se
+actualizan en paralelo. El pricing y la razón mínima se dividen en tramos
+contiguos cuando la fila o la columna tiene al menos MIN_ELEMENTOS_HILOS
+elementos; con menos, coordinar los hilos cuesta más que recorrerla.
+
+Solo se tocan las columnas hasta el último coeficiente no nulo de la fila
+pivote (más el RHS): las columnas implícitas todavía sin materializar (ver
+metodos.implicitas) ocupan el final del arreglo y nunca se leen.
+
+Las reglas de entrada y salida son las mismas que con listas (primer
+costo más negativo, primera razón mínima), así que los pivoteos coinciden
+con cualquier número de hilos. Las trazas no muestran el tableau; el
+resultado lo trae como listas, salvo en disco ('tableau' es None).
+"""
+
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+BYTES_BLOQUE = 4 * 2 ** 20      # Tamaño máximo del bloque de filas que se actualiza de una vez
+MIN_CELDAS_HILOS = 1_000_000    # Celdas del tableau desde las que conviene pivotear con hilos
+MIN_ELEMENTOS_HILOS = 500_000   # Elementos desde los que se reparten el pricing y la razón mínima
+
+EJECUTORES = {}  # Un pool por número de hilos, compartido entre resoluciones
+
+
+def numero_hilos(hilos):
+    """Hilos pedidos (None: todos los núcleos)"""
+    return hilos if hilos is not None else os.cpu_count() or 1
+
+
+def ejecutor(hilos):
+    """Pool de `hilos` hilos (se crea la primera vez)"""
+    if hilos not in EJECUTORES:
+        EJECUTORES[hilos] = ThreadPoolExecutor(max_workers=hilos, thread_name_prefix='pivoteo')
+    return EJECUTORES[hilos]
+
+
+def en_tramos(funcion, total, hilos):
+    """funcion(inicio, fin) sobre tramos contiguos de range(total), uno por hilo; resultados en orden"""
+    largo = -(-total // hilos)
+    return list(ejecutor(hilos).map(lambda inicio: funcion(inicio, min(total, inicio + largo)),
+                                    range(0, total, largo)))
+
+
+def crear(filas, columnas, directorio=None):
+    """Tableau de ceros en memoria o, con directorio (True: el del sistema), en un archivo temporal"""
+    if not directorio:
+        return np.zeros((filas, columnas))
+    archivo = tempfile.TemporaryFile(prefix='tableau_', dir=None if directorio is True else directorio)
+    return np.memmap(archivo, dtype=np.float64, mode='w+', shape=(filas, columnas))
+
+
+def desde_filas(A, b, fila_objetivo, columnas, directorio=None, signos=None):
+    """
+    Tableau con A y b (listas, arreglos o memmaps), fila por fila
+
+    Args:
+        fila_objetivo: Coeficientes de las columnas de A más el RHS
+        columnas: Ancho total, con el RHS (las columnas del medio quedan en 0)
+        directorio: Como en `crear`
+        signos: Factor 1.0 o -1.0 por fila; A y b solo se leen
+    """
+    m, n = len(A), len(fila_objetivo) - 1
+    tableau = crear(m + 1, columnas, directorio)
+    for i in range(m):
+        tableau[i, :n] = A[i]
+        tableau[i, -1] = b[i]
+        if signos is not None and signos[i] < 0:
+            tableau[i, :n] *= -1.0
+            tableau[i, -1] *= -1.0
+    tableau[-1, :n] = fila_objetivo[:n]
+    tableau[-1, -1] = fila_objetivo[-1]
+    return tableau
+
+
+def columna_pivote(tableau, tolerancia, hilos=1):
+    """Columna con el costo más negativo de la fila objetivo, o -1"""
+    fila_objetivo = tableau[-1, :-1]
+    n = len(fila_objetivo)
+    if not n:
+        return -1
+    hilos = numero_hilos(hilos)
+
+    if hilos > 1 and n >= MIN_ELEMENTOS_HILOS:
+        def minimo(inicio, fin):
+            col = inicio + int(np.argmin(fila_objetivo[inicio:fin]))
+            return fila_objetivo[col], col
+        # Empates: gana el tramo de la izquierda, como en el recorrido secuencial
+        valor, col = min(en_tramos(minimo, n, hilos))
+    else:
+        col = int(np.argmin(fila_objetivo))
+        valor = fila_objetivo[col]
+    return col if valor < -tolerancia else -1
+
+
+def fila_pivote(tableau, col_pivote, tolerancia, hilos=1):
+    """Fila con la razón mínima sobre la columna pivote, o -1"""
+    m = tableau.shape[0] - 1
+
+    def minima(inicio, fin):
+        columna = np.array(tableau[inicio:fin, col_pivote])
+        rhs = np.array(tableau[inicio:fin, -1])
+        filas = np.flatnonzero(columna > tolerancia)
+        if not len(filas):
+            return float('inf'), -1
+        # Un RHS apenas negativo por redondeo cuenta como 0
+        razones = np.maximum(rhs[filas], 0.0) / columna[filas]
+        k = int(np.argmin(razones))
+        return razones[k], inicio + int(filas[k])
+
+    hilos = numero_hilos(hilos)
+    if hilos > 1 and m >= MIN_ELEMENTOS_HILOS:
+        candidatos = [candidato for candidato in en_tramos(minima, m, hilos) if candidato[1] != -1]
+        return min(candidatos)[1] if candidatos else -1
+    return minima(0, m)[1]
+
+
+def filas_por_bloque(tableau, bytes_bloque=BYTES_BLOQUE):
+    """Filas que entran en un bloque de `bytes_bloque` bytes"""
+    return max(1, bytes_bloque // (tableau.shape[1] * tableau.itemsize))
+
+
+def pivotear(tableau, fila_pivote, col_pivote, hilos=1, bytes_bloque=BYTES_BLOQUE):
+    """Pivoteo en el lugar, bloque de filas por bloque de filas (en paralelo con hilos)"""
+    fila = np.array(tableau[fila_pivote])
+    fila /= fila[col_pivote]
+    tableau[fila_pivote] = fila
+
+    # Las columnas después del último no nulo de la fila pivote no cambian
+    ancho = int(np.flatnonzero(fila[:-1])[-1]) + 1
+    coeficientes, rhs = fila[:ancho], fila[-1]
+
+    def actualizar(inicio, fin):
+        bloque = tableau[inicio:fin]
+        factores = np.array(bloque[:, col_pivote])
+        if inicio <= fila_pivote < fin:
+            factores[fila_pivote - inicio] = 0.0
+        filas = np.flatnonzero(factores)
+        if len(filas) == len(factores):
+            bloque[:, :ancho] -= factores[:, None] * coeficientes
+            bloque[:, -1] -= factores * rhs
+        elif len(filas):
+            factores = factores[filas]
+            bloque[filas, :ancho] -= factores[:, None] * coeficientes
+            bloque[filas, -1] -= factores * rhs
+
+    total = tableau.shape[0]
+    paso = filas_por_bloque(tableau, bytes_bloque)
+    hilos = numero_hilos(hilos)
+    if hilos > 1 and total * ancho >= MIN_CELDAS_HILOS:
+        # Al menos unos cuatro bloques por hilo para repartir bien la carga
+        paso = max(1, min(paso, total // (4 * hilos)))
+        list(ejecutor(hilos).map(lambda inicio: actualizar(inicio, min(total, inicio + paso)), range(0, total, paso)))
+    else:
+        for inicio in range(0, total, paso):
+            actualizar(inicio, min(total, inicio + paso))
+
+
+def quitar(tableau, filas=(), columnas=(), directorio=None):
+    """Copia del tableau sin las filas y columnas dadas, bloque por bloque (directorio: como en `crear`)"""
+    quedan_filas = np.setdiff1d(np.arange(tableau.shape[0]), np.asarray(filas, dtype=int))
+    quedan_columnas = np.setdiff1d(np.arange(tableau.shape[1]), np.asarray(columnas, dtype=int))
+    nuevo = crear(len(quedan_filas), len(quedan_columnas), directorio)
+    paso = filas_por_bloque(tableau)
+    for inicio in range(0, len(quedan_filas), paso):
+        nuevo[inicio:inicio + paso] = tableau[quedan_filas[inicio:inicio + paso]][:, quedan_columnas]
+    return nuevo
+
+
+def expandir(tableau, implicitas=None):
+    """Tableau como listas; con `implicitas`, completo y en el orden lógico (ver ColumnasImplicitas.expandir)"""
+    if implicitas is None:
+        return tableau.tolist()
+    completo = np.zeros((tableau.shape[0], implicitas.total + 1))
+    completo[:, implicitas.logicas] = tableau[:, :len(implicitas.logicas)]
+    completo[:, -1] = tableau[:, -1]
+    for fila, columnas in implicitas.pendientes.items():
+        for logica, signo, entrada_objetivo in columnas:
+            completo[fila, logica] = signo
+            completo[-1, logica] = entrada_objetivo
+    return completo.tolist()
@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""
+Ejecutar el servicio HTTP/JSON de resolución
+
+    python run_servidor.py --puerto 8000 --trabajadores 4
+
+    curl -X POST localhost:8000/solve -d '{"c": [3, 5], "A": [[1, 0], [0, 2], [3, 2]],
+         "b": [4, 12, 18], "tipos": ["<=", "<=", "<="], "sense": "max"}'
+"""
+
+import argparse
+
+from interfaz.servidor import ServidorSolver
+
+
+def main():
+    """Función principal"""
+    parser = argparse.ArgumentParser(description="Servicio HTTP/JSON de programación lineal")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--puerto', type=int, default=8000)
+    parser.add_argument('--trabajadores', type=int, default=None,
+                        help="Procesos de resolución (por defecto, uno por núcleo)")
+    parser.add_argument('--cola', type=int, default=64,
+                        help="Problemas que pueden esperar turno antes de responder 503")
+    args = parser.parse_args()
+
+    servidor = ServidorSolver(args.host, args.puerto, args.trabajadores, args.cola)
+    print("🚀 INICIANDO SERVICIO DE PROGRAMACIÓN LINEAL")
+    servidor.iniciar()
+    print(f"✅ Escuchando en http://{args.host}:{servidor.puerto} con {servidor.trabajadores} trabajadores")
+    print("   POST /solve, POST /solve/batch, GET /health, GET /metrics")
+
+    try:
+        servidor.servir()
+    except KeyboardInterrupt:
+        print("\n👋 Servicio detenido")
+
+
+if __name__ == "__main__":
+    main()
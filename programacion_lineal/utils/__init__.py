@@ -1,8 +1,30 @@
-from .validadores import leer_funcion_objetivo, leer_restricciones, mostrar_resumen, validar_entrada_numerica
-from .casos_especiales import (
-    ManejadorCasosEspeciales,
-    detectar_degeneracion,
-    detectar_soluciones_multiples,
-    verificar_problema_ilimitado,
-    detectar_problema_infactible
-)
\ No newline at end of file
+# Cada utilidad se importa al pedirla: leer un archivo MPS no necesita
+# cargar los validadores interactivos ni el analizador de expresiones
+from importlib import import_module
+
+MODULOS = {
+    'leer_funcion_objetivo': 'validadores',
+    'leer_restricciones': 'validadores',
+    'mostrar_resumen': 'validadores',
+    'validar_entrada_numerica': 'validadores',
+    'ManejadorCasosEspeciales': 'casos_especiales',
+    'detectar_degeneracion': 'casos_especiales',
+    'detectar_soluciones_multiples': 'casos_especiales',
+    'verificar_problema_ilimitado': 'casos_especiales',
+    'detectar_problema_infactible': 'casos_especiales',
+}
+
+__all__ = list(MODULOS)
+
+
+def __getattr__(nombre):
+    modulo = MODULOS.get(nombre)
+    if modulo is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {nombre!r}")
+    valor = getattr(import_module(f".{modulo}", __name__), nombre)
+    globals()[nombre] = valor
+    return valor
+
+
+def __dir__():
+    return sorted(set(globals()) | set(MODULOS))
@@ -227,15 +227,11 @@ class ManejadorCasosEspeciales:
         fila_objetivo = tableau[-1]
         
         # Regla de Bland: Elegir la variable con menor índice que mejore
+        # (la fila objetivo está en forma de maximización para max y min)
         for j in range(len(fila_objetivo) - 1):
-            if tipo_objetivo == 'max':
-                if fila_objetivo[j] < -self.tolerancia:
-                    print(f"🔄 Regla de Bland aplicada: Variable x{j+1} seleccionada")
-                    return j
-            else:
-                if fila_objetivo[j] > self.tolerancia:
-                    print(f"🔄 Regla de Bland aplicada: Variable x{j+1} seleccionada")
-                    return j
+            if fila_objetivo[j] < -self.tolerancia:
+                print(f"🔄 Regla de Bland aplicada: Variable x{j+1} seleccionada")
+                return j
         
         return -1  # Óptimo alcanzado
 
@@ -0,0 +1,136 @@
+"""
+Análisis de la estructura de la matriz de restricciones
+
+Se trabaja sobre el grafo bipartito filas/columnas de A (una arista por
+coeficiente no nulo). Cada componente conexa es un subproblema que no
+comparte variables ni restricciones con el resto y puede resolverse por
+separado.
+"""
+
+import numpy as np
+
+
+def coeficientes_no_nulos(A):
+    """Índices de fila, de columna y valores de los coeficientes no nulos de A"""
+    if hasattr(A, 'tocoo'):
+        coo = A.tocoo()
+        mascara = coo.data != 0
+        return coo.row[mascara], coo.col[mascara], coo.data[mascara], coo.shape
+    matriz = np.asarray(A, dtype=float)
+    if matriz.size == 0:
+        matriz = np.zeros((0, 0))
+    filas, columnas = np.nonzero(matriz)
+    return filas, columnas, matriz[filas, columnas], matriz.shape
+
+
+def detectar_bloques(A, num_variables=None):
+    """
+    Separar el problema en componentes conexas del grafo filas/columnas
+
+    Args:
+        A: Matriz de restricciones (lista de listas, numpy o scipy.sparse)
+        num_variables: Número de variables si A no tiene filas
+
+    Returns:
+        list: Un dict por bloque con 'filas' y 'columnas' (índices
+              ordenados). Una columna sin coeficientes forma un bloque sin
+              filas y una fila vacía un bloque sin columnas. Los bloques se
+              ordenan por su primera columna (o fila, si no tiene columnas).
+    """
+    filas, columnas, _, forma = coeficientes_no_nulos(A)
+    m = forma[0]
+    n = forma[1] if m > 0 else (num_variables or 0)
+
+    # Unión-búsqueda: nodos 0..n-1 son columnas, n..n+m-1 son filas
+    padre = list(range(n + m))
+
+    def raiz(nodo):
+        while padre[nodo] != nodo:
+            padre[nodo] = padre[padre[nodo]]
+            nodo = padre[nodo]
+        return nodo
+
+    for i, j in zip(filas.tolist(), columnas.tolist()):
+        ri, rj = raiz(n + i), raiz(j)
+        if ri != rj:
+            padre[ri] = rj
+
+    grupos = {}
+    for nodo in range(n + m):
+        grupos.setdefault(raiz(nodo), []).append(nodo)
+
+    bloques = []
+    for nodos in grupos.values():
+        bloques.append({
+            'columnas': [nodo for nodo in nodos if nodo < n],
+            'filas': [nodo - n for nodo in nodos if nodo >= n]
+        })
+
+    bloques.sort(key=lambda bloque: (not bloque['columnas'],
+                                     bloque['columnas'][0] if bloque['columnas'] else bloque['filas'][0]))
+    return bloques
+
+
+def detectar_red(A, tipos, num_variables=None):
+    """
+    Reconocer una matriz de incidencia nodo-arco
+
+    Cada fila es un nodo. Se buscan signos por fila (coloración con signo
+    del grafo de filas) tales que, tras multiplicar cada fila por su signo,
+    toda columna tenga a lo sumo un +1 (nodo de origen) y un -1 (nodo de
+    destino). Las columnas con un solo coeficiente son arcos hacia o desde
+    un nodo raíz ficticio con índice m. Así se reconocen también los
+    modelos de transporte y asignación (filas de demanda con signo -1).
+
+    Returns:
+        dict: 'signos' por fila y 'origen'/'destino' por columna, o None si
+              A no tiene estructura de red
+    """
+    filas, columnas, valores, forma = coeficientes_no_nulos(A)
+    m = len(tipos)
+    n = forma[1] if forma[0] > 0 else (num_variables or 0)
+
+    if np.any(np.abs(valores) != 1):
+        return None
+    if np.any(np.bincount(columnas, minlength=n) > 2):
+        return None
+
+    # Coeficientes de cada columna: [(fila, valor), ...]
+    entradas = [[] for _ in range(n)]
+    for i, j, a in zip(filas.tolist(), columnas.tolist(), valores.tolist()):
+        entradas[j].append((i, a))
+
+    # Grafo de filas: dos filas vecinas si comparten una columna
+    vecinos = [[] for _ in range(m)]
+    for par in entradas:
+        if len(par) == 2:
+            (p, a_p), (q, a_q) = par
+            if p == q:
+                return None
+            vecinos[p].append((q, a_p * a_q))
+            vecinos[q].append((p, a_p * a_q))
+
+    # Coloración con signo: s_p·a_p = -s_q·a_q
+    signos = [0] * m
+    for inicio in range(m):
+        if signos[inicio]:
+            continue
+        signos[inicio] = 1
+        pila = [inicio]
+        while pila:
+            p = pila.pop()
+            for q, producto in vecinos[p]:
+                requerido = -signos[p] * int(producto)
+                if signos[q] == 0:
+                    signos[q] = requerido
+                    pila.append(q)
+                elif signos[q] != requerido:
+                    return None
+
+    origen, destino = [], []
+    for par in entradas:
+        extremos = {signos[i] * a: i for i, a in par}
+        origen.append(extremos.get(1, m))
+        destino.append(extremos.get(-1, m))
+
+    return {'signos': signos, 'origen': origen, 'destino': destino}
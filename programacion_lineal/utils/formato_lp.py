@@ -0,0 +1,400 @@
+"""
+Lectura y escritura de archivos en formato LP de CPLEX
+
+    \\ Comentario
+    Maximize
+     obj: 3 x1 + 5 x2
+    Subject To
+     c1: x1 <= 4
+     c2: 2 x2 <= 12
+     c3: 3 x1 + 2 x2 <= 18
+     r1: 1 <= x1 + x2 <= 9
+    Bounds
+     x2 <= 10
+     x3 free
+    Generals
+     x1
+    End
+
+El lector avanza línea por línea y va cerrando cada restricción en cuanto
+aparece su lado derecho, de modo que las restricciones pueden ocupar
+varias líneas y los coeficientes se guardan directamente en los arreglos
+dispersos del modelo (ver utils.modelo). Las restricciones con rango
+(lo <= expresión <= hi) quedan como '>=' lo con rango hi - lo. No se
+admiten términos cuadráticos, SOS ni variables semicontinuas.
+"""
+
+import math
+import re
+
+import numpy as np
+
+from .formato_mps import abrir
+from .modelo import ConstructorModelo, formato_numero, intervalo_rango
+
+TOKEN = re.compile(r'''
+      (?P<numero>(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?)
+    | (?P<relacion><=|>=|=<|=>|<|>|=)
+    | (?P<signo>[+-])
+    | (?P<dos_puntos>:)
+    | (?P<por>\*)
+    | (?P<nombre>[A-Za-z_!"\#$%&()/,;?@`'{}|~][^\s+\-*<>=:^\[\]\\]*)
+    | (?P<otro>\S)
+''', re.VERBOSE)
+
+NOMBRE_VALIDO = re.compile(r'''[A-Za-z_!"#$%&()/,;?@`'{}|~][^\s+\-*<>=:^\[\]\\]*''')
+
+SECCION = re.compile(r'''\s*(?:
+      (?P<max>max(?:imize|imise|imum)?)
+    | (?P<min>min(?:imize|imise|imum)?)
+    | (?P<restricciones>subject\s+to|such\s+that|s\.?t\.?)
+    | (?P<cotas>bounds?)
+    | (?P<enteras>generals?|gen|integers?)
+    | (?P<binarias>binary|binaries|bin)
+    | (?P<no_admitida>semi-continuous|semis?|sos)
+    | (?P<fin>end)
+)(?=\s|$)''', re.VERBOSE | re.IGNORECASE)
+
+RELACIONES = {'<=': '<=', '=<': '<=', '<': '<=', '>=': '>=', '=>': '>=', '>': '>=', '=': '='}
+INFINITOS = ('inf', 'infinity')
+
+
+def tokens(linea):
+    """(tipo, texto) de cada símbolo de una línea, sin el comentario"""
+    linea = linea.split('\\', 1)[0]
+    for coincidencia in TOKEN.finditer(linea):
+        tipo = coincidencia.lastgroup
+        if tipo == 'otro':
+            raise ValueError(f"Símbolo inesperado: {coincidencia.group()!r}")
+        yield tipo, coincidencia.group()
+
+
+def leer_lp(origen):
+    """
+    Leer un archivo LP de CPLEX
+
+    Returns:
+        dict: Modelo disperso (ver utils.modelo)
+
+    Raises:
+        ValueError: Si el archivo no es LP válido (se indica la línea)
+    """
+    archivo, propio = abrir(origen, 'r')
+    try:
+        return leer_lineas(archivo)
+    finally:
+        if propio:
+            archivo.close()
+
+
+def leer_lineas(archivo):
+    modelo = ConstructorModelo()
+    seccion = None
+    objetivo = []    # El objetivo se interpreta entero al cambiar de sección
+    pendiente = []   # Símbolos de la restricción en curso
+    numero = 0
+
+    try:
+        for numero, linea in enumerate(archivo, 1):
+            encabezado = SECCION.match(linea)
+            if encabezado:
+                if seccion in ('max', 'min'):
+                    agregar_objetivo(modelo, objetivo)
+                if pendiente:
+                    raise ValueError("Restricción incompleta antes de la sección")
+                seccion = encabezado.lastgroup
+                if seccion == 'no_admitida':
+                    raise ValueError(f"Sección no admitida: {encabezado.group().strip()}")
+                if seccion == 'fin':
+                    break
+                if seccion in ('max', 'min'):
+                    modelo.sentido = seccion
+                linea = linea[encabezado.end():]
+
+            simbolos = list(tokens(linea))
+            if not simbolos:
+                continue
+
+            if seccion in ('max', 'min'):
+                objetivo.extend(simbolos)
+            elif seccion == 'restricciones':
+                for simbolo in simbolos:
+                    pendiente.append(simbolo)
+                    if restriccion_completa(pendiente):
+                        agregar_restriccion(modelo, pendiente)
+                        pendiente = []
+            elif seccion == 'cotas':
+                agregar_cota(modelo, simbolos)
+            elif seccion in ('enteras', 'binarias'):
+                for tipo, texto in simbolos:
+                    if tipo != 'nombre':
+                        raise ValueError(f"Se esperaba un nombre de variable, no {texto!r}")
+                    j = modelo.variable(texto)
+                    modelo.enteras.add(j)
+                    if seccion == 'binarias':
+                        modelo.inferiores[j], modelo.superiores[j] = 0.0, 1.0
+            else:
+                raise ValueError("Falta la sección Maximize o Minimize")
+
+        if seccion in ('max', 'min'):
+            agregar_objetivo(modelo, objetivo)
+        if pendiente:
+            raise ValueError("Restricción incompleta al final del archivo")
+    except ValueError as e:
+        raise ValueError(f"Línea {numero}: {e}") from None
+
+    return modelo.terminar()
+
+
+def separar_nombre(simbolos):
+    """(nombre o None, resto) de 'nombre: ...'"""
+    if len(simbolos) >= 2 and simbolos[0][0] == 'nombre' and simbolos[1][0] == 'dos_puntos':
+        return simbolos[0][1], simbolos[2:]
+    return None, simbolos
+
+
+def terminos(simbolos):
+    """
+    Términos lineales de una expresión
+
+    Returns:
+        tuple: (lista de (variable, coeficiente), constante)
+    """
+    lista = []
+    constante = 0.0
+    signo, coeficiente = 1.0, None
+    for tipo, texto in simbolos:
+        if tipo == 'signo':
+            if coeficiente is not None:
+                constante += signo * coeficiente
+                signo, coeficiente = 1.0, None
+            if texto == '-':
+                signo = -signo
+        elif tipo == 'numero':
+            if coeficiente is not None:
+                raise ValueError(f"Dos números seguidos: {texto}")
+            coeficiente = float(texto)
+        elif tipo == 'nombre':
+            lista.append((texto, signo * (1.0 if coeficiente is None else coeficiente)))
+            signo, coeficiente = 1.0, None
+        elif tipo != 'por':
+            raise ValueError(f"Símbolo inesperado en la expresión: {texto!r}")
+    if coeficiente is not None:
+        constante += signo * coeficiente
+    return lista, constante
+
+
+def agregar_objetivo(modelo, simbolos):
+    nombre, resto = separar_nombre(simbolos)
+    if nombre is not None:
+        modelo.objetivo = nombre
+    lista, constante = terminos(resto)
+    for variable, coeficiente in lista:
+        modelo.c[modelo.variable(variable)] += coeficiente
+    modelo.constante += constante
+
+
+def restriccion_completa(simbolos):
+    """La restricción termina con el número que sigue a su última relación"""
+    if simbolos[-1][0] != 'numero':
+        return False
+    anterior = simbolos[-2] if len(simbolos) >= 2 else None
+    if anterior is not None and anterior[0] == 'signo':
+        anterior = simbolos[-3] if len(simbolos) >= 3 else None
+    if anterior is None or anterior[0] != 'relacion':
+        return False
+    # Con rango (lo <= expr <= hi) hacen falta dos relaciones
+    _, resto = separar_nombre(simbolos)
+    inicio = 1 if resto and resto[0][0] == 'signo' else 0
+    con_rango = len(resto) > inicio + 1 and resto[inicio][0] == 'numero' and resto[inicio + 1][0] == 'relacion'
+    relaciones = sum(1 for tipo, _ in simbolos if tipo == 'relacion')
+    return relaciones == (2 if con_rango else 1)
+
+
+def agregar_restriccion(modelo, simbolos):
+    nombre, resto = separar_nombre(simbolos)
+    posiciones = [k for k, (tipo, _) in enumerate(resto) if tipo == 'relacion']
+
+    if len(posiciones) == 1:
+        k = posiciones[0]
+        izquierda, constante_izq = terminos(resto[:k])
+        derecha, constante_der = terminos(resto[k + 1:])
+        tipo = RELACIONES[resto[k][1]]
+        i = modelo.restriccion(nombre, tipo, constante_der - constante_izq)
+        coeficientes = izquierda + [(variable, -valor) for variable, valor in derecha]
+    else:
+        k1, k2 = posiciones
+        _, extremo_izq = terminos(resto[:k1])
+        coeficientes, constante = terminos(resto[k1 + 1:k2])
+        _, extremo_der = terminos(resto[k2 + 1:])
+        tipos = RELACIONES[resto[k1][1]], RELACIONES[resto[k2][1]]
+        if tipos == ('<=', '<='):
+            inferior, superior = extremo_izq - constante, extremo_der - constante
+        elif tipos == ('>=', '>='):
+            inferior, superior = extremo_der - constante, extremo_izq - constante
+        else:
+            raise ValueError("Un rango necesita dos relaciones en el mismo sentido")
+        i = modelo.restriccion(nombre, '>=', inferior)
+        modelo.rangos[i] = superior - inferior
+
+    for variable, valor in coeficientes:
+        modelo.coeficiente(i, modelo.variable(variable), valor)
+
+
+def valor_cota(simbolos):
+    """Número (con signo, admite inf) de un extremo de una cota"""
+    signo = 1.0
+    for tipo, texto in simbolos[:-1]:
+        if tipo != 'signo':
+            raise ValueError(f"Cota mal formada cerca de {texto!r}")
+        if texto == '-':
+            signo = -signo
+    tipo, texto = simbolos[-1]
+    if tipo == 'nombre' and texto.lower() in INFINITOS:
+        return signo * math.inf
+    if tipo != 'numero':
+        raise ValueError(f"Se esperaba un número, no {texto!r}")
+    return signo * float(texto)
+
+
+def agregar_cota(modelo, simbolos):
+    """Una línea de Bounds: 'x free', 'x <= u', 'l <= x', 'l <= x <= u', 'x = v'"""
+    if len(simbolos) == 2 and simbolos[1][0] == 'nombre' and simbolos[1][1].lower() == 'free':
+        j = modelo.variable(simbolos[0][1])
+        modelo.inferiores[j], modelo.superiores[j] = -math.inf, math.inf
+        return
+
+    posiciones = [k for k, (tipo, _) in enumerate(simbolos) if tipo == 'relacion']
+    partes = [simbolos[a + 1:b] for a, b in zip([-1] + posiciones, posiciones + [len(simbolos)])]
+    relaciones = [RELACIONES[simbolos[k][1]] for k in posiciones]
+    if not partes or any(not parte for parte in partes):
+        raise ValueError("Cota mal formada")
+
+    if len(partes) == 3:
+        # l <= x <= u (o u >= x >= l)
+        variable = partes[1]
+        extremos = [(valor_cota(partes[0]), invertir(relaciones[0])), (valor_cota(partes[2]), relaciones[1])]
+    elif len(partes) == 2 and es_variable(partes[0]):
+        variable = partes[0]
+        extremos = [(valor_cota(partes[1]), relaciones[0])]
+    elif len(partes) == 2:
+        variable = partes[1]
+        extremos = [(valor_cota(partes[0]), invertir(relaciones[0]))]
+    else:
+        raise ValueError("Cota mal formada")
+
+    if not es_variable(variable):
+        raise ValueError("Se esperaba una variable en la cota")
+    j = modelo.variable(variable[0][1])
+    for valor, relacion in extremos:
+        if relacion in ('<=', '='):
+            modelo.superiores[j] = valor
+        if relacion in ('>=', '='):
+            modelo.inferiores[j] = valor
+
+
+def es_variable(parte):
+    return len(parte) == 1 and parte[0][0] == 'nombre' and parte[0][1].lower() not in INFINITOS
+
+
+def invertir(relacion):
+    """Relación vista desde la variable: 'l <= x' es 'x >= l'"""
+    return {'<=': '>=', '>=': '<=', '=': '='}[relacion]
+
+
+def escribir_lp(modelo, destino):
+    """
+    Escribir el modelo en formato LP de CPLEX
+
+    Las filas se recorren sin construir la matriz densa. Todas las
+    variables aparecen en el objetivo (con coeficiente 0 si hace falta)
+    para que la lectura conserve su orden.
+
+    Raises:
+        ValueError: Si algún nombre no es válido en formato LP
+    """
+    for nombre in modelo['variables'] + modelo['restricciones']:
+        if not NOMBRE_VALIDO.fullmatch(nombre) or nombre.lower() in INFINITOS:
+            raise ValueError(f"Nombre no válido en formato LP: {nombre!r}")
+
+    archivo, propio = abrir(destino, 'w')
+    try:
+        escribir_lineas(modelo, archivo)
+    finally:
+        if propio:
+            archivo.close()
+
+
+def expresion(variables, coeficientes):
+    """Líneas de texto de una suma de términos, cortadas cada ~200 caracteres"""
+    lineas, actual = [], ''
+    for variable, valor in zip(variables, coeficientes):
+        signo = '-' if valor < 0 else '+'
+        termino = f"{signo} {formato_numero(abs(valor))} {variable}"
+        if not actual:
+            termino = f"{'-' if valor < 0 else ''}{formato_numero(abs(valor))} {variable}"
+        if len(actual) + len(termino) > 200:
+            lineas.append(actual)
+            actual = ''
+        actual = f"{actual} {termino}" if actual else termino
+    lineas.append(actual)
+    return '\n   '.join(lineas)
+
+
+def escribir_lineas(modelo, archivo):
+    variables = modelo['variables']
+    restricciones = modelo['restricciones']
+    escribir = archivo.write
+
+    if modelo.get('nombre'):
+        escribir(f"\\ Modelo: {modelo['nombre']}\n")
+    escribir("Maximize\n" if modelo['sentido'] == 'max' else "Minimize\n")
+    objetivo = expresion(variables, modelo['c'].tolist())
+    if modelo.get('constante'):
+        constante = modelo['constante']
+        objetivo += f" {'-' if constante < 0 else '+'} {formato_numero(abs(constante))}"
+    escribir(f" {modelo.get('objetivo') or 'obj'}: {objetivo}\n")
+
+    escribir("Subject To\n")
+    orden = np.lexsort((modelo['columnas'], modelo['filas']))
+    filas = modelo['filas'][orden]
+    columnas = modelo['columnas'][orden]
+    valores = modelo['valores'][orden]
+    limites = np.searchsorted(filas, np.arange(len(restricciones) + 1))
+
+    for i, (nombre, tipo, rhs) in enumerate(zip(restricciones, modelo['tipos'], modelo['b'].tolist())):
+        inicio, fin = limites[i], limites[i + 1]
+        if inicio == fin:
+            texto = f"0 {variables[0]}"  # Fila vacía: el formato exige una variable
+        else:
+            texto = expresion([variables[j] for j in columnas[inicio:fin].tolist()],
+                              valores[inicio:fin].tolist())
+        if i in modelo.get('rangos', {}):
+            inferior, superior = intervalo_rango(tipo, rhs, modelo['rangos'][i])
+            escribir(f" {nombre}: {formato_numero(inferior)} <= {texto} <= {formato_numero(superior)}\n")
+        else:
+            escribir(f" {nombre}: {texto} {tipo} {formato_numero(rhs)}\n")
+
+    escribir("Bounds\n")
+    for nombre, inferior, superior in zip(variables, modelo['inferiores'].tolist(), modelo['superiores'].tolist()):
+        if inferior == superior:
+            escribir(f" {nombre} = {formato_numero(inferior)}\n")
+        elif inferior == -math.inf and superior == math.inf:
+            escribir(f" {nombre} free\n")
+        elif inferior == 0 and superior == math.inf:
+            continue
+        elif superior == math.inf:
+            escribir(f" {nombre} >= {formato_numero(inferior)}\n")
+        elif inferior == 0 and superior > 0:
+            escribir(f" {nombre} <= {formato_numero(superior)}\n")
+        else:
+            extremo = '-inf' if inferior == -math.inf else formato_numero(inferior)
+            escribir(f" {extremo} <= {nombre} <= {formato_numero(superior)}\n")
+
+    if modelo.get('enteras'):
+        escribir("Generals\n")
+        nombres = [variables[j] for j in modelo['enteras']]
+        for k in range(0, len(nombres), 10):
+            escribir(f" {' '.join(nombres[k:k + 10])}\n")
+
+    escribir("End\n")
@@ -0,0 +1,310 @@
+"""
+Lectura y escritura de archivos MPS (libre y fijo)
+
+El lector recorre el archivo una sola vez, línea por línea, y guarda los
+coeficientes directamente en arreglos dispersos (ver utils.modelo): la
+memoria usada es proporcional a los no nulos, no al tamaño del archivo ni
+a filas × columnas. Los archivos terminados en .gz se descomprimen al
+vuelo.
+
+Secciones admitidas: NAME, OBJSENSE, ROWS, COLUMNS (con marcadores
+INTORG/INTEND), RHS, RANGES, BOUNDS (UP, LO, FX, FR, MI, PL, BV, LI, UI)
+y ENDATA. Solo se usa el primer conjunto de RHS, RANGES y BOUNDS; las
+filas N que no son el objetivo se descartan.
+"""
+
+import gzip
+import math
+
+import numpy as np
+
+from .modelo import ConstructorModelo, formato_numero
+
+TIPOS_FILA = {'L': '<=', 'G': '>=', 'E': '='}
+CODIGOS_FILA = {tipo: codigo for codigo, tipo in TIPOS_FILA.items()}
+COTAS_SIN_VALOR = ('FR', 'MI', 'PL', 'BV')
+
+
+def abrir(origen, modo):
+    """Archivo de texto a partir de una ruta (con o sin .gz) o un archivo abierto"""
+    if hasattr(origen, 'read' if modo == 'r' else 'write'):
+        return origen, False
+    ruta = str(origen)
+    if ruta.endswith('.gz'):
+        return gzip.open(ruta, modo + 't', encoding='utf-8'), True
+    return open(ruta, modo, encoding='utf-8'), True
+
+
+def campos_fijos(linea, seccion):
+    """Campos de una línea en formato fijo, con la misma forma que en formato libre"""
+    campos = [linea[1:3], linea[4:12], linea[14:22], linea[24:36], linea[39:47], linea[49:61]]
+    campos = [campo.strip() for campo in campos]
+    if seccion == 'ROWS':
+        return campos[:2]
+    if seccion == 'BOUNDS':
+        return [campo for campo in campos[:4] if campo]
+    return [campo for campo in campos[1:] if campo]
+
+
+def leer_mps(origen, formato='libre'):
+    """
+    Leer un archivo MPS
+
+    Args:
+        origen: Ruta o archivo abierto en modo texto
+        formato: 'libre' (campos separados por espacios) o 'fijo'
+                 (columnas 2-3, 5-12, 15-22, 25-36, 40-47, 50-61; admite
+                 nombres con espacios)
+
+    Returns:
+        dict: Modelo disperso (ver utils.modelo)
+
+    Raises:
+        ValueError: Si el archivo no es MPS válido (se indica la línea)
+    """
+    archivo, propio = abrir(origen, 'r')
+    try:
+        return leer_lineas(archivo, formato)
+    finally:
+        if propio:
+            archivo.close()
+
+
+def leer_lineas(archivo, formato):
+    modelo = ConstructorModelo()
+    seccion = None
+    objetivo = None
+    libres = set()      # Filas N que no son el objetivo
+    conjuntos = {}      # Primer nombre de conjunto en RHS, RANGES y BOUNDS
+    en_enteras = False
+    numero = 0
+
+    try:
+        for numero, linea in enumerate(archivo, 1):
+            linea = linea.rstrip('\r\n')
+            if not linea.strip() or linea.startswith('*'):
+                continue
+
+            if not linea[0].isspace():
+                campos = linea.split()
+                seccion = campos[0].upper()
+                if seccion == 'NAME':
+                    modelo.nombre = linea[4:].strip()
+                elif seccion == 'OBJSENSE' and len(campos) > 1:
+                    modelo.sentido = sentido_objetivo(campos[1])
+                elif seccion == 'ENDATA':
+                    break
+                elif seccion not in ('OBJSENSE', 'ROWS', 'COLUMNS', 'RHS', 'RANGES', 'BOUNDS'):
+                    raise ValueError(f"Sección desconocida: {seccion}")
+                continue
+
+            campos = linea.split() if formato == 'libre' else campos_fijos(linea, seccion)
+
+            if seccion == 'OBJSENSE':
+                modelo.sentido = sentido_objetivo(campos[0])
+
+            elif seccion == 'ROWS':
+                codigo, nombre = campos[0].upper(), campos[1]
+                if codigo == 'N':
+                    if objetivo is None:
+                        objetivo = modelo.objetivo = nombre
+                    else:
+                        libres.add(nombre)
+                elif codigo in TIPOS_FILA:
+                    modelo.restriccion(nombre, TIPOS_FILA[codigo])
+                else:
+                    raise ValueError(f"Tipo de fila desconocido: {codigo}")
+
+            elif seccion == 'COLUMNS':
+                if len(campos) >= 3 and campos[1].strip("'").upper() == 'MARKER':
+                    marcador = campos[2].strip("'").upper()
+                    en_enteras = marcador == 'INTORG'
+                    continue
+                j = modelo.variable(campos[0])
+                if en_enteras:
+                    modelo.enteras.add(j)
+                for nombre, valor in pares(campos[1:]):
+                    if nombre == objetivo:
+                        modelo.c[j] = valor
+                    elif nombre not in libres:
+                        modelo.coeficiente(fila_existente(modelo, nombre), j, valor)
+
+            elif seccion in ('RHS', 'RANGES'):
+                if len(campos) % 2:
+                    # Con nombre de conjunto: solo cuenta el primero
+                    if conjuntos.setdefault(seccion, campos[0]) != campos[0]:
+                        continue
+                    campos = campos[1:]
+                for nombre, valor in pares(campos):
+                    if nombre == objetivo:
+                        if seccion == 'RHS':
+                            modelo.constante = -valor
+                    elif nombre not in libres:
+                        i = fila_existente(modelo, nombre)
+                        if seccion == 'RHS':
+                            modelo.b[i] = valor
+                        else:
+                            modelo.rangos[i] = valor
+
+            elif seccion == 'BOUNDS':
+                leer_cota(modelo, campos, conjuntos)
+
+            else:
+                raise ValueError("Datos fuera de una sección")
+    except (ValueError, IndexError) as e:
+        raise ValueError(f"Línea {numero}: {e}") from None
+
+    return modelo.terminar()
+
+
+def pares(campos):
+    """(nombre, valor) de una lista nombre1 valor1 [nombre2 valor2]"""
+    if len(campos) not in (2, 4):
+        raise ValueError("Se esperaban uno o dos pares nombre/valor")
+    for k in range(0, len(campos), 2):
+        yield campos[k], float(campos[k + 1])
+
+
+def fila_existente(modelo, nombre):
+    indice = modelo.indice_restricciones.get(nombre)
+    if indice is None:
+        raise ValueError(f"Fila no declarada en ROWS: {nombre}")
+    return indice
+
+
+def sentido_objetivo(texto):
+    texto = texto.upper()
+    if texto in ('MAX', 'MAXIMIZE', 'MAXIMISE'):
+        return 'max'
+    if texto in ('MIN', 'MINIMIZE', 'MINIMISE'):
+        return 'min'
+    raise ValueError(f"Sentido del objetivo desconocido: {texto}")
+
+
+def leer_cota(modelo, campos, conjuntos):
+    """Una línea de BOUNDS: tipo [conjunto] columna [valor]"""
+    codigo = campos[0].upper()
+    esperados = 3 if codigo in COTAS_SIN_VALOR else 4
+    if codigo in COTAS_SIN_VALOR and len(campos) == 4:
+        campos = campos[:3]  # Algunos escritores agregan un valor que no se usa
+    if len(campos) == esperados:
+        if conjuntos.setdefault('BOUNDS', campos[1]) != campos[1]:
+            return
+        campos = [codigo] + campos[2:]
+    elif len(campos) != esperados - 1:
+        raise ValueError(f"Cota mal formada: {' '.join(campos)}")
+
+    j = modelo.variable(campos[1])
+    valor = float(campos[2]) if len(campos) > 2 else None
+
+    if codigo == 'UP':
+        if valor < 0 and modelo.inferiores[j] == 0:
+            modelo.inferiores[j] = -math.inf
+        modelo.superiores[j] = valor
+    elif codigo == 'LO':
+        modelo.inferiores[j] = valor
+    elif codigo == 'FX':
+        modelo.inferiores[j] = modelo.superiores[j] = valor
+    elif codigo == 'FR':
+        modelo.inferiores[j], modelo.superiores[j] = -math.inf, math.inf
+    elif codigo == 'MI':
+        modelo.inferiores[j] = -math.inf
+    elif codigo == 'PL':
+        modelo.superiores[j] = math.inf
+    elif codigo == 'BV':
+        modelo.inferiores[j], modelo.superiores[j] = 0.0, 1.0
+        modelo.enteras.add(j)
+    elif codigo == 'LI':
+        modelo.inferiores[j] = valor
+        modelo.enteras.add(j)
+    elif codigo == 'UI':
+        modelo.superiores[j] = valor
+        modelo.enteras.add(j)
+    else:
+        raise ValueError(f"Tipo de cota desconocido: {codigo}")
+
+
+def escribir_mps(modelo, destino):
+    """
+    Escribir el modelo en MPS libre
+
+    Los coeficientes se recorren por columna sin construir la matriz densa.
+    Las variables sin coeficientes se escriben con costo 0 para que
+    sobrevivan a la lectura.
+    """
+    archivo, propio = abrir(destino, 'w')
+    try:
+        escribir_lineas(modelo, archivo)
+    finally:
+        if propio:
+            archivo.close()
+
+
+def escribir_lineas(modelo, archivo):
+    variables = modelo['variables']
+    restricciones = modelo['restricciones']
+    objetivo = modelo.get('objetivo') or 'OBJ'
+    enteras = set(modelo.get('enteras', []))
+    escribir = archivo.write
+
+    escribir(f"NAME          {modelo.get('nombre') or 'MODELO'}\n")
+    if modelo['sentido'] == 'max':
+        escribir("OBJSENSE\n    MAX\n")
+    escribir("ROWS\n")
+    escribir(f" N  {objetivo}\n")
+    for nombre, tipo in zip(restricciones, modelo['tipos']):
+        escribir(f" {CODIGOS_FILA[tipo]}  {nombre}\n")
+
+    escribir("COLUMNS\n")
+    orden = np.lexsort((modelo['filas'], modelo['columnas']))
+    filas = modelo['filas'][orden]
+    columnas = modelo['columnas'][orden]
+    valores = modelo['valores'][orden]
+    limites = np.searchsorted(columnas, np.arange(len(variables) + 1))
+
+    en_enteras = False
+    for j, nombre in enumerate(variables):
+        if (j in enteras) != en_enteras:
+            en_enteras = not en_enteras
+            marcador = 'INTORG' if en_enteras else 'INTEND'
+            escribir(f"    MARKER    'MARKER'    '{marcador}'\n")
+        inicio, fin = limites[j], limites[j + 1]
+        if modelo['c'][j] != 0 or inicio == fin:
+            escribir(f"    {nombre}  {objetivo}  {formato_numero(modelo['c'][j])}\n")
+        for i, valor in zip(filas[inicio:fin].tolist(), valores[inicio:fin].tolist()):
+            escribir(f"    {nombre}  {restricciones[i]}  {formato_numero(valor)}\n")
+    if en_enteras:
+        escribir("    MARKER    'MARKER'    'INTEND'\n")
+
+    escribir("RHS\n")
+    if modelo.get('constante'):
+        escribir(f"    RHS  {objetivo}  {formato_numero(-modelo['constante'])}\n")
+    for nombre, valor in zip(restricciones, modelo['b'].tolist()):
+        if valor != 0:
+            escribir(f"    RHS  {nombre}  {formato_numero(valor)}\n")
+
+    if modelo.get('rangos'):
+        escribir("RANGES\n")
+        for i in sorted(modelo['rangos']):
+            escribir(f"    RNG  {restricciones[i]}  {formato_numero(modelo['rangos'][i])}\n")
+
+    inferiores, superiores = modelo['inferiores'], modelo['superiores']
+    if np.any(inferiores != 0) or np.any(superiores != math.inf):
+        escribir("BOUNDS\n")
+    for nombre, inferior, superior in zip(variables, inferiores.tolist(), superiores.tolist()):
+        if inferior == superior:
+            escribir(f" FX BND  {nombre}  {formato_numero(inferior)}\n")
+        elif inferior == -math.inf and superior == math.inf:
+            escribir(f" FR BND  {nombre}\n")
+        else:
+            if inferior == -math.inf:
+                escribir(f" MI BND  {nombre}\n")
+            elif inferior != 0:
+                escribir(f" LO BND  {nombre}  {formato_numero(inferior)}\n")
+            if superior != math.inf:
+                escribir(f" UP BND  {nombre}  {formato_numero(superior)}\n")
+                if superior < 0 and inferior == 0:
+                    # Un UP negativo sin LO se lee con cota inferior -inf
+                    escribir(f" LO BND  {nombre}  0\n")
+
+    escribir("ENDATA\n")
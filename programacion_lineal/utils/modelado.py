@@ -0,0 +1,352 @@
+"""
+Construcción de modelos con variables y operadores de Python
+
+    modelo = Modelo()
+    x = modelo.agregar_variables(range(1, 4), 'x')
+    modelo.maximizar(3 * x[1] + 2 * x[2] + x[3])
+    modelo.agregar_restricciones(
+        {i: x[i] + x[i + 1] <= 4 for i in range(1, 3)}, 'par')
+    modelo.agregar_restriccion(suma(x.values()) <= 10, 'total')
+    resultado = modelo.resolver()
+    x[1].valor
+
+Las expresiones son diccionarios índice -> coeficiente, sin objetos de
+sympy. Cada restricción agregada se vuelca enseguida en los arreglos
+tipados de ConstructorModelo (ver utils.modelo), así que el modelo crece
+en memoria proporcional a los no nulos y `compilar` entrega los
+argumentos (c, A, b, tipos, tipo_objetivo) de los métodos sin recorrer
+listas de listas. `disperso` entrega el modelo en coordenadas, que
+también se puede escribir en MPS o LP.
+
+Para sumar muchos términos conviene `suma(...)` en lugar de `sum(...)`:
+`sum` crea una expresión nueva en cada paso y su costo crece con el
+cuadrado del número de términos.
+"""
+
+import math
+from itertools import repeat
+from numbers import Number
+
+from .modelo import ConstructorModelo, modelo_a_denso
+
+
+class Lineal:
+    """Operaciones comunes a variables y expresiones"""
+
+    __slots__ = ()
+    # Que numpy no intente operar elemento a elemento: np.float64(2) * x
+    __array_ufunc__ = None
+
+    def __add__(self, otro):
+        expresion = self.expresion()
+        expresion += otro
+        return expresion
+
+    __radd__ = __add__
+
+    def __sub__(self, otro):
+        expresion = self.expresion()
+        expresion -= otro
+        return expresion
+
+    def __rsub__(self, otro):
+        expresion = -self
+        expresion += otro
+        return expresion
+
+    def __neg__(self):
+        return self * -1.0
+
+    def __truediv__(self, otro):
+        if not isinstance(otro, Number):
+            raise TypeError("Solo se puede dividir una expresión lineal entre un número")
+        return self * (1.0 / otro)
+
+    def __le__(self, otro):
+        return Restriccion(self - otro, '<=')
+
+    def __ge__(self, otro):
+        return Restriccion(self - otro, '>=')
+
+    def __eq__(self, otro):
+        return Restriccion(self - otro, '=')
+
+
+class Variable(Lineal):
+    """Columna del modelo; `valor` queda disponible después de resolver"""
+
+    __slots__ = ('modelo', 'indice', 'nombre')
+    __hash__ = object.__hash__
+
+    def __init__(self, modelo, indice, nombre):
+        self.modelo = modelo
+        self.indice = indice
+        self.nombre = nombre
+
+    def expresion(self):
+        return ExpresionLineal({self.indice: 1.0})
+
+    def __mul__(self, otro):
+        if not isinstance(otro, Number):
+            raise TypeError("El producto de dos expresiones no es lineal")
+        return ExpresionLineal({self.indice: float(otro)})
+
+    __rmul__ = __mul__
+
+    @property
+    def valor(self):
+        return self.modelo.evaluar(self)
+
+    def __repr__(self):
+        return self.nombre
+
+
+class ExpresionLineal(Lineal):
+    """Suma de coeficiente * variable más una constante"""
+
+    __slots__ = ('terminos', 'constante')
+    __hash__ = None
+
+    def __init__(self, terminos=None, constante=0.0):
+        self.terminos = terminos if terminos is not None else {}
+        self.constante = constante
+
+    def expresion(self):
+        return ExpresionLineal(dict(self.terminos), self.constante)
+
+    def __iadd__(self, otro):
+        return self.acumular(otro, 1.0)
+
+    def __isub__(self, otro):
+        return self.acumular(otro, -1.0)
+
+    def acumular(self, otro, factor):
+        """Sumar factor * otro sobre esta misma expresión"""
+        terminos = self.terminos
+        if isinstance(otro, Variable):
+            terminos[otro.indice] = terminos.get(otro.indice, 0.0) + factor
+        elif isinstance(otro, ExpresionLineal):
+            for indice, valor in otro.terminos.items():
+                terminos[indice] = terminos.get(indice, 0.0) + factor * valor
+            self.constante += factor * otro.constante
+        elif isinstance(otro, Number):
+            self.constante += factor * otro
+        else:
+            raise TypeError(f"No se puede sumar {type(otro).__name__} a una expresión lineal")
+        return self
+
+    def __mul__(self, otro):
+        if not isinstance(otro, Number):
+            raise TypeError("El producto de dos expresiones no es lineal")
+        factor = float(otro)
+        return ExpresionLineal({indice: factor * valor for indice, valor in self.terminos.items()},
+                               factor * self.constante)
+
+    __rmul__ = __mul__
+
+    def __repr__(self):
+        partes = [f"{valor:+g}*v{indice}" for indice, valor in self.terminos.items()]
+        if self.constante or not partes:
+            partes.append(f"{self.constante:+g}")
+        return ' '.join(partes)
+
+
+class Restriccion:
+    """expresion (<=, >=, =) 0, guardada como términos, tipo y lado derecho"""
+
+    __slots__ = ('terminos', 'tipo', 'rhs')
+
+    def __init__(self, expresion, tipo):
+        self.terminos = expresion.terminos
+        self.tipo = tipo
+        self.rhs = -expresion.constante
+
+    def __bool__(self):
+        # 'a <= x <= b' evalúa la primera comparación como booleano
+        raise TypeError("Una restricción no es un booleano; para un rango use Modelo.agregar_rango")
+
+
+def suma(terminos):
+    """Suma de variables, expresiones o números sin copias intermedias"""
+    expresion = ExpresionLineal()
+    for termino in terminos:
+        expresion += termino
+    return expresion
+
+
+class Modelo:
+    def __init__(self, nombre=''):
+        self.constructor = ConstructorModelo(nombre)
+        self.variables = []
+        self.valores = None
+        self.resultado = None
+
+    def agregar_variable(self, nombre=None, inferior=0.0, superior=math.inf, costo=0.0, entera=False):
+        """
+        Variable nueva; por defecto se llama x1, x2, ... según su posición
+
+        Raises:
+            ValueError: Si el nombre está repetido o la cota inferior es
+                        negativa (los métodos suponen x >= 0, ver
+                        utils.modelo.modelo_a_denso)
+        """
+        constructor = self.constructor
+        indice = len(self.variables)
+        nombre = nombre or f"x{indice + 1}"
+        if nombre in constructor.indice_variables:
+            raise ValueError(f"Variable repetida: {nombre}")
+        if inferior < 0:
+            raise ValueError(f"La variable {nombre} admite valores negativos (inferior = {inferior}); "
+                             f"los métodos suponen x >= 0")
+        constructor.variable(nombre)
+        constructor.inferiores[indice] = inferior
+        constructor.superiores[indice] = superior
+        constructor.c[indice] = costo
+        if entera:
+            constructor.enteras.add(indice)
+        variable = Variable(self, indice, nombre)
+        self.variables.append(variable)
+        return variable
+
+    def agregar_variables(self, indices, nombre='x', inferior=0.0, superior=math.inf, costo=0.0, entera=False):
+        """
+        Una variable por índice
+
+        Args:
+            indices: Iterable de índices (números, textos o tuplas), o un
+                     entero n para los índices 1..n
+            nombre: Prefijo; la variable del índice (i, j) se llama 'x{i}_{j}'
+            costo: Número común a todas o dict índice -> costo
+
+        Returns:
+            dict: índice -> Variable
+        """
+        if isinstance(indices, int):
+            indices = range(1, indices + 1)
+        variables = {}
+        for indice in indices:
+            partes = indice if isinstance(indice, tuple) else (indice,)
+            costo_indice = costo.get(indice, 0.0) if isinstance(costo, dict) else costo
+            variables[indice] = self.agregar_variable(
+                nombre + '_'.join(map(str, partes)), inferior, superior, costo_indice, entera)
+        return variables
+
+    def objetivo(self, expresion, sentido):
+        """Fijar la función objetivo ('max' o 'min')"""
+        if sentido not in ('max', 'min'):
+            raise ValueError(f"Sentido del objetivo desconocido: {sentido}")
+        expresion = expresion if isinstance(expresion, Lineal) else ExpresionLineal(constante=expresion)
+        expresion = expresion.expresion()
+        constructor = self.constructor
+        constructor.sentido = sentido
+        constructor.constante = float(expresion.constante)
+        for indice in range(len(self.variables)):
+            constructor.c[indice] = 0.0
+        for indice, valor in expresion.terminos.items():
+            constructor.c[indice] = valor
+
+    def maximizar(self, expresion):
+        self.objetivo(expresion, 'max')
+
+    def minimizar(self, expresion):
+        self.objetivo(expresion, 'min')
+
+    def agregar_restriccion(self, restriccion, nombre=None):
+        """Volcar la restricción en los arreglos del modelo; devuelve su fila"""
+        if not isinstance(restriccion, Restriccion):
+            raise TypeError("Se esperaba una restricción (expresión <=, >= o == expresión)")
+        constructor = self.constructor
+        fila = constructor.restriccion(nombre, restriccion.tipo, restriccion.rhs)
+        terminos = restriccion.terminos
+        if 0.0 in terminos.values():
+            terminos = {indice: valor for indice, valor in terminos.items() if valor != 0}
+        constructor.filas.extend(repeat(fila, len(terminos)))
+        constructor.columnas.extend(terminos.keys())
+        constructor.valores.extend(terminos.values())
+        return fila
+
+    def agregar_restricciones(self, restricciones, nombre=None):
+        """
+        Varias restricciones de una vez
+
+        Args:
+            restricciones: dict índice -> Restriccion (se nombran
+                           '{nombre}{índice}') o cualquier iterable de
+                           restricciones, por ejemplo un generador
+            nombre: Prefijo de los nombres; sin él se numeran R1, R2, ...
+
+        Returns:
+            dict o list: Filas, con las mismas claves que la entrada
+        """
+        if isinstance(restricciones, dict):
+            filas = {}
+            for indice, restriccion in restricciones.items():
+                partes = indice if isinstance(indice, tuple) else (indice,)
+                nombre_fila = nombre + '_'.join(map(str, partes)) if nombre else None
+                filas[indice] = self.agregar_restriccion(restriccion, nombre_fila)
+            return filas
+        return [self.agregar_restriccion(restriccion) for restriccion in restricciones]
+
+    def agregar_rango(self, expresion, inferior, superior, nombre=None):
+        """inferior <= expresion <= superior como una sola fila con rango"""
+        if inferior > superior:
+            raise ValueError(f"Rango vacío: [{inferior}, {superior}]")
+        restriccion = Restriccion(expresion - inferior, '>=')
+        fila = self.agregar_restriccion(restriccion, nombre)
+        self.constructor.rangos[fila] = superior - inferior
+        return fila
+
+    def evaluar(self, expresion):
+        """Valor de una variable o expresión en la última solución"""
+        if self.valores is None:
+            raise ValueError("El modelo todavía no tiene solución")
+        if isinstance(expresion, Variable):
+            return self.valores[expresion.indice]
+        return expresion.constante + sum(valor * self.valores[indice]
+                                         for indice, valor in expresion.terminos.items())
+
+    def disperso(self):
+        """Modelo en coordenadas (ver utils.modelo)"""
+        return self.constructor.terminar()
+
+    def compilar(self):
+        """Argumentos (c, A, b, tipos, tipo_objetivo) de los métodos"""
+        return modelo_a_denso(self.disperso())
+
+    def resolver(self, metodo=None, **opciones):
+        """
+        Resolver el modelo y guardar los valores de las variables
+
+        Args:
+            metodo: Nombre en metodos.seleccion.SOLVERS; sin él se elige con
+                    SelectorMetodo. Con variables enteras se usan planos de
+                    corte de Gomory.
+            **opciones: Atributos a fijar en el solver (verbose, tolerancia...)
+
+        Returns:
+            dict: Resultado del método; el valor óptimo incluye la constante
+                  del objetivo
+        """
+        from metodos.planos_corte import PlanosCorteGomory
+        from metodos.seleccion import SelectorMetodo, crear_solver
+
+        c, A, b, tipos, sentido = self.compilar()
+        if self.constructor.enteras:
+            solver = PlanosCorteGomory()
+            for nombre, valor in opciones.items():
+                if hasattr(solver, nombre):
+                    setattr(solver, nombre, valor)
+            resultado = solver.resolver(c, A, b, tipos, sentido, sorted(self.constructor.enteras))
+        else:
+            if metodo is None:
+                eleccion = SelectorMetodo().seleccionar(c, A, b, tipos, sentido)
+                metodo, opciones = eleccion['metodo'], dict(eleccion['opciones'], **opciones)
+            resultado = crear_solver(metodo, opciones).resolver(c, A, b, tipos, sentido)
+
+        if resultado.get('factible') and resultado.get('solucion') is not None:
+            self.valores = [float(valor) for valor in resultado['solucion']]
+            resultado['valor_optimo'] += self.constructor.constante
+        else:
+            self.valores = None
+        self.resultado = resultado
+        return resultado
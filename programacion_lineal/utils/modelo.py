@@ -0,0 +1,222 @@
+"""
+Modelo disperso leído de archivos (MPS, LP)
+
+Los lectores construyen un diccionario con la matriz en coordenadas, sin
+pasar nunca por una matriz densa:
+
+    'nombre', 'sentido' ('max' o 'min'), 'objetivo' (nombre de la fila)
+    'variables', 'restricciones'    nombres, en orden de aparición
+    'c'                             costos (n)
+    'filas', 'columnas', 'valores'  coeficientes no nulos de A
+    'b', 'tipos'                    lado derecho y '<=', '>=' o '='
+    'rangos'                        {fila: R} con la semántica de RANGES
+                                    en MPS (ver modelo_a_denso)
+    'inferiores', 'superiores'      cotas de las variables (-inf/inf)
+    'enteras'                       índices de variables enteras
+    'constante'                     término constante del objetivo
+
+`modelo_a_denso` lo lleva a los argumentos (c, A, b, tipos, tipo_objetivo)
+de los métodos y `modelo_desde_denso` hace lo inverso para los escritores.
+"""
+
+import math
+from array import array
+
+import numpy as np
+
+
+class ConstructorModelo:
+    """Acumula el modelo en arreglos tipados mientras se lee el archivo"""
+
+    def __init__(self, nombre=''):
+        self.nombre = nombre
+        self.sentido = 'min'
+        self.objetivo = None
+        self.variables = []
+        self.indice_variables = {}
+        self.restricciones = []
+        self.indice_restricciones = {}
+        self.tipos = []
+        self.b = array('d')
+        self.c = array('d')
+        self.filas = array('q')
+        self.columnas = array('q')
+        self.valores = array('d')
+        self.inferiores = array('d')
+        self.superiores = array('d')
+        self.enteras = set()
+        self.rangos = {}
+        self.constante = 0.0
+
+    def variable(self, nombre):
+        """Índice de la variable, creándola con cotas [0, inf) si no existe"""
+        indice = self.indice_variables.get(nombre)
+        if indice is None:
+            indice = len(self.variables)
+            self.indice_variables[nombre] = indice
+            self.variables.append(nombre)
+            self.c.append(0.0)
+            self.inferiores.append(0.0)
+            self.superiores.append(math.inf)
+        return indice
+
+    def restriccion(self, nombre, tipo, rhs=0.0):
+        """Índice de una restricción nueva"""
+        if nombre is None:
+            nombre = f"R{len(self.restricciones) + 1}"
+        if nombre in self.indice_restricciones:
+            raise ValueError(f"Restricción repetida: {nombre}")
+        indice = len(self.restricciones)
+        self.indice_restricciones[nombre] = indice
+        self.restricciones.append(nombre)
+        self.tipos.append(tipo)
+        self.b.append(rhs)
+        return indice
+
+    def coeficiente(self, fila, columna, valor):
+        if valor != 0:
+            self.filas.append(fila)
+            self.columnas.append(columna)
+            self.valores.append(valor)
+
+    def terminar(self):
+        """Diccionario del modelo con arreglos de numpy"""
+        return {
+            'nombre': self.nombre,
+            'sentido': self.sentido,
+            'objetivo': self.objetivo or 'OBJ',
+            'variables': self.variables,
+            'restricciones': self.restricciones,
+            'c': np.frombuffer(self.c, dtype=float).copy(),
+            'filas': np.frombuffer(self.filas, dtype=np.int64).copy(),
+            'columnas': np.frombuffer(self.columnas, dtype=np.int64).copy(),
+            'valores': np.frombuffer(self.valores, dtype=float).copy(),
+            'b': np.frombuffer(self.b, dtype=float).copy(),
+            'tipos': self.tipos,
+            'rangos': self.rangos,
+            'inferiores': np.frombuffer(self.inferiores, dtype=float).copy(),
+            'superiores': np.frombuffer(self.superiores, dtype=float).copy(),
+            'enteras': sorted(self.enteras),
+            'constante': self.constante
+        }
+
+
+def intervalo_rango(tipo, rhs, rango):
+    """Cotas (inferior, superior) de una fila con rango, según MPS"""
+    if tipo == '<=':
+        return rhs - abs(rango), rhs
+    if tipo == '>=':
+        return rhs, rhs + abs(rango)
+    if rango >= 0:
+        return rhs, rhs + rango
+    return rhs + rango, rhs
+
+
+def modelo_a_denso(modelo):
+    """
+    Llevar el modelo al formato de los métodos
+
+    Las filas con rango se separan en dos desigualdades y las cotas de las
+    variables se agregan como restricciones (x <= u, x >= l). Los métodos
+    suponen x >= 0, así que no se admiten cotas inferiores negativas. La
+    constante del objetivo no se incluye: hay que sumarla al valor óptimo.
+
+    Returns:
+        tuple: (c, A, b, tipos, tipo_objetivo) con listas de Python
+
+    Raises:
+        ValueError: Si alguna variable admite valores negativos
+    """
+    n = len(modelo['variables'])
+    m = len(modelo['restricciones'])
+    negativas = np.nonzero(modelo['inferiores'] < 0)[0]
+    if len(negativas):
+        raise ValueError(f"La variable {modelo['variables'][negativas[0]]} admite valores negativos; "
+                         f"los métodos suponen x >= 0")
+
+    densa = np.zeros((m, n))
+    np.add.at(densa, (modelo['filas'], modelo['columnas']), modelo['valores'])
+
+    restricciones = []  # (fila, rhs, tipo)
+    for i, (tipo, rhs) in enumerate(zip(modelo['tipos'], modelo['b'])):
+        fila = densa[i].tolist()
+        if i not in modelo['rangos']:
+            restricciones.append((fila, float(rhs), tipo))
+            continue
+        inferior, superior = intervalo_rango(tipo, float(rhs), modelo['rangos'][i])
+        if inferior == superior:
+            restricciones.append((fila, inferior, '='))
+        else:
+            restricciones.append((fila, inferior, '>='))
+            restricciones.append((list(fila), superior, '<='))
+
+    for j, (inferior, superior) in enumerate(zip(modelo['inferiores'], modelo['superiores'])):
+        if inferior == superior:
+            cotas = [(float(inferior), '=')]
+        else:
+            cotas = [(float(inferior), '>=')] if inferior > 0 else []
+            if superior < math.inf:
+                cotas.append((float(superior), '<='))
+        for valor, tipo in cotas:
+            fila = [0.0] * n
+            fila[j] = 1.0
+            restricciones.append((fila, valor, tipo))
+
+    A = [fila for fila, _, _ in restricciones]
+    b = [rhs for _, rhs, _ in restricciones]
+    tipos = [tipo for _, _, tipo in restricciones]
+    return modelo['c'].tolist(), A, b, tipos, modelo['sentido']
+
+
+def modelo_desde_denso(c, A, b, tipos, tipo_objetivo, variables=None, nombre=''):
+    """Modelo (para los escritores) a partir de los argumentos de los métodos"""
+    constructor = ConstructorModelo(nombre)
+    constructor.sentido = tipo_objetivo
+    nombres = variables or [f"x{j + 1}" for j in range(len(c))]
+    for nombre_variable, costo in zip(nombres, c):
+        constructor.c[constructor.variable(str(nombre_variable))] = float(costo)
+    for fila, rhs, tipo in zip(A, b, tipos):
+        i = constructor.restriccion(None, tipo, float(rhs))
+        for j, valor in enumerate(fila):
+            constructor.coeficiente(i, j, float(valor))
+    return constructor.terminar()
+
+
+def formato_numero(valor):
+    """Texto más corto que se vuelve a leer como el mismo float"""
+    valor = float(valor)
+    if valor.is_integer() and abs(valor) < 1e15:
+        return str(int(valor))
+    return repr(valor)
+
+
+def leer_modelo(ruta, formato_mps='libre'):
+    """Leer un archivo .mps o .lp (también comprimidos con .gz)"""
+    from .formato_lp import leer_lp
+    from .formato_mps import leer_mps
+
+    extension = extension_modelo(ruta)
+    if extension == '.mps':
+        return leer_mps(ruta, formato_mps)
+    return leer_lp(ruta)
+
+
+def escribir_modelo(modelo, ruta):
+    """Escribir un archivo .mps o .lp según la extensión de la ruta"""
+    from .formato_lp import escribir_lp
+    from .formato_mps import escribir_mps
+
+    if extension_modelo(ruta) == '.mps':
+        escribir_mps(modelo, ruta)
+    else:
+        escribir_lp(modelo, ruta)
+
+
+def extension_modelo(ruta):
+    ruta = str(ruta).lower()
+    if ruta.endswith('.gz'):
+        ruta = ruta[:-3]
+    for extension in ('.mps', '.lp'):
+        if ruta.endswith(extension):
+            return extension
+    raise ValueError(f"Extensión no reconocida (se espera .mps o .lp): {ruta}")
@@ -0,0 +1,233 @@
+"""
+Análisis de expresiones y restricciones lineales escritas como texto
+
+    3x1 + 2*x2 - x3            términos con o sin '*', nombres libres
+    2*x1 + 3x2 - x3 <= 10      restricción
+    x1 + 4 >= x2               variables y constantes en ambos lados
+    2 <= x1 + x2 <= 8          rango (dos restricciones)
+
+Cada término se reconoce con una sola expresión regular, sin construir
+objetos simbólicos: analizar miles de restricciones toma milisegundos.
+Si el texto no tiene la forma simple (paréntesis, divisiones, potencias)
+se recurre a sympy, que se importa solo en ese caso, y se verifica que el
+resultado sea lineal.
+"""
+
+import re
+
+from .modelo import ConstructorModelo, formato_numero
+
+NUMERO_REAL = r'(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?'
+NOMBRE = r'[A-Za-z_][A-Za-z0-9_]*'
+TERMINO_VALIDO = rf'(?:{NUMERO_REAL}\s*(?:\*\s*)?{NOMBRE}|{NUMERO_REAL}|{NOMBRE})'
+
+# Suma de términos [signo][número][*][variable]: se valida entera y luego se extraen los términos
+SUMA_SIMPLE = re.compile(rf'\s*[+-]?\s*{TERMINO_VALIDO}(?:\s*[+-]\s*{TERMINO_VALIDO})*\s*')
+TERMINO = re.compile(rf'([+-]?)\s*(?:({NUMERO_REAL})\s*\*?\s*({NOMBRE})?|({NOMBRE}))')
+
+RELACION = re.compile(r'<=|>=|=<|=>|==|≤|≥|<|>|=')
+RELACIONES = {'<=': '<=', '=<': '<=', '<': '<=', '≤': '<=',
+              '>=': '>=', '=>': '>=', '>': '>=', '≥': '>=',
+              '=': '=', '==': '='}
+NUMERO = re.compile(r'(\d+)')
+# Nombre que no es parte de un número (el 'e' de 1e5) ni de otro nombre
+IDENTIFICADOR = re.compile(rf'(?<![\w.]){NOMBRE}')
+
+
+def analizar_expresion(texto):
+    """
+    Coeficientes de una expresión lineal
+
+    Returns:
+        tuple: (dict variable -> coeficiente, constante)
+
+    Raises:
+        ValueError: Si la expresión no es válida o no es lineal
+    """
+    texto = texto.strip()
+    if not texto:
+        return {}, 0.0
+    if texto[-1] in '0123456789.':
+        try:
+            # Lo más común del lado derecho: un número solo
+            return {}, float(texto)
+        except ValueError:
+            pass
+    resultado = terminos_simples(texto)
+    if resultado is None:
+        resultado = terminos_sympy(texto)
+    return resultado
+
+
+def terminos_simples(texto):
+    """Camino rápido: suma de términos [signo][número][*][variable]; None si no aplica"""
+    if not SUMA_SIMPLE.fullmatch(texto):
+        return None
+    coeficientes = {}
+    constante = 0.0
+    for signo, numero, nombre, variable in TERMINO.findall(texto):
+        nombre = nombre or variable
+        valor = float(numero) if numero else 1.0
+        if signo == '-':
+            valor = -valor
+        if nombre:
+            coeficientes[nombre] = coeficientes.get(nombre, 0.0) + valor
+        else:
+            constante += valor
+    return coeficientes, constante
+
+
+def terminos_sympy(texto):
+    """
+    Camino general con sympy para expresiones que no son una suma simple
+
+    Todo nombre es una variable, como en el camino rápido: sin esto sympify
+    leería E, I, N, S, pi o beta como constantes o funciones de sympy.
+    """
+    from tokenize import TokenError
+
+    from sympy import Poly, PolynomialError, Symbol, SympifyError, expand
+    from sympy.parsing.sympy_parser import parse_expr
+
+    variables = {nombre: Symbol(nombre) for nombre in IDENTIFICADOR.findall(texto)}
+    try:
+        expresion = expand(parse_expr(texto, local_dict=variables))
+        simbolos = sorted(expresion.free_symbols, key=lambda simbolo: simbolo.name)
+        if simbolos and Poly(expresion, *simbolos).total_degree() > 1:
+            raise ValueError(f"La expresión no es lineal: {texto}")
+        coeficientes = {simbolo.name: float(expresion.coeff(simbolo)) for simbolo in simbolos}
+        constante = float(expresion.subs({simbolo: 0 for simbolo in simbolos}))
+    except (SympifyError, PolynomialError, TypeError, SyntaxError, TokenError) as e:
+        raise ValueError(f"Expresión no válida: {texto}") from e
+    return {nombre: valor for nombre, valor in coeficientes.items() if valor != 0}, constante
+
+
+def analizar_restriccion(texto):
+    """
+    Restricción con una relación, o rango con dos
+
+    Returns:
+        list: [(coeficientes, relacion, rhs)] con una entrada, o dos para
+              un rango 'lo <= expr <= hi'. Las variables y constantes del
+              lado derecho pasan a la izquierda y al rhs.
+
+    Raises:
+        ValueError: Si falta la relación o el texto no es lineal
+    """
+    relaciones = RELACION.findall(texto)
+    partes = RELACION.split(texto)
+
+    if len(relaciones) == 1:
+        izquierda, constante_izq = analizar_expresion(partes[0])
+        derecha, constante_der = analizar_expresion(partes[1])
+        for nombre, valor in derecha.items():
+            izquierda[nombre] = izquierda.get(nombre, 0.0) - valor
+        return [(izquierda, RELACIONES[relaciones[0]], constante_der - constante_izq)]
+
+    if len(relaciones) == 2:
+        relacion = RELACIONES[relaciones[0]]
+        if relacion != RELACIONES[relaciones[1]] or relacion == '=':
+            raise ValueError(f"Un rango necesita dos relaciones '<=' o dos '>=': {texto}")
+        extremo_izq, variables_izq = analizar_constante(partes[0])
+        coeficientes, constante = analizar_expresion(partes[1])
+        extremo_der, variables_der = analizar_constante(partes[2])
+        if variables_izq or variables_der:
+            raise ValueError(f"Los extremos de un rango deben ser números: {texto}")
+        opuesta = '>=' if relacion == '<=' else '<='
+        return [(coeficientes, opuesta, extremo_izq - constante),
+                (dict(coeficientes), relacion, extremo_der - constante)]
+
+    if not relaciones:
+        raise ValueError(f"Falta la relación ('<=', '>=' o '='): {texto}")
+    raise ValueError(f"Demasiadas relaciones: {texto}")
+
+
+def analizar_constante(texto):
+    coeficientes, constante = analizar_expresion(texto)
+    return constante, coeficientes
+
+
+def analizar_objetivo(texto):
+    """
+    Función objetivo con prefijo opcional 'max' o 'min'
+
+    Returns:
+        tuple: (tipo o None si no se indicó, coeficientes, constante)
+    """
+    texto = texto.strip()
+    tipo = None
+    prefijo = re.match(r'(max|min)(?:imize|imizar|imise)?\b\s*[:=]?', texto, re.IGNORECASE)
+    if prefijo:
+        tipo = prefijo.group(1).lower()
+        texto = texto[prefijo.end():]
+        # 'max z = 3x + 2y': se descarta el nombre del objetivo
+        texto = re.sub(r'^\s*[A-Za-z_]\w*\s*=(?![=<>])', '', texto)
+    coeficientes, constante = analizar_expresion(texto)
+    return tipo, coeficientes, constante
+
+
+def orden_natural(nombre):
+    """Clave para ordenar x2 antes que x10"""
+    return [int(parte) if parte.isdigit() else parte for parte in NUMERO.split(nombre)]
+
+
+def analizar_problema(objetivo, restricciones, tipo_objetivo=None):
+    """
+    Problema completo a partir de textos, sin pasar por una matriz densa
+
+    Args:
+        objetivo: Texto de la función objetivo (con o sin 'max'/'min')
+        restricciones: Iterable de textos de restricciones
+        tipo_objetivo: 'max' o 'min' si el texto no lo indica
+
+    Returns:
+        dict: Modelo disperso (ver utils.modelo); las variables quedan en
+              orden natural de sus nombres
+
+    Raises:
+        ValueError: Si algún texto no es válido (se indica cuál)
+    """
+    tipo, costos, constante = analizar_objetivo(objetivo)
+    tipo = tipo or tipo_objetivo
+    if tipo not in ('max', 'min'):
+        raise ValueError("Indique si el problema es de 'max' o 'min'")
+
+    filas = []
+    nombres = set(costos)
+    for numero, texto in enumerate(restricciones, 1):
+        try:
+            analizadas = analizar_restriccion(texto)
+        except ValueError as e:
+            raise ValueError(f"Restricción {numero}: {e}") from None
+        for coeficientes, _, _ in analizadas:
+            nombres.update(coeficientes)
+        filas.extend(analizadas)
+
+    modelo = ConstructorModelo()
+    modelo.sentido = tipo
+    modelo.constante = constante
+    for nombre in sorted(nombres, key=orden_natural):
+        modelo.variable(nombre)
+    for nombre, valor in costos.items():
+        modelo.c[modelo.indice_variables[nombre]] = valor
+    for coeficientes, relacion, rhs in filas:
+        i = modelo.restriccion(None, relacion, rhs)
+        for nombre, valor in coeficientes.items():
+            modelo.coeficiente(i, modelo.indice_variables[nombre], valor)
+    return modelo.terminar()
+
+
+def texto_expresion(coeficientes, variables):
+    """'3*x1 - x2 + 0.5*x3' a partir de los coeficientes, en el orden dado"""
+    partes = []
+    for variable in variables:
+        valor = coeficientes.get(variable, 0.0)
+        if valor == 0:
+            continue
+        signo = '-' if valor < 0 else '+'
+        termino = variable if abs(valor) == 1 else f"{formato_numero(abs(valor))}*{variable}"
+        partes.append(f"{signo} {termino}")
+    if not partes:
+        return '0'
+    texto = ' '.join(partes)
+    return texto[2:] if texto.startswith('+') else '-' + texto[2:]
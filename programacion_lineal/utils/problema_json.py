@@ -0,0 +1,228 @@
+"""
+Problemas y resultados en JSON
+
+Formato de un problema (las claves en inglés se aceptan como alias):
+
+    {
+        "c": [3, 5],
+        "A": [[1, 0], [0, 2], [3, 2]],
+        "b": [4, 12, 18],
+        "tipos": ["<=", "<=", "<="],
+        "tipo_objetivo": "max",            (alias "sense")
+        "metodo": "DosFasesSimplex",       (alias "method"; "auto" o ausente: selector)
+        "tiempo_limite": 2.0,              (alias "time_limit", segundos)
+        "max_iteraciones": 500             (alias "max_iterations")
+    }
+
+A también puede darse dispersa, con los mismos nombres que devuelve
+`coeficientes_no_nulos`:
+
+    "A": {"filas": [0, 1, 2, 2], "columnas": [0, 1, 0, 1],
+          "valores": [1, 2, 3, 2], "forma": [3, 2]}
+"""
+
+import json
+import math
+
+ALIAS = {
+    'sense': 'tipo_objetivo',
+    'method': 'metodo',
+    'time_limit': 'tiempo_limite',
+    'max_iterations': 'max_iteraciones',
+}
+
+TIPOS_VALIDOS = ('<=', '>=', '=')
+
+
+def problema_desde_json(datos):
+    """
+    Validar un problema leído de JSON y llevarlo al formato de los métodos
+
+    Returns:
+        dict: 'c', 'A' (densa), 'b', 'tipos', 'tipo_objetivo', 'metodo'
+              (None si se pide selección automática), 'tiempo_limite' y
+              'opciones' (atributos a fijar en el solver)
+
+    Raises:
+        ValueError: Si falta una clave, un campo tiene un tipo inválido o las
+                    dimensiones no concuerdan
+    """
+    if not isinstance(datos, dict):
+        raise ValueError("El problema debe ser un objeto JSON")
+    datos = {ALIAS.get(clave, clave): valor for clave, valor in datos.items()}
+
+    for clave in ('c', 'A', 'b', 'tipos'):
+        if clave not in datos:
+            raise ValueError(f"Falta la clave '{clave}'")
+
+    c = numeros(datos['c'], 'c')
+    b = numeros(datos['b'], 'b')
+    tipos = datos['tipos']
+    if not isinstance(tipos, list):
+        raise ValueError("'tipos' debe ser una lista")
+    A = matriz_densa(datos['A'], len(b), len(c))
+
+    if len(tipos) != len(b):
+        raise ValueError(f"'tipos' tiene {len(tipos)} entradas y 'b' {len(b)}")
+    for tipo in tipos:
+        if tipo not in TIPOS_VALIDOS:
+            raise ValueError(f"Tipo de restricción inválido: {tipo!r}")
+
+    tipo_objetivo = datos.get('tipo_objetivo', 'max')
+    if not isinstance(tipo_objetivo, str):
+        raise ValueError("'tipo_objetivo' debe ser 'max' o 'min'")
+    tipo_objetivo = tipo_objetivo.lower()
+    if tipo_objetivo not in ('max', 'min'):
+        raise ValueError(f"'tipo_objetivo' debe ser 'max' o 'min', no {tipo_objetivo!r}")
+
+    metodo = datos.get('metodo')
+    if metodo is not None and not isinstance(metodo, str):
+        raise ValueError("'metodo' debe ser el nombre de un método")
+    if metodo == 'auto':
+        metodo = None
+
+    tiempo_limite = datos.get('tiempo_limite')
+    if tiempo_limite is not None:
+        tiempo_limite = numero(tiempo_limite, 'tiempo_limite')
+        if not tiempo_limite > 0:
+            raise ValueError("'tiempo_limite' debe ser positivo")
+
+    opciones = {}
+    if datos.get('max_iteraciones') is not None:
+        opciones['max_iteraciones'] = int(numero(datos['max_iteraciones'], 'max_iteraciones'))
+    if datos.get('tolerancia') is not None:
+        opciones['tolerancia'] = numero(datos['tolerancia'], 'tolerancia')
+
+    return {
+        'c': c,
+        'A': A,
+        'b': b,
+        'tipos': tipos,
+        'tipo_objetivo': tipo_objetivo,
+        'metodo': metodo,
+        'tiempo_limite': tiempo_limite,
+        'opciones': opciones
+    }
+
+
+def leer_problema(ruta):
+    """
+    Problema desde un archivo .json, .mps o .lp (también .gz)
+
+    Los archivos MPS y LP pasan por utils.modelo; el problema trae además
+    'variables' (nombres) y 'constante' (término constante del objetivo).
+
+    Raises:
+        ValueError: Si el archivo no es un problema válido
+    """
+    ruta = str(ruta)
+    if ruta.lower().endswith('.json'):
+        with open(ruta, encoding='utf-8') as archivo:
+            try:
+                datos = json.load(archivo)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"JSON inválido: {e}") from None
+        return problema_desde_json(datos)
+
+    from .modelo import leer_modelo, modelo_a_denso
+
+    modelo = leer_modelo(ruta)
+    c, A, b, tipos, tipo_objetivo = modelo_a_denso(modelo)
+    return {
+        'c': c,
+        'A': A,
+        'b': b,
+        'tipos': tipos,
+        'tipo_objetivo': tipo_objetivo,
+        'metodo': None,
+        'tiempo_limite': None,
+        'opciones': {},
+        'variables': modelo['variables'],
+        'constante': modelo['constante']
+    }
+
+
+def numero(valor, nombre):
+    """Número finito de JSON como float"""
+    if isinstance(valor, bool) or not isinstance(valor, (int, float)):
+        raise ValueError(f"'{nombre}' debe ser un número")
+    try:
+        valor = float(valor)
+    except OverflowError:
+        raise ValueError(f"'{nombre}' no es finito") from None
+    if not math.isfinite(valor):
+        raise ValueError(f"'{nombre}' no es finito")
+    return valor
+
+
+def numeros(valores, nombre):
+    """Lista de floats finitos"""
+    if not isinstance(valores, list):
+        raise ValueError(f"'{nombre}' debe ser una lista de números")
+    try:
+        lista = [float(valor) for valor in valores]
+    except (TypeError, ValueError, OverflowError):
+        raise ValueError(f"'{nombre}' debe ser una lista de números") from None
+    if not all(math.isfinite(valor) for valor in lista):
+        raise ValueError(f"'{nombre}' contiene valores no finitos")
+    return lista
+
+
+def indices(valores, nombre):
+    """Lista de enteros (índices de la forma dispersa)"""
+    if not isinstance(valores, list) or \
+            not all(isinstance(valor, int) and not isinstance(valor, bool) for valor in valores):
+        raise ValueError(f"'{nombre}' debe ser una lista de enteros")
+    return valores
+
+
+def matriz_densa(A, m, n):
+    """A como lista de filas m x n, a partir de la forma densa o dispersa"""
+    if isinstance(A, dict):
+        forma = A.get('forma', [m, n])
+        if forma != [m, n]:
+            raise ValueError(f"'A' tiene forma {forma!r}, se esperaba [{m}, {n}]")
+        filas = indices(A.get('filas', []), 'A.filas')
+        columnas = indices(A.get('columnas', []), 'A.columnas')
+        valores = numeros(A.get('valores', []), 'A.valores')
+        if not len(filas) == len(columnas) == len(valores):
+            raise ValueError("'filas', 'columnas' y 'valores' de A deben tener el mismo largo")
+        densa = [[0.0] * n for _ in range(m)]
+        for i, j, valor in zip(filas, columnas, valores):
+            if not (0 <= i < m and 0 <= j < n):
+                raise ValueError(f"Coeficiente fuera de rango en A: ({i}, {j})")
+            densa[i][j] += valor
+        return densa
+
+    if not isinstance(A, list):
+        raise ValueError("'A' debe ser una lista de filas o un objeto disperso")
+    if len(A) != m:
+        raise ValueError(f"'A' tiene {len(A)} filas y 'b' {m} entradas")
+    densa = [numeros(fila, 'A') for fila in A]
+    for i, fila in enumerate(densa):
+        if len(fila) != n:
+            raise ValueError(f"La fila {i} de A tiene {len(fila)} coeficientes y 'c' {n}")
+    return densa
+
+
+def resultado_a_json(resultado):
+    """Copia del resultado con tipos nativos de Python (sin numpy ni tableau)"""
+    salida = {}
+    for clave, valor in resultado.items():
+        if clave in ('tableau', 'pasos'):
+            continue
+        salida[clave] = nativo(valor)
+    return salida
+
+
+def nativo(valor):
+    """Convertir escalares y arreglos de numpy a tipos serializables"""
+    if isinstance(valor, dict):
+        return {str(clave): nativo(v) for clave, v in valor.items()}
+    if isinstance(valor, (list, tuple)):
+        return [nativo(v) for v in valor]
+    if hasattr(valor, 'tolist'):
+        return valor.tolist()
+    if isinstance(valor, float) and not math.isfinite(valor):
+        return None
+    return valor
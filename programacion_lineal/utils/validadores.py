@@ -1,28 +1,22 @@
-from sympy import sympify
+from .parser_lineal import analizar_objetivo, analizar_restriccion, orden_natural, texto_expresion
 
 def leer_funcion_objetivo():
     """Leer y procesar la función objetivo"""
     entrada = input("Introduce la función objetivo: ").strip()
 
-    if entrada.lower().startswith("max"):
-        tipo = "max"
-        expr_str = entrada[3:].strip()
-    elif entrada.lower().startswith("min"):
-        tipo = "min"
-        expr_str = entrada[3:].strip()
-    else:
-        expr_str = entrada
-        tipo = input("¿Maximización o Minimización? (max/min): ").strip().lower()
-
     try:
-        expr = sympify(expr_str)
-        variables = sorted(expr.free_symbols, key=lambda x: x.name)
-        coeficientes = [float(expr.coeff(var)) for var in variables]
-        return tipo, expr, variables, coeficientes
-    except Exception as e:
+        tipo, coeficientes, _ = analizar_objetivo(entrada)
+    except ValueError as e:
         print("Error al analizar la función objetivo:", e)
         return None, None, None, None
 
+    if tipo is None:
+        tipo = input("¿Maximización o Minimización? (max/min): ").strip().lower()
+
+    variables = sorted(coeficientes, key=orden_natural)
+    expr = texto_expresion(coeficientes, variables)
+    return tipo, expr, variables, [coeficientes[var] for var in variables]
+
 def leer_restricciones(variables):
     """Leer y procesar las restricciones"""
     num_restricciones = int(input("¿Cuántas restricciones?: "))
@@ -34,36 +28,27 @@ def leer_restricciones(variables):
     print("  • Para ≤: usar '<='  (ej: 2*x1 + 3*x2 <= 10)")
     print("  • Para ≥: usar '>='  (ej: x1 + x2 >= 5)")
     print("  • Para =: usar '='   (ej: x1 + 2*x2 = 8)")
+    print("  • Rango:  dos relaciones (ej: 2 <= x1 + x2 <= 8)")
     print()
 
     for i in range(num_restricciones):
         restr = input(f"Restricción {i + 1}: ").strip()
         
-        # Procesar restricción
-        if "<=" in restr:
-            izq, der = restr.split("<=")
-            relacion = "<="
-        elif ">=" in restr:
-            izq, der = restr.split(">=")
-            relacion = ">="
-        elif "=" in restr and "<=" not in restr and ">=" not in restr:
-            izq, der = restr.split("=")
-            relacion = "="
-        else:
-            print("❌ Formato inválido. Use '<=', '>=' o '='")
+        try:
+            analizadas = analizar_restriccion(restr)
+        except ValueError as e:
+            print(f"❌ Error en restricción {i+1}:", e)
             return None, None, None
 
-        try:
-            izquierda = sympify(izq.strip())
-            derecha = float(sympify(der.strip()))
+        for coeficientes, relacion, derecha in analizadas:
+            desconocidas = [var for var in coeficientes if var not in variables]
+            if desconocidas:
+                print(f"❌ Error en restricción {i+1}: variables que no están en la función objetivo: {', '.join(desconocidas)}")
+                return None, None, None
             
-            coefs = [float(izquierda.coeff(var)) for var in variables]
-            restricciones.append(coefs)
+            restricciones.append([coeficientes.get(var, 0.0) for var in variables])
             resultados.append(derecha)
             relaciones.append(relacion)
-        except Exception as e:
-            print(f"❌ Error en restricción {i+1}:", e)
-            return None, None, None
 
     return restricciones, resultados, relaciones
 